@@ -14,6 +14,7 @@ from tqdm import tqdm
 from pycodemetrics.cli.display_util import DisplayFormat, display, head_for_display
 from pycodemetrics.cli.exporter import export
 from pycodemetrics.config.config_manager import ConfigManager
+from pycodemetrics.gitclient.gitcli import get_all_file_gitlogs
 from pycodemetrics.services.analyze_committer import (
     AnalizeCommitterSettings,
     FileChangeCountMetrics,
@@ -140,6 +141,7 @@ def _analyze_committer_metrics(
     target_file_paths: list[Path],
     git_repo_path: Path,
     settings: AnalizeCommitterSettings,
+    gitlogs_by_file: dict[Path, list[str]],
 ) -> list[FileChangeCountMetrics]:
     results: list[FileChangeCountMetrics] = []
 
@@ -147,7 +149,9 @@ def _analyze_committer_metrics(
 
     for target in tqdm(target_file_paths_):
         try:
-            result = aggregate_changecount_by_committer(target, git_repo_path, settings)
+            result = aggregate_changecount_by_committer(
+                target, git_repo_path, settings, gitlogs_by_file.get(target)
+            )
             results.append(result)
         except Exception as e:
             logger.error(f"Failed to analyze {target}: {e}")
@@ -159,6 +163,7 @@ def _analyze_hotspot_metrics_for_multiprocessing(
     target_file_paths: list[Path],
     git_repo_path: Path,
     settings: AnalizeCommitterSettings,
+    gitlogs_by_file: dict[Path, list[str]],
     workers: int = 16,
 ) -> list[FileChangeCountMetrics]:
     target_file_paths_ = _filter_target_by_code_type(target_file_paths, settings)
@@ -168,7 +173,11 @@ def _analyze_hotspot_metrics_for_multiprocessing(
         with ProcessPoolExecutor(max_workers=workers) as executor:
             futures = {
                 executor.submit(
-                    aggregate_changecount_by_committer, target, git_repo_path, settings
+                    aggregate_changecount_by_committer,
+                    target,
+                    git_repo_path,
+                    settings,
+                    gitlogs_by_file.get(target),
                 )
                 for target in target_file_paths_
             }
@@ -196,7 +205,7 @@ def _transform_for_display(results: list[FileChangeCountMetrics]) -> pd.DataFram
     """
     results_flat: list[dict[str, Any]] = []
     for result in results:
-        results_flat = results_flat + result.to_flatten_list()
+        results_flat.extend(result.to_flatten_list())
     flat_df = pd.DataFrame(results_flat, columns=list(results_flat[0].keys()))
 
     # aggreage by committer
@@ -297,13 +306,16 @@ def run_analyze_committer_metrics(
     if workers is None:
         raise ValueError("Invalid workers: None")
 
+    # ファイルごとにgit logを実行せず、リポジトリ全体のログを一括で取得する
+    gitlogs_by_file = get_all_file_gitlogs(input_param.path)
+
     if workers <= 1:
         results = _analyze_committer_metrics(
-            target_file_paths, input_param.path, settings
+            target_file_paths, input_param.path, settings, gitlogs_by_file
         )
     else:
         results = _analyze_hotspot_metrics_for_multiprocessing(
-            target_file_paths, input_param.path, settings
+            target_file_paths, input_param.path, settings, gitlogs_by_file
         )
 
     if len(results) == 0:
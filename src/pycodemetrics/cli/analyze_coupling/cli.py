@@ -108,6 +108,18 @@ from pycodemetrics.cli.display_util import DisplayFormat
     is_flag=True,
     help="プロジェクト全体のサマリーも表示",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=None,
+    help="変更のないファイルの依存関係をキャッシュするディレクトリ（指定しない場合はキャッシュしない）",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="並列処理のワーカー数（指定しない場合はCPU数）",
+)
 def coupling(
     project_path: Path,
     format_: str,
@@ -122,6 +134,8 @@ def coupling(
     coupling_threshold: int,
     exclude: tuple[str, ...],
     summary: bool,
+    cache_dir: Path | None,
+    workers: int | None,
 ) -> None:
     """プロジェクトのモジュール結合度を分析します。
 
@@ -142,6 +156,8 @@ def coupling(
     input_param = InputParameter(
         project_path=project_path,
         exclude_patterns=list(exclude) if exclude else None,
+        cache_dir=cache_dir,
+        workers=workers,
     )
 
     display_param = DisplayParameter(
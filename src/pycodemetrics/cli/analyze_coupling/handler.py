@@ -67,10 +67,14 @@ class InputParameter(BaseModel, frozen=True, extra="forbid"):
     Attributes:
         project_path (Path): 分析対象のプロジェクトルートディレクトリ
         exclude_patterns (Optional[List[str]]): 除外するパターンのリスト
+        cache_dir (Optional[Path]): モジュールごとの依存関係のキャッシュディレクトリ。Noneの場合はキャッシュしない
+        workers (Optional[int]): 並列処理のワーカー数。Noneの場合はCPU数
     """
 
     project_path: Path
     exclude_patterns: Optional[List[str]] = None
+    cache_dir: Optional[Path] = None
+    workers: Optional[int] = None
 
     @field_validator("project_path")
     def validate_project_path(cls, v: Path) -> Path:
@@ -297,7 +301,10 @@ def run_analyze_coupling(
 
     try:
         project_metrics = analyze_project_coupling(
-            input_param.project_path, input_param.exclude_patterns
+            input_param.project_path,
+            input_param.exclude_patterns,
+            input_param.cache_dir,
+            input_param.workers,
         )
     except Exception as e:
         logger.error(f"Failed to analyze project coupling: {e}")
@@ -10,6 +10,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from pycodemetrics.config.config_manager import ConfigManager
 from pycodemetrics.services.analyze_health import (
     HealthAnalysisSettings,
     analyze_project_health,
@@ -32,9 +33,15 @@ class DisplayFormat(str, Enum):
 
 
 class InputTargetParameter(BaseModel, frozen=True, extra="forbid"):
-    """入力対象パラメータ。"""
+    """入力対象パラメータ。
+
+    Attributes:
+        path (Path): 分析対象のディレクトリのパス
+        config_file_path (Path): 設定ファイルのパス
+    """
 
     path: Path
+    config_file_path: Path = Path("./pyproject.toml")
 
 
 class DisplayParameter(BaseModel, frozen=True, extra="forbid"):
@@ -74,9 +81,14 @@ def run_analyze_health(
     logger.info(f"Starting health analysis for: {input_param.path}")
 
     # 分析設定の準備
+    config_file_path = input_param.config_file_path
     settings = HealthAnalysisSettings(
         include_trends=display_param.include_trends,
         workers=runtime_param.workers,
+        testcode_type_patterns=ConfigManager.get_testcode_type_patterns(
+            config_file_path
+        ),
+        exclude_patterns=ConfigManager.get_exclude_patterns(config_file_path),
     )
 
     # 健康度分析の実行
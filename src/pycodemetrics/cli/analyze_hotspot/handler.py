@@ -13,6 +13,7 @@ from tqdm import tqdm
 from pycodemetrics.cli.display_util import DisplayFormat, display, head_for_display
 from pycodemetrics.cli.exporter import export
 from pycodemetrics.config.config_manager import ConfigManager
+from pycodemetrics.gitclient.gitcli import get_all_file_gitlogs
 from pycodemetrics.services.analyze_hotspot import (
     AnalizeHotspotSettings,
     FileHotspotMetrics,
@@ -143,6 +144,7 @@ def _analyze_hotspot_metrics(
     target_file_paths: list[Path],
     git_repo_path: Path,
     settings: AnalizeHotspotSettings,
+    gitlogs_by_file: dict[Path, list[str]],
 ) -> list[FileHotspotMetrics]:
     results: list[FileHotspotMetrics] = []
 
@@ -150,7 +152,9 @@ def _analyze_hotspot_metrics(
 
     for target in tqdm(target_file_paths_):
         try:
-            result = analyze_hotspot_file(target, git_repo_path, settings)
+            result = analyze_hotspot_file(
+                target, git_repo_path, settings, gitlogs_by_file.get(target)
+            )
             results.append(result)
         except Exception as e:
             logger.error(f"Failed to analyze {target}: {e}")
@@ -162,6 +166,7 @@ def _analyze_hotspot_metrics_for_multiprocessing(
     target_file_paths: list[Path],
     git_repo_path: Path,
     settings: AnalizeHotspotSettings,
+    gitlogs_by_file: dict[Path, list[str]],
     workers: int = 16,
 ) -> list[FileHotspotMetrics]:
     target_file_paths_ = _filter_target_by_code_type(target_file_paths, settings)
@@ -170,7 +175,13 @@ def _analyze_hotspot_metrics_for_multiprocessing(
     with tqdm(total=len(target_file_paths_)) as pbar:
         with ProcessPoolExecutor(max_workers=workers) as executor:
             futures = {
-                executor.submit(analyze_hotspot_file, target, git_repo_path, settings)
+                executor.submit(
+                    analyze_hotspot_file,
+                    target,
+                    git_repo_path,
+                    settings,
+                    gitlogs_by_file.get(target),
+                )
                 for target in target_file_paths_
             }
 
@@ -297,13 +308,16 @@ def run_analyze_hotspot_metrics(
     if workers is None:
         raise ValueError("Invalid workers: None")
 
+    # ファイルごとにgit logを実行せず、リポジトリ全体のログを一括で取得する
+    gitlogs_by_file = get_all_file_gitlogs(input_param.path)
+
     if workers <= 1:
         results = _analyze_hotspot_metrics(
-            target_file_paths, input_param.path, settings
+            target_file_paths, input_param.path, settings, gitlogs_by_file
         )
     else:
         results = _analyze_hotspot_metrics_for_multiprocessing(
-            target_file_paths, input_param.path, settings
+            target_file_paths, input_param.path, settings, gitlogs_by_file
         )
 
     if len(results) == 0:
@@ -93,6 +93,12 @@ from pycodemetrics.services.analyze_python_metrics import FilterCodeType
     default=None,
     help="Number of workers for multiprocessing. If not specified, use the number of CPUs.",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, dir_okay=True),
+    default=None,
+    help="Directory to cache metrics of unchanged files. If not specified, do not cache.",
+)
 def analyze(
     input_path: str,
     with_git_repo: bool,
@@ -103,6 +109,7 @@ def analyze(
     limit: int,
     code_type: str,
     workers: int | None,
+    cache_dir: str | None,
 ) -> None:
     """Analyze python metrics in the specified path
 
@@ -133,7 +140,9 @@ def analyze(
         )
 
         runtime_param = RuntimeParameter(
-            workers=workers, filter_code_type=FilterCodeType(code_type)
+            workers=workers,
+            filter_code_type=FilterCodeType(code_type),
+            cache_dir=Path(cache_dir) if cache_dir else None,
         )
 
         # メイン処理の実行
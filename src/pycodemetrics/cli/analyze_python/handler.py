@@ -24,7 +24,7 @@
 
 import logging
 import os
-from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from concurrent.futures.process import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
@@ -40,7 +40,10 @@ from pycodemetrics.services.analyze_python_metrics import (
     AnalyzePythonSettings,
     FilterCodeType,
     PythonFileMetrics,
-    analyze_python_file,
+    analyze_python_code,
+    expand_python_file_metrics,
+    iter_python_files,
+    python_code_digest,
 )
 from pycodemetrics.util.file_util import (
     get_code_type,
@@ -81,10 +84,12 @@ class RuntimeParameter(BaseModel, frozen=True, extra="forbid"):
     Attributes:
         workers (int | None): マルチプロセッシングのワーカー数。Noneの場合はCPU数を使用
         filter_code_type (FilterCodeType): フィルタリングするコードタイプ
+        cache_dir (Path | None): メトリクスのキャッシュディレクトリ。Noneの場合はキャッシュしない
     """
 
     workers: int | None = Field(default_factory=lambda: os.cpu_count())
     filter_code_type: FilterCodeType = FilterCodeType.PRODUCT
+    cache_dir: Path | None = None
 
 
 class DisplayParameter(BaseModel, frozen=True, extra="forbid"):
@@ -190,24 +195,16 @@ def _analyze_python_metrics(
     Returns:
         list[PythonFileMetrics]: 分析結果となるPythonFileMetricsのリスト
     """
-    results = []
-
     target_file_paths_ = _filter_target_by_code_type(target_file_paths, settings)
 
-    for filepath in tqdm(target_file_paths_):
-        if not filepath.suffix == ".py":
+    python_file_paths = []
+    for filepath in target_file_paths_:
+        if not filepath.name.endswith(".py"):
             logger.warning(f"Skipping {filepath} as it is not a python file")
             continue
+        python_file_paths.append(filepath)
 
-        try:
-            result = analyze_python_file(filepath, settings)
-            results.append(result)
-        except Exception as e:
-            logger.warning(
-                f"Skipping {filepath} due to error: {type(e).__name__}: {str(e)}"
-            )
-            continue
-    return results
+    return _analyze_python_files_by_content(python_file_paths, settings)
 
 
 def _transform_for_display(results: list[PythonFileMetrics]) -> pd.DataFrame:
@@ -291,27 +288,151 @@ def _analyze_python_metrics_for_multiprocessing(
     Returns:
         list[PythonFileMetrics]: 分析結果となるPythonFileMetricsのリスト
     """
-    results: list[PythonFileMetrics] = []
+    target_file_paths_ = [
+        target
+        for target in _filter_target_by_code_type(target_file_paths, settings)
+        if target.name.endswith(".py")
+    ]
 
-    target_file_paths_ = _filter_target_by_code_type(target_file_paths, settings)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _analyze_python_files_by_content(
+            target_file_paths_, settings, executor, max_pending=workers * 2
+        )
+
+
+class _ContentGroupedResults:
+    """内容が同一のファイルをまとめ、代表ファイルの解析結果を共有します。
+
+    内容はダイジェストで識別するため、ファイル内容そのものは保持しません。
+    """
 
-    with tqdm(total=len(target_file_paths_)) as pbar:
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(analyze_python_file, target, settings)
-                for target in target_file_paths
-                if target.suffix == ".py"
-            }
-
-            for future in as_completed(futures):
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    logger.error(f"Failed to analyze {future.exception}: {e}")
-                    continue
+    def __init__(self, settings: AnalyzePythonSettings, pbar: tqdm) -> None:
+        self.results: list[PythonFileMetrics] = []
+        self._settings = settings
+        self._pbar = pbar
+        # 解析中の内容のダイジェストと、その内容を持つファイルパスのリスト
+        self._waiting: dict[bytes, list[Path]] = {}
+        # 解析済みの内容のダイジェストと結果。解析に失敗した場合はNone
+        self._analyzed: dict[bytes, PythonFileMetrics | None] = {}
+
+    def add(self, digest: bytes, filepath: Path) -> bool:
+        """ファイルを追加します。
+
+        Returns:
+            bool: 新しい内容で、呼び出し側が解析を開始する必要がある場合はTrue
+        """
+        if digest in self._analyzed:
+            result = self._analyzed[digest]
+            if result is not None:
+                self.results.extend(
+                    expand_python_file_metrics(result, [filepath], self._settings)
+                )
+            self._pbar.update(1)
+            return False
+        if digest in self._waiting:
+            self._waiting[digest].append(filepath)
+            return False
+        self._waiting[digest] = [filepath]
+        return True
+
+    def succeed(self, digest: bytes, result: PythonFileMetrics) -> None:
+        """代表ファイルの解析結果を、同一内容のファイルに割り当てます。"""
+        filepaths = self._waiting.pop(digest)
+        self._analyzed[digest] = result
+        self.results.append(result)
+        self.results.extend(
+            expand_python_file_metrics(result, filepaths[1:], self._settings)
+        )
+        self._pbar.update(len(filepaths))
+
+    def fail(self, digest: bytes, error: Exception) -> None:
+        """代表ファイルの解析に失敗した内容を持つファイルを除外します。"""
+        filepaths = self._waiting.pop(digest)
+        self._analyzed[digest] = None
+        logger.error(f"Failed to analyze {filepaths[0]}: {error}")
+        self._pbar.update(len(filepaths))
+
+
+def _collect_analyzed(
+    done: set[Future[PythonFileMetrics]],
+    futures: dict[Future[PythonFileMetrics], bytes],
+    grouped: _ContentGroupedResults,
+) -> None:
+    """完了した解析の結果を取り出します。"""
+    for future in done:
+        digest = futures.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            grouped.fail(digest, e)
+            continue
+        grouped.succeed(digest, result)
+
+
+def _analyze_now(
+    filepath: Path,
+    code: str,
+    digest: bytes,
+    settings: AnalyzePythonSettings,
+    grouped: _ContentGroupedResults,
+) -> None:
+    """呼び出し元のプロセスで解析し、結果を割り当てます。"""
+    try:
+        result = analyze_python_code(filepath, code, settings)
+    except Exception as e:
+        grouped.fail(digest, e)
+        return
+    grouped.succeed(digest, result)
+
+
+def _analyze_python_files_by_content(
+    python_file_paths: list[Path],
+    settings: AnalyzePythonSettings,
+    executor: Executor | None = None,
+    max_pending: int = 1,
+) -> list[PythonFileMetrics]:
+    """内容が同一のファイルは代表ファイルのみ解析し、結果を共有してメトリクスを分析します。
+
+    ファイルの読み込み(I/O)はiter_python_filesでスレッドで先読みし、読み込めたファイルから
+    順に解析(CPU)を行って、読み込みと解析を重ねます。
+    executorを指定した場合は解析をexecutorへ投入し、未完了の解析がmax_pending件に達したら
+    完了を待ってから次のファイルを投入します。いずれの場合も、同時にメモリに保持する
+    ソースコードの数は一定に抑えられます。
+
+    Args:
+        python_file_paths (list[Path]): 分析対象のPythonファイルパスのリスト
+        settings (AnalyzePythonSettings): 分析設定
+        executor (Executor | None): 解析を実行するExecutor。Noneの場合は呼び出し元のプロセスで解析する
+        max_pending (int): executorへ同時に投入する解析の上限
+
+    Returns:
+        list[PythonFileMetrics]: 分析結果となるPythonFileMetricsのリスト
+    """
+    futures: dict[Future[PythonFileMetrics], bytes] = {}
+
+    with tqdm(total=len(python_file_paths)) as pbar:
+        grouped = _ContentGroupedResults(settings, pbar)
+        for filepath, code in iter_python_files(python_file_paths):
+            if code is None:
                 pbar.update(1)
+                continue
+
+            digest = python_code_digest(code)
+            if not grouped.add(digest, filepath):
+                continue
+            if executor is None:
+                _analyze_now(filepath, code, digest, settings, grouped)
+                continue
+
+            future = executor.submit(analyze_python_code, filepath, code, settings)
+            futures[future] = digest
+            if len(futures) >= max_pending:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                _collect_analyzed(done, futures, grouped)
+
+        _collect_analyzed(wait(futures).done, futures, grouped)
 
-    return results
+    return grouped.results
 
 
 def run_analyze_python_metrics(
@@ -359,6 +480,7 @@ def run_analyze_python_metrics(
         ),
         user_groups=ConfigManager.get_user_groups(config_file_path),
         filter_code_type=runtime_param.filter_code_type,
+        cache_dir=runtime_param.cache_dir,
     )
 
     # メイン処理の実行
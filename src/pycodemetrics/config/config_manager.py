@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -36,6 +37,29 @@ EXCLUDE_PATTERN_DEFAULT: list[str] = [
 ]
 
 
+@functools.lru_cache(maxsize=32)
+def _load_toml(
+    config_path: Path, mtime_ns: int, size: int, inode: int
+) -> dict[str, Any]:
+    """
+    Parse the TOML file.
+
+    The modification time, size and inode of the file are part of the cache key,
+    so that the file is parsed again after it has been changed or replaced,
+    even on filesystems with a coarse modification time.
+
+    Args:
+        config_path (Path): The path to the TOML file.
+        mtime_ns (int): The modification time of the file in nanoseconds.
+        size (int): The size of the file in bytes.
+        inode (int): The inode number of the file.
+
+    Returns:
+        dict[str, Any]: The parsed TOML file.
+    """
+    return toml.load(config_path)
+
+
 class ConfigManager:
     """
     Configuration manager for pycodemetrics.
@@ -112,11 +136,12 @@ class ConfigManager:
             dict[str, Any]: The pyproject.toml file.
         """
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-        pyproject_toml = toml.load(config_path)
-        return pyproject_toml
+        return _load_toml(config_path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
     @classmethod
     def get_testcode_type_patterns(cls, config_file_path: Path) -> list[str]:
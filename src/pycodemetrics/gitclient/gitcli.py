@@ -19,7 +19,11 @@ def _check_git_repo(git_repo_path: Path) -> None:
 
 
 def _run_command(
-    cmd: str, current_dir: Path, encording: str = "utf-8", timeout_seconds: int = 0
+    cmd: str,
+    current_dir: Path,
+    encording: str = "utf-8",
+    timeout_seconds: int = 0,
+    separator: str = "\n",
 ) -> list[str]:
     """
     Run the command.
@@ -29,6 +33,7 @@ def _run_command(
         current_dir (Path): The current directory.
         encording (str): The encoding.
         timeout_seconds (int): The timeout in seconds.
+        separator (str): The separator to split the output.
 
     Returns:
         list[str]: The output of the command.
@@ -54,7 +59,7 @@ def _run_command(
             raise ValueError(f"Error running command: {cmd}, cause: {encoded_stderr}: ")
 
         encoded_stdout = out.decode(encording)
-        return encoded_stdout.split("\n")
+        return encoded_stdout.split(separator)
     except subprocess.TimeoutExpired:
         p.kill()
         raise TimeoutError(f"Timeout running command: {cmd}")
@@ -82,6 +87,33 @@ def list_git_files(
     return [Path(f) for f in _run_command(cmd, git_repo_path, encoding)]
 
 
+def list_git_file_names(
+    git_repo_path: Path | None = None, encoding: str = "utf-8"
+) -> list[str]:
+    """
+    List all the file names in the current repository as POSIX style strings.
+    result by `git ls-files -z`
+
+    Unlike `list_git_files`, paths are not quoted by git and no Path is created,
+    so callers can filter the names before building Path objects.
+
+    Args:
+        git_repo_path (Path): The path to the git repository.
+        encoding (str): The encoding.
+
+    Returns:
+        list[str]: The list of file names relative to the repository root.
+    """
+    git_repo_path = git_repo_path or Path.cwd()
+
+    _check_git_repo(git_repo_path)
+
+    cmd = "git ls-files -z"
+    return [
+        f for f in _run_command(cmd, git_repo_path, encoding, separator="\x00") if f
+    ]
+
+
 def get_file_gitlogs(
     git_file_path: Path, git_repo_path: Path | None = None, encoding: str = "utf-8"
 ) -> list[str]:
@@ -124,3 +156,64 @@ def get_gitlogs(
 
     cmd = "git log --pretty=format:'%h,%aN,%ad,%s' --date=iso"
     return _run_command(cmd, git_repo_path, encoding)
+
+
+_COMMIT_MARKER = "\x00"
+
+
+def get_all_file_gitlogs(
+    git_repo_path: Path | None = None, encoding: str = "utf-8"
+) -> dict[Path, list[str]]:
+    """
+    Get the git logs for all files in the repository with a single `git log` call.
+
+    `git log --name-only` prints each commit header followed by the files it touched,
+    so the logs can be bucketed by file instead of running `git log -- <file>` per file.
+    Each log line has the same format as `get_file_gitlogs`.
+    `core.quotePath` is disabled so that non-ASCII paths are keyed as `git ls-files -z`
+    lists them, and merges are listed with `-c` so that a merge which differs from
+    all of its parents is counted as `git log -- <file>` counts it.
+
+    `git log -- <file>` simplifies history per file and skips side branches whose
+    changes a merge did not keep (e.g. `git merge -s ours`), which a single log over
+    all commits cannot reproduce. Files touched by any commit outside the first-parent
+    history are therefore left out of the result, and callers should fall back to
+    `get_file_gitlogs` for files that do not appear in it.
+
+    Args:
+        git_repo_path (Path): The path to the git repository.
+        encoding (str): The encoding.
+
+    Returns:
+        dict[Path, list[str]]: The git logs keyed by file path.
+    """
+    git_repo_path = git_repo_path or Path.cwd()
+
+    _check_git_repo(git_repo_path)
+
+    first_parent_commits = set(
+        _run_command("git rev-list --first-parent HEAD", git_repo_path, encoding)
+    )
+
+    cmd = (
+        "git -c core.quotePath=false log --name-only --no-renames -c"
+        " --pretty=format:'%x00%H %h,%aN,%ad,%s' --date=iso"
+    )
+
+    gitlogs_by_file: dict[Path, list[str]] = {}
+    side_branch_files: set[Path] = set()
+    current_log: str | None = None
+    on_first_parent = False
+    for line in _run_command(cmd, git_repo_path, encoding):
+        if line.startswith(_COMMIT_MARKER):
+            commit_hash, current_log = line[len(_COMMIT_MARKER) :].split(" ", 1)
+            on_first_parent = commit_hash in first_parent_commits
+        elif line and current_log is not None:
+            filepath = Path(line)
+            gitlogs_by_file.setdefault(filepath, []).append(current_log)
+            if not on_first_parent:
+                side_branch_files.add(filepath)
+
+    for filepath in side_branch_files:
+        del gitlogs_by_file[filepath]
+    return gitlogs_by_file
@@ -24,11 +24,37 @@
 """
 
 import ast
+import functools
+import itertools
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel, computed_field
 
+logger = logging.getLogger(__name__)
+
+# インポート情報キャッシュの形式を変更した場合はインクリメントする
+_IMPORTS_CACHE_VERSION = 2
+
+# これより少ないファイル数ではプロセスの起動コストが上回るため逐次に解析する
+_PARALLEL_MIN_FILES = 64
+
+# モジュールのカテゴリ。(不安定度 < 0.5) << 1 | (抽象度 < 0.5) で参照する
+_CATEGORY_BY_QUADRANT = (
+    "unstable",  # 0b00: 不安定・抽象（理想的なインターフェース）
+    "useless",  # 0b01: 不安定・具象（価値の低い）
+    "painful",  # 0b10: 安定・抽象（変更困難）
+    "stable",  # 0b11: 安定・具象（理想的なユーティリティ）
+)
+
 
 class ModuleDependency(BaseModel, frozen=True, extra="forbid"):
     """モジュールの依存関係を表すクラス。
@@ -48,6 +74,20 @@ class ModuleDependency(BaseModel, frozen=True, extra="forbid"):
     lines_of_code: int = 0
 
 
+class ModuleImports(BaseModel, frozen=True, extra="forbid"):
+    """モジュールのインポート文から抽出した情報を表すクラス。
+
+    ファイル内容だけで決まるため、ファイル内容をキーにキャッシュできる。
+
+    Attributes:
+        imported_modules (List[str]): インポートされたモジュール名（出現順）
+        categorized_names (List[str]): 内部/外部の分類対象となる名前（出現順）
+    """
+
+    imported_modules: List[str]
+    categorized_names: List[str]
+
+
 class CouplingMetrics(BaseModel, frozen=True, extra="forbid"):
     """モジュール結合度メトリクスを表すクラス。
 
@@ -86,14 +126,9 @@ class CouplingMetrics(BaseModel, frozen=True, extra="forbid"):
         Returns:
             str: stable, unstable, painful, useless のいずれか
         """
-        if self.instability < 0.5 and self.abstractness < 0.5:
-            return "stable"  # 安定・具象（理想的なユーティリティ）
-        elif self.instability >= 0.5 and self.abstractness >= 0.5:
-            return "unstable"  # 不安定・抽象（理想的なインターフェース）
-        elif self.instability < 0.5 and self.abstractness >= 0.5:
-            return "painful"  # 安定・抽象（変更困難）
-        else:
-            return "useless"  # 不安定・具象（価値の低い）
+        return _CATEGORY_BY_QUADRANT[
+            (self.instability < 0.5) << 1 | (self.abstractness < 0.5)
+        ]
 
     def to_dict(self) -> dict:
         return self.model_dump()
@@ -188,9 +223,41 @@ class EnhancedImportAnalyzer(ast.NodeVisitor):
         self.project_root = project_root
         self.current_module_path = current_module_path
         self.imports: List[str] = []
+        self.categorized_names: List[str] = []
         self.internal_imports: List[str] = []
         self.external_imports: List[str] = []
 
+    @classmethod
+    def from_imports(
+        cls, project_root: Path, current_module_path: Path, imports: ModuleImports
+    ) -> "EnhancedImportAnalyzer":
+        """抽出済みのインポート情報からASTを解析せずに分析結果を作成
+
+        Args:
+            project_root (Path): プロジェクトのルートディレクトリ
+            current_module_path (Path): 分析対象のモジュールのパス
+            imports (ModuleImports): 抽出済みのインポート情報
+
+        Returns:
+            EnhancedImportAnalyzer: インポートを分類済みの分析インスタンス
+        """
+        analyzer = cls(project_root, current_module_path)
+        # キャッシュから読み込んだ文字列はファイルごとに別のオブジェクトになるため、
+        # ASTから抽出した場合と同様にインターンしてモジュール間で共有する
+        analyzer.imports = [sys.intern(name) for name in imports.imported_modules]
+        for name in imports.categorized_names:
+            analyzer._categorize_import(sys.intern(name))
+        return analyzer
+
+    def visit_Module(self, node: ast.Module) -> None:
+        """モジュールを処理
+
+        インポート文は文の中にしか現れないため、式のノードは辿らずに
+        文のブロックだけを出現順に探索する。
+        """
+        for import_node in _iter_import_nodes(node.body):
+            self.visit(import_node)
+
     def visit_Import(self, node: ast.Import) -> None:
         """Import文を処理"""
         for alias in node.names:
@@ -204,12 +271,15 @@ class EnhancedImportAnalyzer(ast.NodeVisitor):
             self._categorize_import(node.module)
 
             for alias in node.names:
-                full_name = f"{node.module}.{alias.name}"
+                # ASTの識別子はインターン済みだが、連結した名前は新しい文字列になる
+                full_name = sys.intern(f"{node.module}.{alias.name}")
                 self.imports.append(full_name)
                 self._categorize_import(node.module)  # モジュール部分のみで判定
 
     def _categorize_import(self, import_name: str) -> None:
         """インポートを内部/外部に分類"""
+        self.categorized_names.append(import_name)
+
         # 相対インポートは内部とする
         if import_name.startswith("."):
             self.internal_imports.append(import_name)
@@ -222,21 +292,19 @@ class EnhancedImportAnalyzer(ast.NodeVisitor):
             return
 
         # プロジェクトルートからの相対パスで内部モジュールかチェック
-        try:
-            # プロジェクト内のモジュールパスに変換を試行
-            potential_path = self.project_root / import_name.replace(".", "/")
-            if (
-                potential_path.with_suffix(".py").exists()
-                or (potential_path / "__init__.py").exists()
-            ):
-                self.internal_imports.append(import_name)
-                return
-        except Exception:
-            pass
+        if _is_project_module(str(self.project_root), import_name):
+            self.internal_imports.append(import_name)
+            return
 
         # デフォルトは外部
         self.external_imports.append(import_name)
 
+    def get_imports(self) -> ModuleImports:
+        """プロジェクト構成に依存しないインポート情報を取得"""
+        return ModuleImports(
+            imported_modules=self.imports, categorized_names=self.categorized_names
+        )
+
     def get_dependency_info(self, lines_of_code: int = 0) -> ModuleDependency:
         """依存関係情報を取得"""
         return ModuleDependency(
@@ -255,24 +323,34 @@ class CouplingAnalyzer:
     システム全体のアーキテクチャ品質を評価するためのメトリクスを提供します。
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        cache_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+    ):
         self.project_root = project_root
+        self.cache_dir = cache_dir
+        self.workers = workers
         self.dependencies: Dict[str, ModuleDependency] = {}
         self.coupling_metrics: Dict[str, CouplingMetrics] = {}
 
     def analyze_project(
-        self, exclude_patterns: Optional[List[str]] = None
+        self, exclude_patterns: Optional[Sequence[str]] = None
     ) -> ProjectCouplingMetrics:
         """プロジェクト全体の結合度を分析
 
         Args:
-            exclude_patterns (Optional[List[str]]): 除外するパターンのリスト
+            exclude_patterns (Optional[Sequence[str]]): 除外するパターンのリスト
 
         Returns:
             ProjectCouplingMetrics: プロジェクト全体の結合度メトリクス
         """
         if exclude_patterns is None:
-            exclude_patterns = ["__pycache__", ".git", ".pytest_cache", "node_modules"]
+            exclude_patterns = ("__pycache__", ".git", ".pytest_cache", "node_modules")
+
+        # 前回の分析以降にファイルが追加・削除されていても正しく判定できるようにする
+        _is_project_module.cache_clear()
 
         # 1. 全Pythonファイルの依存関係を収集
         self._collect_all_dependencies(exclude_patterns)
@@ -283,99 +361,238 @@ class CouplingAnalyzer:
         # 3. プロジェクト全体のメトリクスを計算
         return self._calculate_project_metrics()
 
-    def _collect_all_dependencies(self, exclude_patterns: List[str]) -> None:
+    def _collect_all_dependencies(self, exclude_patterns: Sequence[str]) -> None:
         """プロジェクト内の全Pythonファイルの依存関係を収集"""
         python_files = self._find_python_files(exclude_patterns)
 
-        for python_file in python_files:
-            try:
-                with open(python_file, "r", encoding="utf-8") as f:
-                    code = f.read()
-
-                # 行数をカウント
-                lines_of_code = len(
-                    [line for line in code.splitlines() if line.strip()]
+        # ファイルごとの解析は互いに独立しているため、ファイルが多い場合は並列に行う
+        workers = self.workers or os.cpu_count() or 1
+        dependencies: Iterable[Optional[ModuleDependency]]
+        if workers <= 1 or len(python_files) < _PARALLEL_MIN_FILES:
+            dependencies = map(self._analyze_file, python_files)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                dependencies = list(
+                    executor.map(
+                        _analyze_file_dependencies,
+                        python_files,
+                        itertools.repeat(self.project_root),
+                        itertools.repeat(self.cache_dir),
+                        chunksize=32,
+                    )
                 )
 
-                dependency = self._analyze_module_dependencies(
-                    code, python_file, lines_of_code
-                )
+        for dependency in dependencies:
+            if dependency is not None:
                 self.dependencies[dependency.module_path] = dependency
 
-            except (UnicodeDecodeError, IOError):
-                # ファイル読み込みエラーは無視
-                continue
+    def _analyze_file(self, python_file: Path) -> Optional[ModuleDependency]:
+        """Pythonファイルを読み込んで依存関係を分析。読み込めない場合はNoneを返す"""
+        try:
+            with open(python_file, "r", encoding="utf-8") as f:
+                code = f.read()
+        except (UnicodeDecodeError, IOError):
+            # ファイル読み込みエラーは無視
+            return None
+
+        # 行数をカウント
+        lines_of_code = len([line for line in code.splitlines() if line.strip()])
+
+        return self._analyze_module_dependencies_with_cache(
+            code, python_file, lines_of_code
+        )
 
-    def _find_python_files(self, exclude_patterns: List[str]) -> List[Path]:
+    def _find_python_files(self, exclude_patterns: Sequence[str]) -> List[Path]:
         """Pythonファイルを検索"""
-        python_files = []
+        exclude_regex = _compile_exclude_patterns(tuple(exclude_patterns))
+        return [
+            Path(path)
+            for path in _iter_python_files(str(self.project_root), exclude_regex)
+        ]
+
+    def _imports_cache_path(self, cache_dir: Path, code: str) -> Path:
+        """モジュールのインポート情報キャッシュの保存先を返す
+
+        インポート情報はファイル内容だけで決まるため、内容のハッシュをキーにする。
+        """
+        digest = blake2b(digest_size=16)
+        digest.update(f"{_IMPORTS_CACHE_VERSION}:".encode("utf-8"))
+        digest.update(code.encode("utf-8", "surrogatepass"))
+        return cache_dir / "imports" / f"{digest.hexdigest()}.json"
+
+    def _analyze_module_dependencies_with_cache(
+        self, code: str, module_path: Path, lines_of_code: int
+    ) -> ModuleDependency:
+        """インポート情報のキャッシュがあればASTを解析せずに依存関係を分析
+
+        内部/外部の分類は現在のプロジェクト構成に対して毎回行うため、
+        他のファイルが追加・削除されてもキャッシュの結果は古くならない。
+        """
+        if self.cache_dir is None:
+            return self._analyze_module_dependencies(code, module_path, lines_of_code)
 
-        for path in self.project_root.rglob("*.py"):
-            # 除外パターンにマッチするパスをスキップ
-            if any(pattern in str(path) for pattern in exclude_patterns):
-                continue
-            python_files.append(path)
+        cache_path = self._imports_cache_path(self.cache_dir, code)
+        imports: Optional[ModuleImports] = None
+        try:
+            imports = ModuleImports.model_validate_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.debug(f"Ignoring broken imports cache {cache_path}: {e}")
 
-        return python_files
+        if imports is not None:
+            analyzer = EnhancedImportAnalyzer.from_imports(
+                self.project_root, module_path, imports
+            )
+            return analyzer.get_dependency_info(lines_of_code)
+
+        try:
+            analyzer = self._parse_imports(code, module_path)
+        except SyntaxError:
+            return self._empty_dependency(module_path, lines_of_code)
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(analyzer.get_imports().model_dump_json(), "utf-8")
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to write imports cache {cache_path}: {e}")
+        return analyzer.get_dependency_info(lines_of_code)
 
     def _analyze_module_dependencies(
         self, code: str, module_path: Path, lines_of_code: int
     ) -> ModuleDependency:
         """モジュールの依存関係を分析"""
         try:
-            tree = ast.parse(code)
-            analyzer = EnhancedImportAnalyzer(self.project_root, module_path)
-            analyzer.visit(tree)
-            return analyzer.get_dependency_info(lines_of_code)
+            analyzer = self._parse_imports(code, module_path)
         except SyntaxError:
             # 構文エラーの場合は空の依存関係を返す
-            return ModuleDependency(
-                module_path=str(module_path.relative_to(self.project_root)),
-                imported_modules=[],
-                internal_imports=[],
-                external_imports=[],
-                lines_of_code=lines_of_code,
-            )
+            return self._empty_dependency(module_path, lines_of_code)
+        return analyzer.get_dependency_info(lines_of_code)
 
-    def _calculate_coupling_metrics(self) -> None:
-        """各モジュールの結合度メトリクスを計算"""
-        for module_path, dependency in self.dependencies.items():
-            # Efferent Coupling (Ce) - このモジュールが依存するモジュール数
-            efferent_coupling = len(dependency.internal_imports)
+    def _parse_imports(self, code: str, module_path: Path) -> EnhancedImportAnalyzer:
+        """コードを解析してインポートを分類
 
-            # Afferent Coupling (Ca) - このモジュールに依存するモジュール数
-            afferent_coupling = self._calculate_afferent_coupling(module_path)
+        Raises:
+            SyntaxError: コードに構文エラーがある場合
+        """
+        tree = ast.parse(code)
+        analyzer = EnhancedImportAnalyzer(self.project_root, module_path)
+        analyzer.visit(tree)
+        return analyzer
 
-            # Instability (I) - 不安定度
-            instability = self._calculate_instability(
-                afferent_coupling, efferent_coupling
-            )
+    def _empty_dependency(
+        self, module_path: Path, lines_of_code: int
+    ) -> ModuleDependency:
+        """依存関係のないモジュールの情報を返す"""
+        return ModuleDependency(
+            module_path=str(module_path.relative_to(self.project_root)),
+            imported_modules=[],
+            internal_imports=[],
+            external_imports=[],
+            lines_of_code=lines_of_code,
+        )
+
+    def _calculate_coupling_metrics(self) -> None:
+        """各モジュールの結合度メトリクスを計算
+
+        モジュールを `self.dependencies` の順に整数IDで表し、Ce・Ca・Iを配列でまとめて計算する。
+        `CouplingMetrics` は最後に一度だけ生成する。
+        """
+        module_paths = list(self.dependencies)
 
+        # Efferent Coupling (Ce) - このモジュールが依存するモジュール数
+        efferent = np.fromiter(
+            (len(dep.internal_imports) for dep in self.dependencies.values()),
+            dtype=np.int64,
+            count=len(module_paths),
+        )
+        # Afferent Coupling (Ca) - このモジュールに依存するモジュール数
+        afferent = self._calculate_afferent_couplings()
+        # Instability (I) - 不安定度 I = Ce / (Ca + Ce)。結合がなければ0
+        instability = efferent / np.maximum(efferent + afferent, 1)
+
+        for module_path, ca, ce, i in zip(
+            module_paths,
+            afferent.tolist(),
+            efferent.tolist(),
+            instability.tolist(),
+        ):
             self.coupling_metrics[module_path] = CouplingMetrics(
                 module_path=module_path,
-                afferent_coupling=afferent_coupling,
-                efferent_coupling=efferent_coupling,
-                instability=instability,
-                lines_of_code=dependency.lines_of_code,
+                afferent_coupling=ca,
+                efferent_coupling=ce,
+                instability=i,
+                lines_of_code=self.dependencies[module_path].lines_of_code,
             )
 
-    def _calculate_afferent_coupling(self, target_module: str) -> int:
-        """指定モジュールの入力結合度を計算"""
-        count = 0
-        target_module_normalized = self._normalize_module_path(target_module)
+    def _calculate_afferent_couplings(self) -> npt.NDArray[np.int64]:
+        """全モジュールの入力結合度を計算
 
-        for module_path, dependency in self.dependencies.items():
-            if module_path == target_module:
-                continue
+        各モジュールについて、そのモジュールをインポートしている他のモジュールの数を数える。
+        `_is_module_match` の各条件をモジュール名をキーにした辞書の参照に置き換え、
+        モジュールの組ごとに比較せずに同じ結果を求める。
 
-            # このモジュールが対象モジュールをインポートしているかチェック
+        Returns:
+            npt.NDArray[np.int64]: `self.dependencies` の順に並んだ入力結合度
+        """
+        module_ids = {module_path: i for i, module_path in enumerate(self.dependencies)}
+
+        # 正規化したモジュール名 -> モジュールID（完全一致・サブモジュールとしてのマッチ用）
+        by_name: Dict[str, List[int]] = {}
+        # モジュール名の親パッケージ名 -> モジュールID（パッケージとしてのマッチ用）
+        by_parent: Dict[str, List[int]] = {}
+        # パス形式のモジュール名 -> モジュールID（末尾一致用）
+        by_suffix: Dict[str, List[int]] = {}
+        for module_path, module_id in module_ids.items():
+            target_module = self._normalize_module_path(module_path)
+            target_normalized = self._normalize_module_path(target_module)
+            by_name.setdefault(target_normalized, []).append(module_id)
+            for parent in _dotted_prefixes(target_normalized):
+                by_parent.setdefault(parent, []).append(module_id)
+            target_suffix = target_module.replace("/", ".").replace(".py", "")
+            by_suffix.setdefault(target_suffix, []).append(module_id)
+
+        def match_targets(imported: str) -> set[int]:
+            """インポート名にマッチするモジュールIDを求める"""
+            imported_module = self._normalize_module_path(imported)
+            imported_normalized = self._normalize_module_path(imported_module)
+
+            matched = set(by_name.get(imported_normalized, ()))
+            for parent in _dotted_prefixes(imported_normalized):
+                matched.update(by_name.get(parent, ()))
+            matched.update(by_parent.get(imported_normalized, ()))
+
+            # 末尾一致（プロジェクト名を除いた部分で比較）
+            imported_parts = imported_module.split(".")
+            if len(imported_parts) >= 2:
+                imported_suffix = ".".join(imported_parts[1:])
+                matched.update(by_suffix.get(imported_suffix, ()))
+            return matched
+
+        # 同じ名前は多くのモジュールからインポートされるため、名前ごとに一度だけ判定する
+        targets_by_import: Dict[str, set[int]] = {}
+
+        # 依存される側のモジュールIDを、依存する側ごとに重複なく集める
+        targets: List[int] = []
+        for module_path, dependency in self.dependencies.items():
+            matched: set[int] = set()
             for imported in dependency.internal_imports:
-                imported_normalized = self._normalize_module_path(imported)
-                if self._is_module_match(imported_normalized, target_module_normalized):
-                    count += 1
-                    break
+                imported_targets = targets_by_import.get(imported)
+                if imported_targets is None:
+                    imported_targets = targets_by_import[imported] = match_targets(
+                        imported
+                    )
+                matched |= imported_targets
 
-        return count
+            # 自分自身へのインポートは数えない
+            matched.discard(module_ids[module_path])
+            targets.extend(matched)
+
+        return np.bincount(
+            np.asarray(targets, dtype=np.int64), minlength=len(module_ids)
+        ).astype(np.int64, copy=False)
 
     def _normalize_module_path(self, module_path: str) -> str:
         """モジュールパスを正規化"""
@@ -468,20 +685,166 @@ class CouplingAnalyzer:
         return graph
 
 
+def _analyze_file_dependencies(
+    python_file: Path, project_root: Path, cache_dir: Optional[Path]
+) -> Optional[ModuleDependency]:
+    """ワーカープロセスで1ファイルの依存関係を分析
+
+    ProcessPoolExecutor.mapに渡せるように、モジュールレベルの関数として定義する。
+    """
+    return CouplingAnalyzer(project_root, cache_dir)._analyze_file(python_file)
+
+
+def _dotted_prefixes(name: str) -> Iterator[str]:
+    """ドット区切りの名前の、各ドットより前の部分を短い順に列挙
+
+    例えば "a.b.c" に対しては "a", "a.b" を返す。
+    """
+    index = name.find(".")
+    while index != -1:
+        yield name[:index]
+        index = name.find(".", index + 1)
+
+
+# 文のブロックを持つフィールドの要素の型
+_BLOCK_NODE_TYPES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _iter_import_nodes(
+    statements: List[ast.stmt],
+) -> Iterator[ast.Import | ast.ImportFrom]:
+    """文のリストに含まれるインポート文を、ネストしたブロックも含めて出現順に列挙
+
+    ast.NodeVisitorと同じ深さ優先の順序で列挙するが、式のノードは辿らない。
+
+    Args:
+        statements (List[ast.stmt]): 文のリスト
+
+    Yields:
+        ast.Import | ast.ImportFrom: インポート文
+    """
+    stack: List[ast.AST] = list(reversed(statements))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+            continue
+
+        children: List[ast.AST] = []
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if (
+                isinstance(value, list)
+                and value
+                and isinstance(value[0], _BLOCK_NODE_TYPES)
+            ):
+                children.extend(value)
+        stack.extend(reversed(children))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_exclude_patterns(patterns: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """除外パターンのいずれかを部分文字列として含むかを判定する正規表現を生成
+
+    Args:
+        patterns (tuple[str, ...]): 除外するパターン
+
+    Returns:
+        Optional[re.Pattern[str]]: 正規表現。パターンがない場合はNone
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+
+def _iter_python_files(
+    root: str, exclude_regex: Optional[re.Pattern[str]]
+) -> Iterator[str]:
+    """ディレクトリ以下のPythonファイルのパスを深さ優先で列挙
+
+    `os.scandir` のエントリからファイルの種類を判定するため、ファイルごとにstatを行わず、
+    Pathも生成しない。除外パターンを部分文字列として含むパスは除外する。
+    ディレクトリのパスが除外パターンを含めば配下のパスもすべて含むため、
+    そのディレクトリは走査せずに打ち切る。シンボリックリンクのディレクトリはたどらない。
+
+    Args:
+        root (str): 走査するディレクトリ
+        exclude_regex (Optional[re.Pattern[str]]): _compile_exclude_patterns で生成した正規表現
+
+    Yields:
+        str: Pythonファイルのパス
+    """
+    if exclude_regex is not None and exclude_regex.search(root):
+        return
+
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    path = entry.path
+                    if exclude_regex is not None and exclude_regex.search(path):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            yield path
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Failed to scan {dirpath}: {e}")
+            continue
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_project_module(project_root: str, import_name: str) -> bool:
+    """インポート名がプロジェクトルート配下のモジュールを指すかを判定
+
+    同じモジュールは多くのファイルからインポートされるため、
+    ファイルシステムの確認結果をキャッシュする。
+
+    Args:
+        project_root (str): プロジェクトのルートディレクトリ
+        import_name (str): インポート名
+
+    Returns:
+        bool: プロジェクト内のモジュールまたはパッケージが存在する場合はTrue
+    """
+    try:
+        # プロジェクト内のモジュールパスに変換を試行
+        potential_path = Path(project_root) / import_name.replace(".", "/")
+        return (
+            potential_path.with_suffix(".py").exists()
+            or (potential_path / "__init__.py").exists()
+        )
+    except Exception:
+        return False
+
+
 def analyze_project_coupling(
-    project_root: Path, exclude_patterns: Optional[List[str]] = None
+    project_root: Path,
+    exclude_patterns: Optional[Sequence[str]] = None,
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
 ) -> ProjectCouplingMetrics:
     """プロジェクト全体の結合度を分析する便利関数
 
     Args:
         project_root (Path): プロジェクトのルートディレクトリ
-        exclude_patterns (Optional[List[str]]): 除外するパターンのリスト
+        exclude_patterns (Optional[Sequence[str]]): 除外するパターンのリスト
+        cache_dir (Optional[Path]): モジュールごとの依存関係のキャッシュディレクトリ。
+            Noneの場合はキャッシュしない
+        workers (Optional[int]): 並列処理のワーカー数。Noneの場合はCPU数
 
     Returns:
         ProjectCouplingMetrics: プロジェクト全体の結合度メトリクス
     """
     try:
-        analyzer = CouplingAnalyzer(project_root)
+        analyzer = CouplingAnalyzer(project_root, cache_dir, workers)
         return analyzer.analyze_project(exclude_patterns)
     except Exception:
         # 例外が発生した場合は空のメトリクスを返す
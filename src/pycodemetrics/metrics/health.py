@@ -9,7 +9,7 @@ import statistics
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +33,9 @@ class HealthMetrics(BaseModel, frozen=True, extra="forbid"):
     architecture_score: int
     maintainability_score: int
     evolution_score: int | None = None
-    critical_issues: list[str] = []
-    recommendations: list[str] = []
-    detailed_metrics: dict[str, Any] = {}
+    critical_issues: tuple[str, ...] = Field(default_factory=tuple)
+    recommendations: tuple[str, ...] = Field(default_factory=tuple)
+    detailed_metrics: dict[str, Any] = Field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -60,8 +60,8 @@ class ProjectHealthResult(BaseModel, frozen=True, extra="forbid"):
     architecture_score: int
     maintainability_score: int
     evolution_score: int | None = None
-    critical_issues: list[str] = []
-    recommendations: list[str] = []
+    critical_issues: tuple[str, ...] = Field(default_factory=tuple)
+    recommendations: tuple[str, ...] = Field(default_factory=tuple)
 
     def to_flat(self) -> dict[str, Any]:
         return {
@@ -126,8 +126,8 @@ def analyze_project_health_metrics(
         architecture_score=architecture_score,
         maintainability_score=maintainability_score,
         evolution_score=evolution_score,
-        critical_issues=critical_issues,
-        recommendations=recommendations,
+        critical_issues=tuple(critical_issues),
+        recommendations=tuple(recommendations),
         detailed_metrics=detailed_metrics,
     )
 
@@ -1,4 +1,4 @@
-from pycodemetrics.metrics.py.raw.cc_wrapper import get_function_cognitive_complexity
+from pycodemetrics.metrics.py.raw.cc_wrapper import get_total_cognitive_complexity
 
 
 def get_cognitive_complexity(code: str) -> int:
@@ -14,5 +14,4 @@ def get_cognitive_complexity(code: str) -> int:
     Returns:
         int: 提供されたコードの総認知的複雑度。
     """
-    cognitive_complexity = get_function_cognitive_complexity(code)
-    return sum(c.complexity for c in cognitive_complexity)
+    return get_total_cognitive_complexity(code)
@@ -1,4 +1,6 @@
 import ast
+from collections import deque
+from collections.abc import Iterator
 
 from cognitive_complexity.api import get_cognitive_complexity
 from pydantic import BaseModel
@@ -20,6 +22,36 @@ class FunctionCognitiveComplexity(BaseModel, frozen=True):
     complexity: int
 
 
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _iter_funcdefs(
+    tree: ast.AST,
+) -> Iterator[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """
+    構文木に含まれる関数定義を列挙します。
+
+    関数定義は文としてのみ現れるため、式のサブツリーには降りずに文を持つノードだけを走査します。
+    列挙順はast.walkと同じ幅優先順です。
+
+    Args:
+        tree (ast.AST): 解析対象の構文木。
+
+    Returns:
+        Iterator[ast.FunctionDef | ast.AsyncFunctionDef]: 関数定義ノードのイテレータ。
+    """
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
+        queue.extend(
+            child
+            for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STATEMENT_CONTAINERS)
+        )
+
+
 def get_function_cognitive_complexity(
     code: str,
 ) -> list[FunctionCognitiveComplexity]:
@@ -37,18 +69,26 @@ def get_function_cognitive_complexity(
     """
     tree = ast.parse(code)
 
-    funcdefs = (
-        n
-        for n in ast.walk(tree)
-        if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-    )
-
-    results = []
-    for funcdef in funcdefs:
-        complexity = get_cognitive_complexity(funcdef)
-        results.append(
-            FunctionCognitiveComplexity(
-                function_name=funcdef.name, complexity=complexity
-            )
+    return [
+        FunctionCognitiveComplexity(
+            function_name=funcdef.name, complexity=get_cognitive_complexity(funcdef)
         )
-    return results
+        for funcdef in _iter_funcdefs(tree)
+    ]
+
+
+def get_total_cognitive_complexity(code: str) -> int:
+    """
+    指定されたコードに含まれる全関数の認知的複雑度の合計を計算します。
+
+    関数ごとの結果が不要な場合に、FunctionCognitiveComplexityを生成せずに合計だけを求めます。
+
+    Args:
+        code (str): 分析するソースコードを含む文字列。
+
+    Returns:
+        int: 全関数の認知的複雑度の合計。
+    """
+    tree = ast.parse(code)
+
+    return sum(get_cognitive_complexity(funcdef) for funcdef in _iter_funcdefs(tree))
@@ -1,6 +1,5 @@
 import datetime as dt
 from collections import Counter
-from enum import Enum
 from pathlib import Path
 from typing import Any
 
@@ -9,29 +8,7 @@ from pydantic import BaseModel
 from pycodemetrics.config.config_manager import UserGroupConfig
 from pycodemetrics.gitclient.gitcli import get_file_gitlogs
 from pycodemetrics.gitclient.gitlog_parser import parse_gitlogs
-from pycodemetrics.util.file_util import CodeType
-
-
-class FilterCodeType(str, Enum):
-    """
-    Filter code type.
-
-    PRODUCT: Filter product code.
-    TEST: Filter test code.
-    BOTH: Filter both product and test code.
-    """
-
-    PRODUCT = CodeType.PRODUCT.value
-    TEST = CodeType.TEST.value
-    BOTH = "both"
-
-    @classmethod
-    def to_list(cls) -> list[str]:
-        """
-        Returns:
-            list code types.
-        """
-        return [e.value for e in cls]
+from pycodemetrics.util.file_util import FilterCodeType
 
 
 class AnalizeCommitterSettings(BaseModel, frozen=True, extra="forbid"):
@@ -57,24 +34,28 @@ class FileChangeCountMetrics(BaseModel, frozen=True, extra="forbid"):
     change_counts: list[CommitterChangeCount]
 
     def to_flatten_list(self) -> list[dict[str, Any]]:
-        results = []
-        for change_count in self.change_counts:
-            results.append(
-                {
-                    "filepath": self.filepath,
-                    "committer": change_count.committer,
-                    "change_count": change_count.change_count,
-                }
-            )
-        return results
+        return [
+            {
+                "filepath": self.filepath,
+                "committer": change_count.committer,
+                "change_count": change_count.change_count,
+            }
+            for change_count in self.change_counts
+        ]
 
 
 def aggregate_changecount_by_committer(
-    filepath: Path, repo_dir_path: Path, settings: AnalizeCommitterSettings
+    filepath: Path,
+    repo_dir_path: Path,
+    settings: AnalizeCommitterSettings,
+    raw_gitlogs: list[str] | None = None,
 ) -> FileChangeCountMetrics:
-    gitlogs = parse_gitlogs(filepath, get_file_gitlogs(filepath, repo_dir_path))
+    if raw_gitlogs is None:
+        raw_gitlogs = get_file_gitlogs(filepath, repo_dir_path)
+
+    gitlogs = parse_gitlogs(filepath, raw_gitlogs)
 
-    changecounter = Counter([gitlog.author for gitlog in gitlogs])
+    changecounter = Counter(gitlog.author for gitlog in gitlogs)
 
     # CounterからCommitterChangeCountに変換
     changecount_by_committer = [
@@ -24,10 +24,15 @@
 """
 
 import logging
+import operator
+from collections import Counter
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from pydantic import BaseModel
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, Field
 
 from pycodemetrics.metrics.coupling import (
     CouplingMetrics,
@@ -37,19 +42,23 @@ from pycodemetrics.metrics.coupling import (
 
 logger = logging.getLogger(__name__)
 
+_PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
 
 class CouplingAnalysisSettings(BaseModel, frozen=True, extra="forbid"):
     """結合度分析の設定を表すクラス。
 
     Attributes:
-        exclude_patterns (List[str]): 除外するパターンのリスト
+        exclude_patterns (tuple[str, ...]): 除外するパターン。パスに部分文字列として含まれる場合に除外する
         instability_threshold_high (float): 高不安定度の閾値
         instability_threshold_low (float): 低不安定度の閾値
         coupling_threshold_high (int): 高結合度の閾値
         lines_threshold_large (int): 大規模ファイルの閾値
+        cache_dir (Optional[Path]): モジュールごとの依存関係のキャッシュディレクトリ。Noneの場合はキャッシュしない
+        workers (Optional[int]): 並列処理のワーカー数。Noneの場合はCPU数
     """
 
-    exclude_patterns: List[str] = [
+    exclude_patterns: tuple[str, ...] = (
         "__pycache__",
         ".git",
         ".pytest_cache",
@@ -60,11 +69,13 @@ class CouplingAnalysisSettings(BaseModel, frozen=True, extra="forbid"):
         ".tox",
         "build",
         "dist",
-    ]
+    )
     instability_threshold_high: float = 0.8
     instability_threshold_low: float = 0.2
     coupling_threshold_high: int = 5
     lines_threshold_large: int = 200
+    cache_dir: Optional[Path] = None
+    workers: Optional[int] = None
 
 
 class ModuleRecommendation(BaseModel, frozen=True, extra="forbid"):
@@ -85,6 +96,36 @@ class ModuleRecommendation(BaseModel, frozen=True, extra="forbid"):
     rationale: str
 
 
+class AnalysisSummary(BaseModel, frozen=True, extra="forbid"):
+    """結合度分析のサマリーを表すクラス。
+
+    Attributes:
+        total_modules (int): モジュール数
+        problematic_modules (int): 問題のあるモジュール数
+        stable_modules (int): 安定したモジュール数
+        problematic_ratio (float): 問題のあるモジュールの割合
+        stable_ratio (float): 安定したモジュールの割合
+        overall_health (str): 全体的な健全性（excellent, good, fair, poor, unknown）
+        average_instability (float): 平均不安定度
+        dependency_density (float): 依存関係密度
+        category_distribution (Dict[str, int]): カテゴリ別のモジュール数
+        max_afferent_coupling (int): 最大入力結合度
+        max_efferent_coupling (int): 最大出力結合度
+    """
+
+    total_modules: int = 0
+    problematic_modules: int = 0
+    stable_modules: int = 0
+    problematic_ratio: float = 0.0
+    stable_ratio: float = 0.0
+    overall_health: str = "unknown"
+    average_instability: float = 0.0
+    dependency_density: float = 0.0
+    category_distribution: Dict[str, int] = Field(default_factory=dict)
+    max_afferent_coupling: int = 0
+    max_efferent_coupling: int = 0
+
+
 class CouplingAnalysisResult(BaseModel, frozen=True, extra="forbid"):
     """結合度分析の完全な結果を表すクラス。
 
@@ -93,14 +134,14 @@ class CouplingAnalysisResult(BaseModel, frozen=True, extra="forbid"):
         problematic_modules (List[CouplingMetrics]): 問題のあるモジュール
         stable_modules (List[CouplingMetrics]): 安定したモジュール
         recommendations (List[ModuleRecommendation]): 推奨アクション
-        analysis_summary (Dict[str, Any]): 分析サマリー
+        analysis_summary (AnalysisSummary): 分析サマリー
     """
 
     project_metrics: ProjectCouplingMetrics
     problematic_modules: List[CouplingMetrics]
     stable_modules: List[CouplingMetrics]
     recommendations: List[ModuleRecommendation]
-    analysis_summary: Dict[str, Any]
+    analysis_summary: AnalysisSummary
 
 
 def analyze_project_coupling_comprehensive(
@@ -131,25 +172,18 @@ def analyze_project_coupling_comprehensive(
     try:
         # 基本的な結合度分析
         project_metrics = analyze_project_coupling(
-            project_path, settings.exclude_patterns
+            project_path,
+            settings.exclude_patterns,
+            settings.cache_dir,
+            settings.workers,
         )
 
         if project_metrics.module_count == 0:
             logger.warning("No Python modules found in the project")
             return _create_empty_result(project_path, project_metrics)
 
-        # 問題のあるモジュールの特定
-        problematic_modules = _identify_problematic_modules(
-            project_metrics.module_metrics, settings
-        )
-
-        # 安定したモジュールの特定
-        stable_modules = _identify_stable_modules(
-            project_metrics.module_metrics, settings
-        )
-
-        # 推奨アクションの生成
-        recommendations = _generate_recommendations(
+        # 問題のあるモジュール・安定したモジュールの特定と推奨アクションの生成
+        problematic_modules, stable_modules, recommendations = _classify_modules(
             project_metrics.module_metrics, settings
         )
 
@@ -185,69 +219,92 @@ def _create_empty_result(
         problematic_modules=[],
         stable_modules=[],
         recommendations=[],
-        analysis_summary={
-            "total_modules": 0,
-            "problematic_modules": 0,
-            "stable_modules": 0,
-            "recommendations": 0,
-            "overall_health": "unknown",
-        },
+        analysis_summary=AnalysisSummary(),
     )
 
 
-def _identify_problematic_modules(
-    modules: List[CouplingMetrics], settings: CouplingAnalysisSettings
-) -> List[CouplingMetrics]:
-    """問題のあるモジュールを特定"""
-    problematic = []
+def _metric_arrays(modules: List[CouplingMetrics]) -> Dict[str, npt.NDArray[Any]]:
+    """モジュールのメトリクスを項目ごとのNumPy配列にまとめる
+
+    Returns:
+        Dict[str, npt.NDArray[Any]]: 項目名をキー、modulesと同じ順に並んだ値の配列を値とする辞書
+    """
+    count = len(modules)
+    return {
+        "instability": np.fromiter(
+            (m.instability for m in modules), dtype=np.float64, count=count
+        ),
+        "afferent": np.fromiter(
+            (m.afferent_coupling for m in modules), dtype=np.int64, count=count
+        ),
+        "efferent": np.fromiter(
+            (m.efferent_coupling for m in modules), dtype=np.int64, count=count
+        ),
+        "lines": np.fromiter(
+            (m.lines_of_code for m in modules), dtype=np.int64, count=count
+        ),
+        "abstractness": np.fromiter(
+            (m.abstractness for m in modules), dtype=np.float64, count=count
+        ),
+    }
 
-    for module in modules:
-        is_problematic = False
 
-        # 高不安定度
-        if module.instability > settings.instability_threshold_high:
-            is_problematic = True
+def _distance_from_main_sequence(
+    arrays: Dict[str, npt.NDArray[Any]],
+) -> npt.NDArray[np.float64]:
+    """CouplingMetrics.distance_from_main_sequence と同じ |A + I - 1| を配列で計算する"""
+    return np.abs(arrays["abstractness"] + arrays["instability"] - 1)
 
-        # 高結合度
-        if (
-            module.afferent_coupling > settings.coupling_threshold_high
-            or module.efferent_coupling > settings.coupling_threshold_high
-        ):
-            is_problematic = True
 
-        # 大規模ファイル + 高結合
-        if (
-            module.lines_of_code > settings.lines_threshold_large
-            and module.efferent_coupling > 3
-        ):
-            is_problematic = True
+def _problematic_mask(
+    arrays: Dict[str, npt.NDArray[Any]], settings: CouplingAnalysisSettings
+) -> npt.NDArray[np.bool_]:
+    """問題のあるモジュールかどうかを配列に対して一括で判定する
 
-        # メインシーケンスからの距離が大きい
-        if module.distance_from_main_sequence > 0.5:
-            is_problematic = True
+    高不安定度、高結合度、大規模ファイル + 高結合、メインシーケンスからの距離が大きい
+    のいずれかに該当するモジュールを問題のあるモジュールとする。
+    """
+    coupling_threshold_high = settings.coupling_threshold_high
+    efferent = arrays["efferent"]
+    return (
+        (arrays["instability"] > settings.instability_threshold_high)
+        | (arrays["afferent"] > coupling_threshold_high)
+        | (efferent > coupling_threshold_high)
+        | ((arrays["lines"] > settings.lines_threshold_large) & (efferent > 3))
+        | (_distance_from_main_sequence(arrays) > 0.5)
+    )
 
-        if is_problematic:
-            problematic.append(module)
 
-    return problematic
+def _stable_mask(
+    arrays: Dict[str, npt.NDArray[Any]], settings: CouplingAnalysisSettings
+) -> npt.NDArray[np.bool_]:
+    """安定したモジュールかどうかを配列に対して一括で判定する"""
+    # 低不安定度 + 適度な入力結合度
+    return (
+        (arrays["instability"] < settings.instability_threshold_low)
+        & (arrays["afferent"] >= 2)
+        & (arrays["efferent"] <= 3)
+    )
 
 
-def _identify_stable_modules(
+def _identify_problematic_modules(
     modules: List[CouplingMetrics], settings: CouplingAnalysisSettings
 ) -> List[CouplingMetrics]:
-    """安定したモジュールを特定"""
-    stable = []
+    """問題のあるモジュールを特定"""
+    if not modules:
+        return []
+    mask = _problematic_mask(_metric_arrays(modules), settings)
+    return [modules[i] for i in np.flatnonzero(mask)]
 
-    for module in modules:
-        # 低不安定度 + 適度な入力結合度
-        if (
-            module.instability < settings.instability_threshold_low
-            and module.afferent_coupling >= 2
-            and module.efferent_coupling <= 3
-        ):
-            stable.append(module)
 
-    return stable
+def _identify_stable_modules(
+    modules: List[CouplingMetrics], settings: CouplingAnalysisSettings
+) -> List[CouplingMetrics]:
+    """安定したモジュールを特定"""
+    if not modules:
+        return []
+    mask = _stable_mask(_metric_arrays(modules), settings)
+    return [modules[i] for i in np.flatnonzero(mask)]
 
 
 def _generate_instability_recommendations(
@@ -328,69 +385,127 @@ def _generate_distance_recommendations(
     return recommendations, priority, category, rationale
 
 
-def _generate_recommendations(
+_RecommendationGenerator = Callable[
+    [CouplingMetrics, CouplingAnalysisSettings], tuple[List[str], str, str, str]
+]
+
+
+class _RecommendationRule(IntEnum):
+    """推奨ルール。値が小さいルールほど優先される"""
+
+    NONE = 0
+    INSTABILITY = 1
+    COUPLING = 2
+    SIZE = 3
+    DISTANCE = 4
+
+
+# 推奨ルールと生成関数の対応
+_RECOMMENDATION_GENERATORS: Dict[_RecommendationRule, _RecommendationGenerator] = {
+    _RecommendationRule.INSTABILITY: _generate_instability_recommendations,
+    _RecommendationRule.COUPLING: _generate_coupling_recommendations,
+    _RecommendationRule.SIZE: _generate_size_recommendations,
+    _RecommendationRule.DISTANCE: _generate_distance_recommendations,
+}
+
+
+def _build_module_recommendation(
+    module: CouplingMetrics,
+    settings: CouplingAnalysisSettings,
+    rule: _RecommendationRule,
+) -> Optional[ModuleRecommendation]:
+    """判定済みの推奨ルールからモジュールに対する推奨アクションを生成。推奨事項がない場合はNoneを返す"""
+    generate = _RECOMMENDATION_GENERATORS.get(rule)
+    if generate is None:
+        return None
+
+    module_recommendations, priority, category, rationale = generate(module, settings)
+
+    # 推奨事項がある場合のみ生成
+    if not module_recommendations:
+        return None
+
+    return ModuleRecommendation(
+        module_path=module.module_path,
+        priority=priority,
+        category=category,
+        recommendations=module_recommendations,
+        rationale=rationale,
+    )
+
+
+def _sort_recommendations(recommendations: List[ModuleRecommendation]) -> None:
+    """推奨アクションを優先度でソート"""
+    # 優先度を一度だけ整数に変換し、整数キーで安定ソートする
+    keyed = [(_PRIORITY_ORDER.get(r.priority, 3), r) for r in recommendations]
+    keyed.sort(key=operator.itemgetter(0))
+    recommendations[:] = [r for _, r in keyed]
+
+
+def _classify_modules(
     modules: List[CouplingMetrics], settings: CouplingAnalysisSettings
-) -> List[ModuleRecommendation]:
-    """推奨アクションを生成"""
-    recommendations = []
+) -> tuple[List[CouplingMetrics], List[CouplingMetrics], List[ModuleRecommendation]]:
+    """モジュールを問題のあるモジュール・安定したモジュール・推奨アクションに分類
 
-    for module in modules:
-        module_recommendations: List[str] = []
-        priority = "low"
-        category = "general"
-        rationale = ""
-
-        # 不安定度に基づく推奨
-        if module.instability > settings.instability_threshold_high:
-            module_recommendations, priority, category, rationale = (
-                _generate_instability_recommendations(module, settings)
-            )
-        # 高結合度に基づく推奨
-        elif module.efferent_coupling > settings.coupling_threshold_high:
-            module_recommendations, priority, category, rationale = (
-                _generate_coupling_recommendations(module, settings)
-            )
-        # 大規模ファイルに基づく推奨
-        elif (
-            module.lines_of_code > settings.lines_threshold_large
-            and module.efferent_coupling > 3
-        ):
-            module_recommendations, priority, category, rationale = (
-                _generate_size_recommendations(module, settings)
-            )
-        # メインシーケンスからの距離に基づく推奨
-        elif module.distance_from_main_sequence > 0.5 and module.category in [
-            "painful",
-            "useless",
-        ]:
-            module_recommendations, priority, category, rationale = (
-                _generate_distance_recommendations(module, settings)
-            )
-
-        # 推奨事項がある場合のみ追加
-        if module_recommendations:
-            recommendations.append(
-                ModuleRecommendation(
-                    module_path=module.module_path,
-                    priority=priority,
-                    category=category,
-                    recommendations=module_recommendations,
-                    rationale=rationale,
-                )
-            )
-
-    # 優先度でソート
-    priority_order = {"high": 0, "medium": 1, "low": 2}
-    recommendations.sort(key=lambda x: priority_order.get(x.priority, 3))
-
-    return recommendations
+    閾値判定はメトリクスをNumPy配列にまとめてベクトル演算で一括して行います。
+
+    Returns:
+        tuple: (問題のあるモジュール, 安定したモジュール, 優先度順の推奨アクション)
+    """
+    count = len(modules)
+    if count == 0:
+        return [], [], []
+
+    arrays = _metric_arrays(modules)
+    instability = arrays["instability"]
+    abstractness = arrays["abstractness"]
+    efferent = arrays["efferent"]
+    lines = arrays["lines"]
+    distance = _distance_from_main_sequence(arrays)
+
+    coupling_threshold_high = settings.coupling_threshold_high
+    problematic_mask = _problematic_mask(arrays, settings)
+    stable_mask = _stable_mask(arrays, settings)
+
+    # 推奨ルールもマスクから一括で判定する。条件は先に一致したものが優先される。
+    # 距離に基づくルールは painful または useless のカテゴリ、つまり不安定度と抽象度の
+    # 一方のみが0.5未満のモジュールに限る
+    rules = np.select(
+        [
+            instability > settings.instability_threshold_high,
+            efferent > coupling_threshold_high,
+            (lines > settings.lines_threshold_large) & (efferent > 3),
+            (distance > 0.5) & ((instability < 0.5) != (abstractness < 0.5)),
+        ],
+        [
+            _RecommendationRule.INSTABILITY,
+            _RecommendationRule.COUPLING,
+            _RecommendationRule.SIZE,
+            _RecommendationRule.DISTANCE,
+        ],
+        default=_RecommendationRule.NONE,
+    )
+
+    problematic = [modules[i] for i in np.flatnonzero(problematic_mask)]
+    stable = [modules[i] for i in np.flatnonzero(stable_mask)]
+
+    recommendations: List[ModuleRecommendation] = []
+    for i in np.flatnonzero(rules):
+        rule = _RecommendationRule(int(rules[i]))
+        recommendation = _build_module_recommendation(modules[i], settings, rule)
+        if recommendation is not None:
+            recommendations.append(recommendation)
+
+    _sort_recommendations(recommendations)
+
+    return problematic, stable, recommendations
 
 
 def _generate_analysis_summary(
     project_metrics: ProjectCouplingMetrics,
     problematic_modules: List[CouplingMetrics],
     stable_modules: List[CouplingMetrics],
-) -> Dict[str, Any]:
+) -> AnalysisSummary:
     """分析サマリーを生成"""
     total_modules = project_metrics.module_count
     problematic_count = len(problematic_modules)
@@ -409,30 +524,27 @@ def _generate_analysis_summary(
         overall_health = "excellent"
 
     # カテゴリ別の分布
-    category_distribution: Dict[str, int] = {}
-    for module in project_metrics.module_metrics:
-        category = module.category
-        category_distribution[category] = category_distribution.get(category, 0) + 1
+    category_distribution: Dict[str, int] = dict(
+        Counter(module.category for module in project_metrics.module_metrics)
+    )
 
-    return {
-        "total_modules": total_modules,
-        "problematic_modules": problematic_count,
-        "stable_modules": stable_count,
-        "problematic_ratio": round(problematic_count / total_modules, 3)
+    return AnalysisSummary(
+        total_modules=total_modules,
+        problematic_modules=problematic_count,
+        stable_modules=stable_count,
+        problematic_ratio=round(problematic_count / total_modules, 3)
         if total_modules > 0
-        else 0,
-        "stable_ratio": round(stable_count / total_modules, 3)
+        else 0.0,
+        stable_ratio=round(stable_count / total_modules, 3)
         if total_modules > 0
-        else 0,
-        "overall_health": overall_health,
-        "average_instability": round(project_metrics.average_instability, 3),
-        "dependency_density": round(project_metrics.dependency_density, 3),
-        "category_distribution": category_distribution,
-        "max_couplings": {
-            "afferent": project_metrics.max_afferent_coupling,
-            "efferent": project_metrics.max_efferent_coupling,
-        },
-    }
+        else 0.0,
+        overall_health=overall_health,
+        average_instability=round(project_metrics.average_instability, 3),
+        dependency_density=round(project_metrics.dependency_density, 3),
+        category_distribution=category_distribution,
+        max_afferent_coupling=project_metrics.max_afferent_coupling,
+        max_efferent_coupling=project_metrics.max_efferent_coupling,
+    )
 
 
 def get_coupling_insights(analysis_result: CouplingAnalysisResult) -> List[str]:
@@ -449,7 +561,7 @@ def get_coupling_insights(analysis_result: CouplingAnalysisResult) -> List[str]:
     project_metrics = analysis_result.project_metrics
 
     # 全体的な評価
-    health = summary["overall_health"]
+    health = summary.overall_health
     if health == "excellent":
         insights.append("🎉 プロジェクトの結合度は非常に良好です")
     elif health == "good":
@@ -460,9 +572,9 @@ def get_coupling_insights(analysis_result: CouplingAnalysisResult) -> List[str]:
         insights.append("🚨 プロジェクトの結合度に深刻な問題があります")
 
     # 具体的な問題の指摘
-    if summary["problematic_ratio"] > 0.2:
+    if summary.problematic_ratio > 0.2:
         insights.append(
-            f"問題のあるモジュールが {summary['problematic_ratio']:.1%} あります。リファクタリングを検討してください"
+            f"問題のあるモジュールが {summary.problematic_ratio:.1%} あります。リファクタリングを検討してください"
         )
 
     if project_metrics.dependency_density > 0.3:
@@ -476,9 +588,9 @@ def get_coupling_insights(analysis_result: CouplingAnalysisResult) -> List[str]:
         )
 
     # ポジティブな指摘
-    if summary["stable_ratio"] > 0.3:
+    if summary.stable_ratio > 0.3:
         insights.append(
-            f"安定したモジュールが {summary['stable_ratio']:.1%} あります。これらをコアライブラリとして活用できます"
+            f"安定したモジュールが {summary.stable_ratio:.1%} あります。これらをコアライブラリとして活用できます"
         )
 
     # 推奨アクションのサマリー
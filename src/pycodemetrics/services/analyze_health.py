@@ -4,12 +4,18 @@
 複数のメトリクスを統合して総合的な健康度スコアを算出します。
 """
 
+import itertools
 import logging
+import os
+from collections.abc import Iterable
+from concurrent.futures.process import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+from pycodemetrics.config.config_manager import EXCLUDE_PATTERN_DEFAULT
+from pycodemetrics.metrics.coupling import CouplingMetrics
 from pycodemetrics.metrics.health import (
     ProjectHealthResult,
     analyze_project_health_metrics,
@@ -21,8 +27,10 @@ from pycodemetrics.services.analyze_coupling import (
 from pycodemetrics.services.analyze_python_metrics import (
     AnalyzePythonSettings,
     FilterCodeType,
+    PythonFileMetrics,
     analyze_python_file,
 )
+from pycodemetrics.util.file_util import iter_target_files_by_path
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +42,15 @@ class HealthAnalysisSettings(BaseModel, frozen=True, extra="forbid"):
         include_trends: トレンド分析を含めるかどうか
         workers: 並列処理のワーカー数
         testcode_type_patterns: テストコードのファイルパスパターン
+        exclude_patterns: 解析対象から除外するパスのパターン
+        max_files: 解析するPythonファイル数の上限。Noneの場合はすべてのファイルを解析する
     """
 
     include_trends: bool = False
     workers: int | None = None
     testcode_type_patterns: list[str] = []
+    exclude_patterns: list[str] = EXCLUDE_PATTERN_DEFAULT
+    max_files: int | None = None
 
 
 def analyze_project_health(
@@ -88,28 +100,55 @@ def analyze_project_health(
     )
 
 
+def _analyze_python_file_or_none(
+    filepath: Path, settings: AnalyzePythonSettings
+) -> PythonFileMetrics | None:
+    """Pythonファイルを解析し、失敗した場合はNoneを返します。
+
+    ProcessPoolExecutor.mapで1ファイルの失敗が全体を止めないようにするためのラッパーです。
+    """
+    try:
+        return analyze_python_file(filepath, settings)
+    except Exception as e:
+        logger.debug(f"Failed to analyze {filepath}: {e}")
+        return None
+
+
 def _collect_python_metrics(
     target_path: Path, settings: HealthAnalysisSettings
 ) -> list[Any]:
     """Pythonメトリクスを収集します。"""
     try:
-        # 簡略化実装 - Pythonファイルの基本的なメトリクス収集
-        python_files = list(target_path.rglob("*.py"))
-        metrics = []
+        # ディレクトリの探索と解析を重ね、max_files に達したら探索も打ち切る
+        python_files: Iterable[Path] = iter_target_files_by_path(
+            target_path, settings.exclude_patterns
+        )
+        if settings.max_files is not None:
+            python_files = itertools.islice(python_files, settings.max_files)
 
         python_settings = AnalyzePythonSettings(
             testcode_type_patterns=settings.testcode_type_patterns,
             filter_code_type=FilterCodeType.PRODUCT,
         )
 
-        for python_file in python_files[:10]:  # 最初の10ファイルのみ
-            try:
-                metric = analyze_python_file(python_file, python_settings)
-                metrics.append(metric)
-            except Exception:
-                continue
-
-        return metrics
+        workers = settings.workers or os.cpu_count() or 1
+        if workers <= 1:
+            results = [
+                _analyze_python_file_or_none(python_file, python_settings)
+                for python_file in python_files
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        _analyze_python_file_or_none,
+                        python_files,
+                        itertools.repeat(python_settings),
+                        chunksize=8,
+                    )
+                )
+
+        return [metric for metric in results if metric is not None]
     except Exception as e:
         logger.warning(f"Failed to collect Python metrics: {e}")
         return []
@@ -117,16 +156,12 @@ def _collect_python_metrics(
 
 def _collect_coupling_metrics(
     target_path: Path, settings: HealthAnalysisSettings
-) -> list[Any]:
+) -> list[CouplingMetrics]:
     """結合度メトリクスを収集します。"""
     try:
-        coupling_settings = CouplingAnalysisSettings()
+        coupling_settings = CouplingAnalysisSettings(workers=settings.workers)
         result = analyze_project_coupling_comprehensive(target_path, coupling_settings)
-        return (
-            result.project_metrics.module_metrics
-            if hasattr(result, "project_metrics")
-            else []
-        )
+        return result.project_metrics.module_metrics
     except Exception as e:
         logger.warning(f"Failed to collect coupling metrics: {e}")
         return []
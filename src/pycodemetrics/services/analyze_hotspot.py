@@ -1,5 +1,4 @@
 import datetime as dt
-from enum import Enum
 from pathlib import Path
 from typing import Any
 
@@ -9,29 +8,12 @@ from pycodemetrics.config.config_manager import UserGroupConfig
 from pycodemetrics.gitclient.gitcli import get_file_gitlogs
 from pycodemetrics.gitclient.gitlog_parser import parse_gitlogs
 from pycodemetrics.metrics.hotspot import HotspotMetrics, calculate_hotspot
-from pycodemetrics.util.file_util import CodeType, get_code_type, get_group_name
-
-
-class FilterCodeType(str, Enum):
-    """
-    Filter code type.
-
-    PRODUCT: Filter product code.
-    TEST: Filter test code.
-    BOTH: Filter both product and test code.
-    """
-
-    PRODUCT = CodeType.PRODUCT.value
-    TEST = CodeType.TEST.value
-    BOTH = "both"
-
-    @classmethod
-    def to_list(cls) -> list[str]:
-        """
-        Returns:
-            list code types.
-        """
-        return [e.value for e in cls]
+from pycodemetrics.util.file_util import (
+    CodeType,
+    FilterCodeType,
+    get_code_type,
+    get_group_name,
+)
 
 
 class AnalizeHotspotSettings(BaseModel, frozen=True, extra="forbid"):
@@ -81,7 +63,10 @@ class FileHotspotMetrics(BaseModel, frozen=True, extra="forbid"):
 
 
 def analyze_hotspot_file(
-    filepath: Path, repo_dir_path: Path, settings: AnalizeHotspotSettings
+    filepath: Path,
+    repo_dir_path: Path,
+    settings: AnalizeHotspotSettings,
+    raw_gitlogs: list[str] | None = None,
 ) -> FileHotspotMetrics:
     """
     指定されたパスのGitのコミットLogを解析し、メトリクスを計算します。
@@ -90,12 +75,16 @@ def analyze_hotspot_file(
         filepath (Path): 解析するファイルのパス。
         repo_dir_path (Path): Gitリポジトリのパス
         settings (AnalizeHotspotSettings): 解析の設定
+        raw_gitlogs (list[str] | None): 事前に取得したファイルのGitログ。Noneの場合はファイルごとに`git log`を実行する。
 
     Returns:
         FileHotspotMetrics: ファイルパス、計算されたメトリクスを含むFileHotspotMetricsオブジェクト。
     """
 
-    gitlogs = parse_gitlogs(filepath, get_file_gitlogs(filepath, repo_dir_path))
+    if raw_gitlogs is None:
+        raw_gitlogs = get_file_gitlogs(filepath, repo_dir_path)
+
+    gitlogs = parse_gitlogs(filepath, raw_gitlogs)
     if len(gitlogs) == 0:
         raise ValueError("No git logs.")
 
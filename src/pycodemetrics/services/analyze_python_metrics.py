@@ -1,50 +1,38 @@
 import logging
-from enum import Enum
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from pydantic import BaseModel
 
 from pycodemetrics.config.config_manager import UserGroupConfig
 from pycodemetrics.metrics.py.python_metrics import PythonCodeMetrics, compute_metrics
-from pycodemetrics.util.file_util import CodeType, get_code_type, get_group_name
+from pycodemetrics.util.file_util import (
+    CodeType,
+    FilterCodeType,
+    get_code_type,
+    get_group_name,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class FilterCodeType(str, Enum):
-    """
-    Filter code type.
-
-    PRODUCT: Filter product code.
-    TEST: Filter test code.
-    BOTH: Filter both product and test code.
-    """
-
-    PRODUCT = CodeType.PRODUCT.value
-    TEST = CodeType.TEST.value
-    BOTH = "both"
-
-    @classmethod
-    def to_list(cls) -> list[str]:
-        """
-        Returns:
-            list code types.
-        """
-        return [e.value for e in cls]
-
-
 class AnalyzePythonSettings(BaseModel, frozen=True, extra="forbid"):
     """
     Pythonファイルの解析設定を表すクラス。
 
     testcode_type_patterns (list[str]): テストコードのファイルパスパターン。
     user_groups (list[UserGroupConfig]): ユーザーが定義したグループ定義。
+    cache_dir (Path | None): メトリクスのキャッシュを保存するディレクトリ。Noneの場合はキャッシュしない。
     """
 
     testcode_type_patterns: list[str] = []
     user_groups: list[UserGroupConfig] = []
     filter_code_type: FilterCodeType = FilterCodeType.PRODUCT
+    cache_dir: Path | None = None
 
 
 class PythonFileMetrics(BaseModel, frozen=True, extra="forbid"):
@@ -90,16 +78,212 @@ def analyze_python_file(
     Returns:
         PythonFileMetrics: ファイルパス、ファイルタイプ、計算されたメトリクスを含むPythonFileMetricsオブジェクト。
     """
-    code = _open(filepath)
-    python_code_metrics = compute_metrics(code)
+    return analyze_python_code(filepath, _open(filepath), settings)
+
+
+def analyze_python_code(
+    filepath: Path, code: str, settings: AnalyzePythonSettings
+) -> PythonFileMetrics:
+    """
+    読み込み済みのPythonコードを解析し、そのメトリクスを計算します。
+
+    Args:
+        filepath (Path): コードを読み込んだPythonファイルのパス。
+        code (str): 解析するPythonコード。
+        settings (AnalyzePythonSettings): 解析の設定
+
+    Returns:
+        PythonFileMetrics: ファイルパス、ファイルタイプ、計算されたメトリクスを含むPythonFileMetricsオブジェクト。
+    """
+    python_code_metrics = _compute_metrics_with_cache(
+        filepath, code, settings.cache_dir
+    )
+    return _build_python_file_metrics(filepath, python_code_metrics, settings)
+
+
+def _build_python_file_metrics(
+    filepath: Path, metrics: PythonCodeMetrics, settings: AnalyzePythonSettings
+) -> PythonFileMetrics:
+    """
+    計算済みのメトリクスにファイルごとの情報を付与してPythonFileMetricsを生成します。
+
+    Args:
+        filepath (Path): Pythonファイルのパス。
+        metrics (PythonCodeMetrics): 計算済みのメトリクス。
+        settings (AnalyzePythonSettings): 解析の設定
+
+    Returns:
+        PythonFileMetrics: ファイルパス、ファイルタイプ、メトリクスを含むPythonFileMetricsオブジェクト。
+    """
     return PythonFileMetrics(
         filepath=filepath,
         code_type=get_code_type(filepath, settings.testcode_type_patterns),
         group_name=get_group_name(filepath, settings.user_groups),
-        metrics=python_code_metrics,
+        metrics=metrics,
     )
 
 
+def python_code_digest(code: str) -> bytes:
+    """
+    ファイル内容のダイジェストを返します。
+
+    内容が同一のファイルをまとめる際に、ファイル内容そのものの代わりにキーとして使います。
+
+    Args:
+        code (str): Pythonコード。
+
+    Returns:
+        bytes: ファイル内容のBLAKE2bダイジェスト(16バイト)。
+    """
+    return blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def expand_python_file_metrics(
+    result: PythonFileMetrics,
+    duplicate_filepaths: list[Path],
+    settings: AnalyzePythonSettings,
+) -> list[PythonFileMetrics]:
+    """
+    同一内容のファイルに計算済みのメトリクスを割り当てます。
+
+    Args:
+        result (PythonFileMetrics): 代表ファイルの解析結果。
+        duplicate_filepaths (list[Path]): 代表ファイルと同じ内容を持つ他のファイルのパス。
+        settings (AnalyzePythonSettings): 解析の設定
+
+    Returns:
+        list[PythonFileMetrics]: duplicate_filepaths それぞれの解析結果。
+    """
+    return [
+        _build_python_file_metrics(filepath, result.metrics, settings)
+        for filepath in duplicate_filepaths
+    ]
+
+
+# メトリクスの計算方法が変わった場合に古いキャッシュを無効にするためのバージョン
+_METRICS_CACHE_VERSION = 1
+
+
+def _metrics_cache_path(filepath: Path, cache_dir: Path) -> Path | None:
+    """
+    ファイルのメトリクスキャッシュの保存先を返します。
+
+    キャッシュキーはファイルの絶対パス、更新時刻(ナノ秒)、サイズから生成します。
+
+    Args:
+        filepath (Path): 解析するPythonファイルのパス。
+        cache_dir (Path): キャッシュディレクトリ。
+
+    Returns:
+        Path | None: キャッシュファイルのパス。ファイルの情報が取得できない場合はNone。
+    """
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+
+    key = f"{_METRICS_CACHE_VERSION}:{filepath.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    return cache_dir / "python_metrics" / f"{digest}.json"
+
+
+def _compute_metrics_with_cache(
+    filepath: Path, code: str, cache_dir: Path | None
+) -> PythonCodeMetrics:
+    """
+    キャッシュがあればそれを使い、なければメトリクスを計算してキャッシュに保存します。
+
+    Args:
+        filepath (Path): 解析するPythonファイルのパス。
+        code (str): 解析するPythonコード。
+        cache_dir (Path | None): キャッシュディレクトリ。Noneの場合はキャッシュしない。
+
+    Returns:
+        PythonCodeMetrics: 計算されたメトリクス。
+    """
+    cache_path = None if cache_dir is None else _metrics_cache_path(filepath, cache_dir)
+    if cache_path is None:
+        return compute_metrics(code)
+
+    try:
+        return PythonCodeMetrics.model_validate_json(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        logger.debug(f"Ignoring broken metrics cache {cache_path}: {e}")
+
+    metrics = compute_metrics(code)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(metrics.model_dump_json(), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.debug(f"Failed to write metrics cache {cache_path}: {e}")
+    return metrics
+
+
+def _open_or_none(filepath: Path) -> str | None:
+    """
+    指定されたファイルを読み込み、失敗した場合はNoneを返します。
+
+    Args:
+        filepath (Path): 読み込むファイルのパス。
+
+    Returns:
+        str | None: ファイルの内容。読み込みに失敗した場合はNone。
+    """
+    try:
+        return _open(filepath)
+    except Exception as e:
+        logger.warning(f"Skipping {filepath} due to error: {type(e).__name__}: {e}")
+        return None
+
+
+def iter_python_files(
+    filepaths: list[Path], workers: int | None = None, prefetch: int | None = None
+) -> Iterator[tuple[Path, str | None]]:
+    """
+    複数のファイルをスレッドプールで先読みしながら、読み込んだ順に返します。
+
+    ファイルI/OはGILを解放するため、スレッドで読み込みを重ねることで待ち時間を隠蔽します。
+    呼び出し側が内容を処理している間も、後続のファイルの読み込みが進みます。
+    先読みするのはprefetch件までで、1件返すごとに次のファイルの読み込みを投入するため、
+    メモリに保持するファイル内容の数は一定に抑えられます。
+
+    Args:
+        filepaths (list[Path]): 読み込むファイルのパスのリスト。
+        workers (int | None): スレッド数。Noneの場合はCPU数の4倍(最大32)。
+        prefetch (int | None): 先読みするファイル数の上限。Noneの場合はスレッド数の2倍。
+
+    Yields:
+        tuple[Path, str | None]: filepathsと同じ順序のファイルパスと内容の組。読み込みに失敗したファイルの内容はNone。
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+    if prefetch is None:
+        prefetch = workers * 2
+
+    pending_paths = iter(filepaths)
+    window: deque[tuple[Path, Future[str | None]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for filepath in pending_paths:
+            window.append((filepath, executor.submit(_open_or_none, filepath)))
+            if len(window) >= prefetch:
+                break
+
+        while window:
+            filepath, future = window.popleft()
+            next_path = next(pending_paths, None)
+            if next_path is not None:
+                window.append((next_path, executor.submit(_open_or_none, next_path)))
+            yield filepath, future.result()
+    finally:
+        # 途中で打ち切られた場合は、まだ始まっていない読み込みを取り消す
+        executor.shutdown(cancel_futures=True)
+
+
 def _open(filepath: Path) -> str:
     """
     指定されたファイルを開き、その内容を文字列として返します。
@@ -108,14 +292,14 @@ def _open(filepath: Path) -> str:
         filepath (Path): 読み込むファイルのパス。
 
     Raises:
-        ValueError: ファイルパスが設定されていない場合に発生。
         FileNotFoundError: ファイルが存在しない場合に発生。
 
     Returns:
         str: ファイルの内容を含む文字列。
     """
-    if not filepath.exists():
-        raise FileNotFoundError(f"{filepath} is not found")
-
-    with open(filepath) as f:
-        return f.read()
+    # テキストモードの改行変換やバッファの再確保を避け、ファイルサイズ分を一度に読み込む
+    # 存在確認は事前に行わず、読み込み時の例外で判定する
+    try:
+        return filepath.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{filepath} is not found") from None
@@ -1,11 +1,18 @@
 import fnmatch
-import glob
+import functools
 import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 
-from pycodemetrics.config.config_manager import UserGroupConfig
-from pycodemetrics.gitclient.gitcli import list_git_files
+from pycodemetrics.config.config_manager import (
+    TESTCODE_PATTERN_DEFAULT,
+    UserGroupConfig,
+)
+from pycodemetrics.gitclient.gitcli import list_git_file_names
 
 
 class CodeType(Enum):
@@ -20,8 +27,31 @@ class CodeType(Enum):
     TEST = "test"
 
 
+class FilterCodeType(str, Enum):
+    """
+    Filter code type.
+
+    PRODUCT: Filter product code.
+    TEST: Filter test code.
+    BOTH: Filter both product and test code.
+    """
+
+    PRODUCT = CodeType.PRODUCT.value
+    TEST = CodeType.TEST.value
+    BOTH = "both"
+
+    @classmethod
+    def to_list(cls) -> list[str]:
+        """
+        Returns:
+            list code types.
+        """
+        return [e.value for e in cls]
+
+
 def get_target_files_by_path(
-    path: Path, exclude_patterns: list[str] | None = None
+    path: Path,
+    exclude_patterns: list[str] | None = None,
 ) -> list[Path]:
     """
     Get the target files by the specified path.
@@ -33,26 +63,157 @@ def get_target_files_by_path(
     Returns:
         list[Path]: The list of target files.
     """
+    return list(iter_target_files_by_path(path, exclude_patterns))
+
+
+def iter_target_files_by_path(
+    path: Path,
+    exclude_patterns: list[str] | None = None,
+) -> Iterator[Path]:
+    """
+    Iterate the target files by the specified path.
+
+    Unlike `get_target_files_by_path`, the files are yielded while the directory
+    is still being walked, so the caller can start processing the first files early.
+    The path is validated when this function is called.
+
+    Args:
+        path (Path): The path to the target file or directory.
+        exclude_patterns (list[str] | None): The exclude patterns.
+
+    Returns:
+        Iterator[Path]: The target files.
+
+    Raises:
+        ValueError: If the path is neither a directory nor a python file.
+    """
     if exclude_patterns is None:
         exclude_patterns = []
 
-    if path.is_dir():
-        all_files = [
-            Path(p)
-            for p in glob.glob(
-                os.path.join(path.as_posix(), "**", "*.py"), recursive=True
-            )
-        ]
-        return [f for f in all_files if not _is_excluded(f, exclude_patterns)]
-
-    if path.is_file() and path.suffix == ".py":
+    # A single stat tells both whether the path is a directory or a file and
+    # the identity of the root directory for the walk.
+    try:
+        root_stat = path.stat()
+    except (OSError, ValueError):
+        raise ValueError(f"Invalid path: {path}") from None
+
+    if S_ISDIR(root_stat.st_mode):
+        root_key = (root_stat.st_dev, root_stat.st_ino)
+        if not exclude_patterns:
+            return _walk_python_files(path.as_posix(), root_key, frozenset())
+        exclusions = _prepare_exclusions(tuple(exclude_patterns))
+        return (
+            f
+            for f in _walk_python_files(path.as_posix(), root_key, exclusions[0])
+            if not _is_excluded_by(f.as_posix(), exclusions)
+        )
+
+    if S_ISREG(root_stat.st_mode) and path.name.endswith(".py"):
         if _is_excluded(path, exclude_patterns):
-            return []
-        return [path]
+            return iter([])
+        return iter([path])
 
     raise ValueError(f"Invalid path: {path}")
 
 
+_DirKey = tuple[int, int]
+
+
+def _scan_directory(
+    dirpath: str, excluded_names: frozenset[str]
+) -> tuple[list[Path], list[tuple[str, _DirKey]]]:
+    """
+    List the python files and the subdirectories to descend into in one directory.
+
+    Like glob, hidden entries are skipped and symbolic links to directories are
+    followed. __pycache__ directories hold only bytecode and are skipped too. Directories whose name is in `excluded_names` are not returned,
+    since every file below them would be excluded anyway.
+
+    Args:
+        dirpath (str): The directory to scan.
+        excluded_names (frozenset[str]): The path segments to exclude.
+
+    Returns:
+        tuple[list[Path], list[tuple[str, _DirKey]]]: The python files and
+            the subdirectories with their (st_dev, st_ino) of the link target.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+
+    files = []
+    subdirs = []
+    for entry in entries:
+        if entry.name.startswith(".") or entry.name == "__pycache__":
+            continue
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name not in excluded_names:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                subdirs.append((entry.path, (stat.st_dev, stat.st_ino)))
+        elif entry.name.endswith(".py"):
+            files.append(Path(entry.path))
+    return files, subdirs
+
+
+def _walk_python_files(
+    dirpath: str,
+    root_key: _DirKey,
+    excluded_names: frozenset[str],
+    workers: int | None = None,
+) -> Iterator[Path]:
+    """
+    Walk the directory and yield the python files in the same order as
+    `glob.glob(os.path.join(dirpath, "**", "*.py"), recursive=True)`.
+
+    Directories are scanned in a thread pool as soon as they are found, so that
+    the waits on the file system overlap, and the results are yielded in
+    depth-first order. Pending scans are cancelled if the iteration stops early.
+
+    Unlike glob, a directory reached again through a symbolic link is walked only
+    once, so symlink loops terminate and no file is yielded twice. The file types
+    come from the directory entries, so no file is stat-ed.
+
+    Args:
+        dirpath (str): The directory to walk.
+        root_key (_DirKey): The (st_dev, st_ino) of the directory.
+        excluded_names (frozenset[str]): The path segments to exclude.
+        workers (int | None): The number of threads. If None, 4 times the number
+            of CPUs (up to 32).
+
+    Yields:
+        Path: The python file paths.
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+
+    visited: set[_DirKey] = {root_key}
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = [executor.submit(_scan_directory, dirpath, excluded_names)]
+        while pending:
+            files, subdirs = pending.pop().result()
+            futures = []
+            for subdir, key in subdirs:
+                if key in visited:
+                    continue
+                visited.add(key)
+                futures.append(executor.submit(_scan_directory, subdir, excluded_names))
+            pending.extend(reversed(futures))
+            yield from files
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
 def get_target_files_by_git_ls_files(
     repo_path: Path, exclude_patterns: list[str] | None = None
 ) -> list[Path]:
@@ -69,8 +230,17 @@ def get_target_files_by_git_ls_files(
     if exclude_patterns is None:
         exclude_patterns = []
 
-    all_files = [f for f in list_git_files(repo_path) if f.suffix == ".py"]
-    return [f for f in all_files if not _is_excluded(f, exclude_patterns)]
+    # Filter the raw names first and create Path objects only for the survivors.
+    names = list_git_file_names(repo_path)
+    if not exclude_patterns:
+        return [Path(name) for name in names if name.endswith(".py")]
+
+    exclusions = _prepare_exclusions(tuple(exclude_patterns))
+    return [
+        Path(name)
+        for name in names
+        if name.endswith(".py") and not _is_excluded_by(name, exclusions)
+    ]
 
 
 def _is_excluded(filepath: Path, exclude_patterns: list[str]) -> bool:
@@ -84,15 +254,130 @@ def _is_excluded(filepath: Path, exclude_patterns: list[str]) -> bool:
     Returns:
         bool: True if the file path should be excluded, otherwise False.
     """
-    file_str = filepath.as_posix()
-    return any(
-        fnmatch.fnmatch(file_str, pattern)
-        or fnmatch.fnmatch(str(filepath), pattern)
-        or pattern in file_str.split("/")
-        for pattern in exclude_patterns
+    if not exclude_patterns:
+        return False
+    return _is_excluded_by(
+        filepath.as_posix(), _prepare_exclusions(tuple(exclude_patterns))
     )
 
 
+_Exclusions = tuple[frozenset[str], "_PatternSet | None"]
+
+_GLOB_CHARS = frozenset("*?[/")
+
+
+@functools.lru_cache(maxsize=32)
+def _prepare_exclusions(exclude_patterns: tuple[str, ...]) -> _Exclusions:
+    """
+    Classify the exclude patterns once so that each file needs a single lookup.
+
+    A pattern without glob characters or "/" can only match a whole path that
+    consists of that single segment, which the segment check already covers,
+    so only the other patterns are compiled.
+
+    Args:
+        exclude_patterns (tuple[str, ...]): The exclude patterns.
+
+    Returns:
+        _Exclusions: The set of patterns to compare with each path segment and
+            the compiled glob patterns, or None if there is none.
+    """
+    glob_patterns = tuple(
+        pattern for pattern in exclude_patterns if not _GLOB_CHARS.isdisjoint(pattern)
+    )
+    compiled = _compile_patterns(glob_patterns) if glob_patterns else None
+    return frozenset(exclude_patterns), compiled
+
+
+def _is_excluded_by(file_str: str, exclusions: _Exclusions) -> bool:
+    """
+    Check whether the file path should be excluded by the prepared exclusions.
+
+    Args:
+        file_str (str): The POSIX style file path.
+        exclusions (_Exclusions): The exclusions prepared by `_prepare_exclusions`.
+
+    Returns:
+        bool: True if the file path should be excluded, otherwise False.
+    """
+    segments, glob_patterns = exclusions
+    if not segments.isdisjoint(file_str.split("/")):
+        return True
+    # fnmatch.fnmatch normalizes the case of both sides, so matching the normalized
+    # POSIX path also covers str(filepath) on platforms with a different separator.
+    return glob_patterns is not None and glob_patterns.match(os.path.normcase(file_str))
+
+
+_WILDCARD_SPLIT = re.compile(r"[*?]")
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Get the longest fixed substring that every match of the fnmatch pattern contains.
+
+    Patterns with character sets (`[...]`) return an empty string, since their
+    literal parts cannot be separated reliably.
+
+    Args:
+        pattern (str): The fnmatch pattern.
+
+    Returns:
+        str: The required substring. Empty if there is none.
+    """
+    if "[" in pattern:
+        return ""
+    return max(_WILDCARD_SPLIT.split(pattern), key=len)
+
+
+class _PatternSet:
+    """
+    A set of fnmatch patterns compiled for repeated matching.
+
+    Each pattern is compiled separately together with a substring that any match
+    must contain. The cheap substring check runs first, so that the regex of most
+    patterns is never evaluated. This is much faster than one alternation regex,
+    where every alternative starting with `*` scans the whole path.
+    """
+
+    __slots__ = ("_candidates",)
+
+    def __init__(self, patterns: tuple[str, ...]) -> None:
+        normalized = [os.path.normcase(pattern) for pattern in patterns]
+        self._candidates = tuple(
+            (_required_literal(pattern), re.compile(fnmatch.translate(pattern)))
+            for pattern in normalized
+        )
+
+    def match(self, file_str: str) -> bool:
+        """
+        Check whether the normalized file path matches any of the patterns.
+
+        Args:
+            file_str (str): The file path normalized by `os.path.normcase`.
+
+        Returns:
+            bool: True if any pattern matches, otherwise False.
+        """
+        for literal, regex in self._candidates:
+            if literal in file_str and regex.match(file_str) is not None:
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_patterns(patterns: tuple[str, ...]) -> _PatternSet:
+    """
+    Compile the fnmatch patterns for repeated matching.
+
+    Args:
+        patterns (tuple[str, ...]): The fnmatch patterns.
+
+    Returns:
+        _PatternSet: The compiled patterns that match if any pattern matches.
+    """
+    return _PatternSet(patterns)
+
+
 def _is_match(
     filepath: Path,
     patterns: list[str],
@@ -100,6 +385,9 @@ def _is_match(
     """
     Check whether the file path matches the patterns.
 
+    The result is the same as calling `fnmatch.fnmatch` for each pattern,
+    but the patterns are compiled once and reused.
+
     Args:
         filepath (Path): The file path.
         patterns (list[str]): The patterns.
@@ -107,7 +395,38 @@ def _is_match(
     Returns:
         bool: True if the file path matches the patterns, otherwise False.
     """
-    return any(fnmatch.fnmatch(filepath.as_posix(), pattern) for pattern in patterns)
+    if not patterns:
+        return False
+    return _compile_patterns(tuple(patterns)).match(
+        os.path.normcase(filepath.as_posix())
+    )
+
+
+def clear_caches() -> None:
+    """
+    Clear the caches of compiled patterns and prepared exclusions.
+    """
+    _compile_patterns.cache_clear()
+    _prepare_exclusions.cache_clear()
+
+
+def _is_tests_file(file_str: str) -> bool:
+    """
+    Check whether the file path matches TESTCODE_PATTERN_DEFAULT without fnmatch.
+
+    `*` in fnmatch also matches "/", so the default patterns are equivalent to
+    "a `tests` directory segment followed by a name containing a dot".
+
+    Args:
+        file_str (str): The POSIX style file path.
+
+    Returns:
+        bool: True if the file path matches the default test code patterns.
+    """
+    if file_str.startswith("tests/") and "." in file_str[len("tests/") :]:
+        return True
+    index = file_str.find("/tests/")
+    return index >= 0 and "." in file_str[index + len("/tests/") :]
 
 
 def get_code_type(filepath: Path, patterns: list[str]) -> CodeType:
@@ -121,7 +440,15 @@ def get_code_type(filepath: Path, patterns: list[str]) -> CodeType:
     Returns:
         CodeType: The code type.
     """
-    if _is_match(filepath, patterns):
+    if not patterns:
+        return CodeType.PRODUCT
+
+    if patterns == TESTCODE_PATTERN_DEFAULT:
+        is_test = _is_tests_file(filepath.as_posix())
+    else:
+        is_test = _is_match(filepath, patterns)
+
+    if is_test:
         return CodeType.TEST
     return CodeType.PRODUCT
 
@@ -137,7 +464,11 @@ def get_group_name(filepath: Path, user_groups: list[UserGroupConfig]) -> str:
     Returns:
         str: The group name. if the group name is not found, return "undefined".
     """
+    if not user_groups:
+        return "undefined"
+
+    file_str = os.path.normcase(filepath.as_posix())
     for group in user_groups:
-        if _is_match(filepath, group.patterns):
+        if group.patterns and _compile_patterns(tuple(group.patterns)).match(file_str):
             return group.name
     return "undefined"
@@ -0,0 +1,35 @@
+"""コミッター分析ハンドラーのテストモジュール。"""
+
+import datetime as dt
+from pathlib import Path
+
+from pycodemetrics.cli.analyze_committer import handler
+from pycodemetrics.services.analyze_committer import (
+    AnalizeCommitterSettings,
+    FilterCodeType,
+)
+
+_SETTINGS = AnalizeCommitterSettings(
+    base_datetime=dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc),
+    filter_code_type=FilterCodeType.BOTH,
+)
+
+
+def test_analyze_committer_metrics_falls_back_for_missing_file(mocker) -> None:
+    """一括取得したgitログにないファイルは、ファイルごとのgit logに任せることをテスト。"""
+    # Arrange
+    aggregate = mocker.patch.object(handler, "aggregate_changecount_by_committer")
+    gitlogs_by_file = {Path("a.py"): ["abc123,John Doe,2023-01-01 10:00:00 +0000,x"]}
+
+    # Act
+    handler._analyze_committer_metrics(
+        [Path("a.py"), Path("b.py")], Path("repo"), _SETTINGS, gitlogs_by_file
+    )
+
+    # Assert: b.pyにはNoneを渡し、aggregate_changecount_by_committerがget_file_gitlogsを呼ぶ
+    assert aggregate.call_args_list == [
+        mocker.call(
+            Path("a.py"), Path("repo"), _SETTINGS, gitlogs_by_file[Path("a.py")]
+        ),
+        mocker.call(Path("b.py"), Path("repo"), _SETTINGS, None),
+    ]
@@ -70,6 +70,41 @@ class TestRunAnalyzeHealth:
         # analyze_project_health が呼び出されたことを確認
         mock_analyze.assert_called_once()
 
+    @patch("pycodemetrics.cli.analyze_health.handler.analyze_project_health")
+    def test_settings_from_config_file(self, mock_analyze, tmp_path):
+        """設定ファイルの除外パターンとテストコードパターンが分析設定に渡されることのテスト。"""
+        # Arrange
+        config_path = tmp_path / "pyproject.toml"
+        config_path.write_text(
+            "[tool.pycodemetrics.groups.testcode]\n"
+            'pattern = ["spec/*"]\n'
+            "[tool.pycodemetrics.exclude]\n"
+            'pattern = ["temp/*"]\n'
+        )
+        mock_analyze.return_value = Mock(
+            overall_score=75,
+            code_quality_score=70,
+            architecture_score=80,
+            maintainability_score=75,
+            evolution_score=None,
+            critical_issues=[],
+            recommendations=[],
+        )
+        input_param = InputTargetParameter(path=tmp_path, config_file_path=config_path)
+
+        # Act
+        run_analyze_health(
+            input_param,
+            RuntimeParameter(workers=1),
+            DisplayParameter(format=DisplayFormat.DASHBOARD),
+            ExportParameter(export_file_path=None, overwrite=False),
+        )
+
+        # Assert
+        settings = mock_analyze.call_args.args[1]
+        assert settings.testcode_type_patterns == ["spec/*"]
+        assert settings.exclude_patterns == ["temp/*"]
+
 
 class TestParameterClasses:
     """パラメータクラスのテスト。"""
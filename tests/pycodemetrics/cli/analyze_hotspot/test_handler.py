@@ -0,0 +1,35 @@
+"""ホットスポット分析ハンドラーのテストモジュール。"""
+
+import datetime as dt
+from pathlib import Path
+
+from pycodemetrics.cli.analyze_hotspot import handler
+from pycodemetrics.services.analyze_hotspot import (
+    AnalizeHotspotSettings,
+    FilterCodeType,
+)
+
+_SETTINGS = AnalizeHotspotSettings(
+    base_datetime=dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc),
+    filter_code_type=FilterCodeType.BOTH,
+)
+
+
+def test_analyze_hotspot_metrics_falls_back_for_missing_file(mocker) -> None:
+    """一括取得したgitログにないファイルは、ファイルごとのgit logに任せることをテスト。"""
+    # Arrange
+    analyze = mocker.patch.object(handler, "analyze_hotspot_file")
+    gitlogs_by_file = {Path("a.py"): ["abc123,John Doe,2023-01-01 10:00:00 +0000,x"]}
+
+    # Act
+    handler._analyze_hotspot_metrics(
+        [Path("a.py"), Path("b.py")], Path("repo"), _SETTINGS, gitlogs_by_file
+    )
+
+    # Assert: b.pyにはNoneを渡し、analyze_hotspot_fileがget_file_gitlogsを呼ぶ
+    assert analyze.call_args_list == [
+        mocker.call(
+            Path("a.py"), Path("repo"), _SETTINGS, gitlogs_by_file[Path("a.py")]
+        ),
+        mocker.call(Path("b.py"), Path("repo"), _SETTINGS, None),
+    ]
@@ -4,11 +4,14 @@
 Pythonコードのメトリクス分析機能と、結果の表示・エクスポート機能を検証します。
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from pycodemetrics.cli.analyze_python import handler
 from pycodemetrics.cli.analyze_python.handler import (
     DisplayFormat,
     DisplayParameter,
@@ -17,7 +20,10 @@ from pycodemetrics.cli.analyze_python.handler import (
     RuntimeParameter,
     run_analyze_python_metrics,
 )
-from pycodemetrics.services.analyze_python_metrics import FilterCodeType
+from pycodemetrics.services.analyze_python_metrics import (
+    AnalyzePythonSettings,
+    FilterCodeType,
+)
 
 
 def test_run_analyze_python_metrics(
@@ -144,3 +150,117 @@ def example_function():
         "ファイル名が正しくありません"
     )
     assert df.iloc[0]["code_type"] == "product", "コードタイプが'product'ではありません"
+
+
+class _InFlightCountingExecutor(ThreadPoolExecutor):
+    """投入済みで未完了の解析数の最大値を記録するExecutor。"""
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[override]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+def test_analyze_python_files_by_content_bounds_pending_and_shares_results(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """内容ごとの解析で未完了の解析数が上限に抑えられ、結果が共有されることをテストします。
+
+    Arrange:
+        同一内容のファイルと解析に失敗するファイルを含むファイル群を作成
+        解析の呼び出しを記録するように差し替え
+
+    Act:
+        未完了の解析の上限を2にして解析を実行
+
+    Assert:
+        内容ごとに一度だけ解析されることを確認
+        同一内容のファイルにも結果が割り当てられることを確認
+        解析に失敗したファイルは結果に含まれず、進捗は全件に達することを確認
+    """
+    # Arrange
+    contents = [f"value_{i} = {i}\n" for i in range(8)] * 2 + ["broken\n"] * 2
+    filepaths = []
+    for i, content in enumerate(contents):
+        filepath = tmp_path / f"module{i}.py"
+        filepath.write_text(content)
+        filepaths.append(filepath)
+
+    analyze_python_code = handler.analyze_python_code
+    analyzed: list[Path] = []
+
+    def fake_analyze_python_code(filepath, code, settings):
+        analyzed.append(filepath)
+        if code == "broken\n":
+            raise SyntaxError("broken")
+        return analyze_python_code(filepath, code, settings)
+
+    monkeypatch.setattr(handler, "analyze_python_code", fake_analyze_python_code)
+
+    # Act
+    with _InFlightCountingExecutor(max_workers=2) as executor:
+        results = handler._analyze_python_files_by_content(
+            filepaths, AnalyzePythonSettings(), executor, max_pending=2
+        )
+
+    # Assert
+    assert len(analyzed) == 9
+    assert executor.max_in_flight <= 2
+    assert sorted(r.filepath for r in results) == sorted(filepaths[:16])
+    assert f"{len(filepaths)}/{len(filepaths)}" in capsys.readouterr().err
+
+
+def test_analyze_python_metrics_shares_results_of_identical_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """逐次の解析でも、内容が同一のファイルは一度だけ解析されることをテストします。
+
+    Arrange:
+        同一内容のファイルと読み込めないファイルを含むファイル群を用意
+        解析の呼び出しを記録するように差し替え
+
+    Act:
+        逐次で解析を実行
+
+    Assert:
+        内容ごとに一度だけ解析されることを確認
+        読み込めないファイル以外のすべてのファイルに結果が割り当てられることを確認
+    """
+    # Arrange
+    filepaths = []
+    for i, content in enumerate(["", "a = 1\n", "", "a = 1\n"]):
+        filepath = tmp_path / f"module{i}.py"
+        filepath.write_text(content)
+        filepaths.append(filepath)
+    filepaths.append(tmp_path / "missing.py")
+
+    analyze_python_code = handler.analyze_python_code
+    analyzed: list[Path] = []
+
+    def fake_analyze_python_code(filepath, code, settings):
+        analyzed.append(filepath)
+        return analyze_python_code(filepath, code, settings)
+
+    monkeypatch.setattr(handler, "analyze_python_code", fake_analyze_python_code)
+
+    # Act
+    results = handler._analyze_python_metrics(
+        filepaths, AnalyzePythonSettings(filter_code_type=FilterCodeType.BOTH)
+    )
+
+    # Assert
+    assert analyzed == filepaths[:2]
+    assert [r.filepath for r in results] == filepaths[:4]
@@ -1,10 +1,9 @@
 """Tests for config_manager module."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
-import toml
 
 from pycodemetrics.config.config_manager import (
     EXCLUDE_PATTERN_DEFAULT,
@@ -15,6 +14,11 @@ from pycodemetrics.config.config_manager import (
 )
 
 
+def _render_exclude_toml(patterns: list[str]) -> str:
+    """Render a config file that only sets the exclude patterns."""
+    return f"[tool.pycodemetrics.exclude]\npattern = {patterns!r}\n"
+
+
 class TestConfigManager:
     """Test cases for ConfigManager class."""
 
@@ -28,15 +32,8 @@ class TestConfigManager:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        try:
-            patterns = ConfigManager.get_testcode_type_patterns(config_path)
-            assert patterns == ["custom/tests/*", "spec/*"]
-        finally:
-            config_path.unlink()
+        patterns = ConfigManager._load_testcode_pattern(config_data)
+        assert patterns == ["custom/tests/*", "spec/*"]
 
     def test_get_testcode_type_patterns_with_nonexistent_config(self):
         """Test get_testcode_type_patterns with non-existent config file."""
@@ -48,15 +45,8 @@ class TestConfigManager:
         """Test get_testcode_type_patterns with config missing the testcode key."""
         config_data = {"tool": {"pycodemetrics": {"groups": {}}}}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        try:
-            patterns = ConfigManager.get_testcode_type_patterns(config_path)
-            assert patterns == TESTCODE_PATTERN_DEFAULT
-        finally:
-            config_path.unlink()
+        patterns = ConfigManager._load_testcode_pattern(config_data)
+        assert patterns == TESTCODE_PATTERN_DEFAULT
 
     def test_get_user_groups_with_valid_config(self):
         """Test get_user_groups with valid config file."""
@@ -73,21 +63,12 @@ class TestConfigManager:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        try:
-            user_groups = ConfigManager.get_user_groups(config_path)
-            assert len(user_groups) == 2
-
-            frontend_group = next(g for g in user_groups if g.name == "frontend")
-            assert frontend_group.patterns == ["src/frontend/*", "web/*"]
+        user_groups = ConfigManager._load_user_groups(config_data)
+        assert len(user_groups) == 2
 
-            backend_group = next(g for g in user_groups if g.name == "backend")
-            assert backend_group.patterns == ["src/backend/*", "api/*"]
-        finally:
-            config_path.unlink()
+        by_name = {g.name: g for g in user_groups}
+        assert by_name["frontend"].patterns == ["src/frontend/*", "web/*"]
+        assert by_name["backend"].patterns == ["src/backend/*", "api/*"]
 
     def test_get_user_groups_with_nonexistent_config(self):
         """Test get_user_groups with non-existent config file."""
@@ -99,15 +80,8 @@ class TestConfigManager:
         """Test get_user_groups with config missing the user groups key."""
         config_data = {"tool": {"pycodemetrics": {"groups": {}}}}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        try:
-            user_groups = ConfigManager.get_user_groups(config_path)
-            assert user_groups == USER_GROUPS_DEFAULT
-        finally:
-            config_path.unlink()
+        user_groups = ConfigManager._load_user_groups(config_data)
+        assert user_groups == USER_GROUPS_DEFAULT
 
     def test_get_exclude_patterns_with_valid_config(self):
         """Test get_exclude_patterns with valid config file."""
@@ -119,15 +93,8 @@ class TestConfigManager:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        try:
-            patterns = ConfigManager.get_exclude_patterns(config_path)
-            assert patterns == ["custom_exclude/*", "temp/*", ".custom"]
-        finally:
-            config_path.unlink()
+        patterns = ConfigManager._load_exclude_pattern(config_data)
+        assert patterns == ["custom_exclude/*", "temp/*", ".custom"]
 
     def test_get_exclude_patterns_with_nonexistent_config(self):
         """Test get_exclude_patterns with non-existent config file."""
@@ -139,31 +106,67 @@ class TestConfigManager:
         """Test get_exclude_patterns with config missing the exclude key."""
         config_data = {"tool": {"pycodemetrics": {}}}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            toml.dump(config_data, f)
-            config_path = Path(f.name)
-
-        try:
-            patterns = ConfigManager.get_exclude_patterns(config_path)
-            assert patterns == EXCLUDE_PATTERN_DEFAULT
-        finally:
-            config_path.unlink()
+        patterns = ConfigManager._load_exclude_pattern(config_data)
+        assert patterns == EXCLUDE_PATTERN_DEFAULT
 
     def test_get_exclude_patterns_default_values(self):
         """Test that EXCLUDE_PATTERN_DEFAULT contains expected patterns."""
-        assert "__pycache__" in EXCLUDE_PATTERN_DEFAULT
-        assert ".git" in EXCLUDE_PATTERN_DEFAULT
-        assert ".venv" in EXCLUDE_PATTERN_DEFAULT
-        assert "venv" in EXCLUDE_PATTERN_DEFAULT
-        assert "env" in EXCLUDE_PATTERN_DEFAULT
-        assert "ENV" in EXCLUDE_PATTERN_DEFAULT
-        assert ".env" in EXCLUDE_PATTERN_DEFAULT
-        assert "node_modules" in EXCLUDE_PATTERN_DEFAULT
-        assert ".pytest_cache" in EXCLUDE_PATTERN_DEFAULT
-        assert "site-packages" in EXCLUDE_PATTERN_DEFAULT
-        assert "dist" in EXCLUDE_PATTERN_DEFAULT
-        assert "build" in EXCLUDE_PATTERN_DEFAULT
-        assert ".tox" in EXCLUDE_PATTERN_DEFAULT
+        expected = {
+            "__pycache__",
+            ".git",
+            ".venv",
+            "venv",
+            "env",
+            "ENV",
+            ".env",
+            "node_modules",
+            ".pytest_cache",
+            "site-packages",
+            "dist",
+            "build",
+            ".tox",
+        }
+        assert expected.issubset(EXCLUDE_PATTERN_DEFAULT)
+
+    def test_get_config_from_file(self, tmp_path):
+        """Test that every getter reads its settings from the config file."""
+        config_path = tmp_path / "pyproject.toml"
+        config_path.write_text(
+            "[tool.pycodemetrics.groups.testcode]\n"
+            'pattern = ["spec/*"]\n'
+            "[tool.pycodemetrics.groups.user]\n"
+            'backend = ["api/*"]\n'
+            "[tool.pycodemetrics.exclude]\n"
+            'pattern = ["temp/*"]\n'
+        )
+
+        assert ConfigManager.get_testcode_type_patterns(config_path) == ["spec/*"]
+        assert ConfigManager.get_exclude_patterns(config_path) == ["temp/*"]
+        assert ConfigManager.get_user_groups(config_path) == [
+            UserGroupConfig(name="backend", patterns=["api/*"])
+        ]
+
+    def test_get_config_reloads_modified_file(self, tmp_path):
+        """Test that the config file is parsed again after it is modified."""
+        config_path = tmp_path / "pyproject.toml"
+        config_path.write_text(_render_exclude_toml(["a"]))
+        assert ConfigManager.get_exclude_patterns(config_path) == ["a"]
+
+        config_path.write_text(_render_exclude_toml(["a", "b"]))
+
+        assert ConfigManager.get_exclude_patterns(config_path) == ["a", "b"]
+
+    def test_get_config_reloads_replaced_file(self, tmp_path):
+        """Test that a config file replaced by one of the same size is parsed again."""
+        config_path = tmp_path / "pyproject.toml"
+        config_path.write_text(_render_exclude_toml(["a"]))
+        assert ConfigManager.get_exclude_patterns(config_path) == ["a"]
+
+        replacement = tmp_path / "pyproject.toml.new"
+        replacement.write_text(_render_exclude_toml(["b"]))
+        os.replace(replacement, config_path)
+
+        assert ConfigManager.get_exclude_patterns(config_path) == ["b"]
 
 
 class TestUserGroupConfig:
@@ -2,19 +2,33 @@
 
 import subprocess
 import tempfile
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from pycodemetrics.gitclient.gitcli import (
     _check_git_repo,
     _run_command,
+    get_all_file_gitlogs,
     get_file_gitlogs,
     get_gitlogs,
+    list_git_file_names,
     list_git_files,
 )
 
+_EXPECTED_GIT_LOG_CMD = "git log --pretty=format:'%h,%aN,%ad,%s' --date=iso"
+_EXPECTED_GIT_LOG_FILE_CMD_TMPL = _EXPECTED_GIT_LOG_CMD + " -- {}"
+_EXPECTED_GIT_LOG_NAME_ONLY_CMD = (
+    "git -c core.quotePath=false log --name-only --no-renames -c"
+    " --pretty=format:'%x00%H %h,%aN,%ad,%s' --date=iso"
+)
+_EXPECTED_GIT_REV_LIST_FIRST_PARENT_CMD = "git rev-list --first-parent HEAD"
+_TMP_DIR = Path("/tmp")
+_CURRENT_DIR = Path("/current/dir")
+_EXPECTED_FILES = (Path("file1.py"), Path("file2.py"), Path("file3.txt"), Path(""))
+
 
 class TestCheckGitRepo:
     """_check_git_repo関数のテストクラス。"""
@@ -38,231 +52,345 @@ class TestCheckGitRepo:
                 _check_git_repo(repo_path)
 
 
+class _FakeProc:
+    """subprocess.Popenの代わりに使う軽量なプロセスのフェイク。"""
+
+    def __init__(
+        self, returncode: int, out: bytes, err: bytes, raise_timeout: bool = False
+    ) -> None:
+        self.returncode = returncode
+        self._out = out
+        self._err = err
+        self._raise_timeout = raise_timeout
+        self.timeouts: list[int | None] = []
+        self.kill_count = 0
+
+    def communicate(self, timeout: int | None = None) -> tuple[bytes, bytes]:
+        self.timeouts.append(timeout)
+        if self._raise_timeout:
+            raise subprocess.TimeoutExpired("cmd", timeout or 0)
+        return self._out, self._err
+
+    def kill(self) -> None:
+        self.kill_count += 1
+
+
+def _patch_popen(monkeypatch: pytest.MonkeyPatch, proc: _FakeProc) -> list[tuple]:
+    """subprocess.Popenがprocを返すように差し替え、呼び出しの記録を返す。"""
+    calls: list[tuple] = []
+
+    def fake_popen(*args: object, **kwargs: object) -> _FakeProc:
+        calls.append((args, kwargs))
+        return proc
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+    return calls
+
+
 class TestRunCommand:
     """_run_command関数のテストクラス。"""
 
-    @patch("subprocess.Popen")
-    def test_run_command_success(self, mock_popen: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        "out, kwargs, expected",
+        [
+            (b"line1\nline2\nline3", {}, ["line1", "line2", "line3"]),
+            ("テスト".encode("shift_jis"), {"encording": "shift_jis"}, ["テスト"]),
+        ],
+        ids=["success", "custom_encoding"],
+    )
+    def test_run_command_success(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        out: bytes,
+        kwargs: dict[str, str],
+        expected: list[str],
+    ) -> None:
         """コマンド成功時のテスト。"""
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"line1\nline2\nline3", b"")
-        mock_popen.return_value = mock_process
+        calls = _patch_popen(monkeypatch, _FakeProc(0, out, b""))
 
-        result = _run_command("echo test", Path("/tmp"))
+        result = _run_command("echo test", _TMP_DIR, **kwargs)
 
-        assert result == ["line1", "line2", "line3"]
-        mock_popen.assert_called_once()
+        assert result == expected
+        assert len(calls) == 1
 
-    @patch("subprocess.Popen")
-    def test_run_command_failure(self, mock_popen: MagicMock) -> None:
+    def test_run_command_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """コマンド失敗時のテスト。"""
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.communicate.return_value = (b"", b"Error message")
-        mock_popen.return_value = mock_process
+        _patch_popen(monkeypatch, _FakeProc(1, b"", b"Error message"))
 
         with pytest.raises(ValueError, match="Error running command"):
-            _run_command("false", Path("/tmp"))
+            _run_command("false", _TMP_DIR)
 
-    @patch("subprocess.Popen")
-    def test_run_command_timeout(self, mock_popen: MagicMock) -> None:
+    def test_run_command_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """コマンドタイムアウト時のテスト。"""
-        mock_process = MagicMock()
-        mock_process.communicate.side_effect = subprocess.TimeoutExpired("cmd", 1)
-        mock_popen.return_value = mock_process
+        proc = _FakeProc(0, b"", b"", raise_timeout=True)
+        _patch_popen(monkeypatch, proc)
 
         with pytest.raises(TimeoutError, match="Timeout running command"):
-            _run_command("sleep 10", Path("/tmp"), timeout_seconds=1)
+            _run_command("sleep 10", _TMP_DIR, timeout_seconds=1)
 
-        mock_process.kill.assert_called_once()
+        assert proc.kill_count == 1
 
-    @patch("subprocess.Popen")
-    def test_run_command_with_timeout_success(self, mock_popen: MagicMock) -> None:
+    def test_run_command_with_timeout_success(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """タイムアウト指定でコマンド成功時のテスト。"""
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"output", b"")
-        mock_popen.return_value = mock_process
+        proc = _FakeProc(0, b"output", b"")
+        _patch_popen(monkeypatch, proc)
 
-        result = _run_command("echo test", Path("/tmp"), timeout_seconds=5)
+        result = _run_command("echo test", _TMP_DIR, timeout_seconds=5)
 
         assert result == ["output"]
-        mock_process.communicate.assert_called_with(timeout=5)
+        assert proc.timeouts[-1] == 5
+
+
+@pytest.fixture
+def git_mocks() -> Iterator[tuple[MagicMock, MagicMock]]:
+    """_run_commandと_check_git_repoをモックするフィクスチャ。"""
+    with (
+        patch("pycodemetrics.gitclient.gitcli._run_command") as mock_run_command,
+        patch("pycodemetrics.gitclient.gitcli._check_git_repo") as mock_check_git_repo,
+    ):
+        yield mock_run_command, mock_check_git_repo
+
+
+@pytest.mark.parametrize(
+    "call, return_value, expected",
+    [
+        (lambda: list_git_files(), ["test.py"], [Path("test.py")]),
+        (lambda: get_file_gitlogs(Path("test.py")), ["commit1"], ["commit1"]),
+        (lambda: get_gitlogs(), ["commit1", "commit2"], ["commit1", "commit2"]),
+    ],
+    ids=["list_git_files", "get_file_gitlogs", "get_gitlogs"],
+)
+def test_default_path_is_current_directory(
+    git_mocks: tuple[MagicMock, MagicMock],
+    monkeypatch: pytest.MonkeyPatch,
+    call: Callable[[], list],
+    return_value: list[str],
+    expected: list,
+) -> None:
+    """デフォルトパス（現在のディレクトリ）でのテスト。"""
+    mock_run_command, mock_check_git_repo = git_mocks
+    mock_run_command.return_value = return_value
 
-    @patch("subprocess.Popen")
-    def test_run_command_custom_encoding(self, mock_popen: MagicMock) -> None:
-        """カスタムエンコーディング指定時のテスト。"""
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = ("テスト".encode("shift_jis"), b"")
-        mock_popen.return_value = mock_process
+    monkeypatch.setattr(Path, "cwd", staticmethod(lambda: _CURRENT_DIR))
 
-        result = _run_command("echo test", Path("/tmp"), encording="shift_jis")
+    result = call()
 
-        assert result == ["テスト"]
+    assert result == expected
+    mock_check_git_repo.assert_called_once_with(_CURRENT_DIR)
 
 
 class TestListGitFiles:
     """list_git_files関数のテストクラス。"""
 
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
     def test_list_git_files_success(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
+        self, git_mocks: tuple[MagicMock, MagicMock], tmp_path: Path
     ) -> None:
         """git ls-files成功時のテスト。"""
+        mock_run_command, mock_check_git_repo = git_mocks
         mock_run_command.return_value = ["file1.py", "file2.py", "file3.txt", ""]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir)
-            result = list_git_files(repo_path)
-
-            assert result == [
-                Path("file1.py"),
-                Path("file2.py"),
-                Path("file3.txt"),
-                Path(""),
-            ]
-            mock_check_git_repo.assert_called_once_with(repo_path)
-            mock_run_command.assert_called_once_with("git ls-files", repo_path, "utf-8")
-
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
-    def test_list_git_files_default_path(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
-    ) -> None:
-        """デフォルトパス（現在のディレクトリ）でのテスト。"""
-        mock_run_command.return_value = ["test.py"]
-
-        with patch("pathlib.Path.cwd") as mock_cwd:
-            mock_cwd.return_value = Path("/current/dir")
-            result = list_git_files()
+        result = list_git_files(tmp_path)
 
-            assert result == [Path("test.py")]
-            mock_check_git_repo.assert_called_once_with(Path("/current/dir"))
+        assert tuple(result) == _EXPECTED_FILES
+        mock_check_git_repo.assert_called_once_with(tmp_path)
+        mock_run_command.assert_called_once_with("git ls-files", tmp_path, "utf-8")
 
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    def test_list_git_files_not_git_repo(self, mock_check_git_repo: MagicMock) -> None:
+    def test_list_git_files_not_git_repo(
+        self, git_mocks: tuple[MagicMock, MagicMock], tmp_path: Path
+    ) -> None:
         """Gitリポジトリでない場合のテスト。"""
+        _, mock_check_git_repo = git_mocks
         mock_check_git_repo.side_effect = ValueError("Not a git repository")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir)
+        with pytest.raises(ValueError, match="Not a git repository"):
+            list_git_files(tmp_path)
 
-            with pytest.raises(ValueError, match="Not a git repository"):
-                list_git_files(repo_path)
+
+class TestListGitFileNames:
+    """list_git_file_names関数のテストクラス。"""
+
+    def test_list_git_file_names_success(
+        self, git_mocks: tuple[MagicMock, MagicMock], tmp_path: Path
+    ) -> None:
+        """git ls-files -z成功時のテスト。"""
+        mock_run_command, mock_check_git_repo = git_mocks
+        mock_run_command.return_value = ["file1.py", "dir/file 2.py", ""]
+
+        result = list_git_file_names(tmp_path)
+
+        assert result == ["file1.py", "dir/file 2.py"]
+        mock_check_git_repo.assert_called_once_with(tmp_path)
+        mock_run_command.assert_called_once_with(
+            "git ls-files -z", tmp_path, "utf-8", separator="\x00"
+        )
 
 
 class TestGetFileGitlogs:
     """get_file_gitlogs関数のテストクラス。"""
 
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
     def test_get_file_gitlogs_success(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
+        self, git_mocks: tuple[MagicMock, MagicMock], tmp_path: Path
     ) -> None:
         """ファイルのgitログ取得成功時のテスト。"""
+        mock_run_command, mock_check_git_repo = git_mocks
         mock_run_command.return_value = [
             "abc123,John Doe,2023-01-01 10:00:00 +0000,Initial commit",
             "def456,Jane Smith,2023-01-02 11:00:00 +0000,Fix bug",
         ]
+        file_path = Path("test.py")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir)
-            file_path = Path("test.py")
-
-            result = get_file_gitlogs(file_path, repo_path)
-
-            assert len(result) == 2
-            assert "abc123,John Doe" in result[0]
-            assert "def456,Jane Smith" in result[1]
-            mock_check_git_repo.assert_called_once_with(repo_path)
-            mock_run_command.assert_called_once_with(
-                f"git log --pretty=format:'%h,%aN,%ad,%s' --date=iso -- {file_path}",
-                repo_path,
-                "utf-8",
-            )
-
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
-    def test_get_file_gitlogs_default_path(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
-    ) -> None:
-        """デフォルトパスでのファイルgitログ取得テスト。"""
-        mock_run_command.return_value = ["commit1"]
-
-        with patch("pathlib.Path.cwd") as mock_cwd:
-            mock_cwd.return_value = Path("/current/dir")
-            file_path = Path("test.py")
-
-            result = get_file_gitlogs(file_path)
+        result = get_file_gitlogs(file_path, tmp_path)
 
-            assert result == ["commit1"]
-            mock_check_git_repo.assert_called_once_with(Path("/current/dir"))
+        assert len(result) == 2
+        assert "abc123,John Doe" in result[0]
+        assert "def456,Jane Smith" in result[1]
+        mock_check_git_repo.assert_called_once_with(tmp_path)
+        mock_run_command.assert_called_once_with(
+            _EXPECTED_GIT_LOG_FILE_CMD_TMPL.format(file_path),
+            tmp_path,
+            "utf-8",
+        )
 
 
 class TestGetGitlogs:
     """get_gitlogs関数のテストクラス。"""
 
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
+    @pytest.mark.parametrize(
+        "kwargs, expected_encoding",
+        [({}, "utf-8"), ({"encoding": "shift_jis"}, "shift_jis")],
+        ids=["default_encoding", "custom_encoding"],
+    )
     def test_get_gitlogs_success(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
+        self,
+        git_mocks: tuple[MagicMock, MagicMock],
+        tmp_path: Path,
+        kwargs: dict[str, str],
+        expected_encoding: str,
     ) -> None:
         """全gitログ取得成功時のテスト。"""
+        mock_run_command, mock_check_git_repo = git_mocks
         mock_run_command.return_value = [
             "abc123,John Doe,2023-01-01 10:00:00 +0000,Initial commit",
             "def456,Jane Smith,2023-01-02 11:00:00 +0000,Add feature",
             "ghi789,Bob Wilson,2023-01-03 12:00:00 +0000,Fix bug",
         ]
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir)
-
-            result = get_gitlogs(repo_path)
-
-            assert len(result) == 3
-            assert "abc123,John Doe" in result[0]
-            assert "def456,Jane Smith" in result[1]
-            assert "ghi789,Bob Wilson" in result[2]
-            mock_check_git_repo.assert_called_once_with(repo_path)
-            mock_run_command.assert_called_once_with(
-                "git log --pretty=format:'%h,%aN,%ad,%s' --date=iso", repo_path, "utf-8"
-            )
-
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
-    def test_get_gitlogs_default_path(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
-    ) -> None:
-        """デフォルトパスでの全gitログ取得テスト。"""
-        mock_run_command.return_value = ["commit1", "commit2"]
+        result = get_gitlogs(tmp_path, **kwargs)
 
-        with patch("pathlib.Path.cwd") as mock_cwd:
-            mock_cwd.return_value = Path("/current/dir")
+        assert len(result) == 3
+        assert "abc123,John Doe" in result[0]
+        assert "def456,Jane Smith" in result[1]
+        assert "ghi789,Bob Wilson" in result[2]
+        mock_check_git_repo.assert_called_once_with(tmp_path)
+        mock_run_command.assert_called_once_with(
+            _EXPECTED_GIT_LOG_CMD,
+            tmp_path,
+            expected_encoding,
+        )
 
-            result = get_gitlogs()
 
-            assert result == ["commit1", "commit2"]
-            mock_check_git_repo.assert_called_once_with(Path("/current/dir"))
+class TestGetAllFileGitlogs:
+    """get_all_file_gitlogs関数のテストクラス。"""
 
-    @patch("pycodemetrics.gitclient.gitcli._check_git_repo")
-    @patch("pycodemetrics.gitclient.gitcli._run_command")
-    def test_get_gitlogs_custom_encoding(
-        self, mock_run_command: MagicMock, mock_check_git_repo: MagicMock
+    def test_get_all_file_gitlogs_buckets_by_file(
+        self, git_mocks: tuple[MagicMock, MagicMock], tmp_path: Path
     ) -> None:
-        """カスタムエンコーディングでのgitログ取得テスト。"""
-        mock_run_command.return_value = ["commit1"]
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir)
+        """コミットごとの変更ファイルでgitログが振り分けられることのテスト。"""
+        mock_run_command, mock_check_git_repo = git_mocks
+        mock_run_command.side_effect = [
+            ["def4567890", "abc1234567"],
+            [
+                "\x00def4567890 def456,Jane Smith,2023-01-02 11:00:00 +0000,Fix bug, again",
+                "a.py",
+                "b.py",
+                "",
+                "\x00abc1234567 abc123,John Doe,2023-01-01 10:00:00 +0000,Initial commit",
+                "a.py",
+            ],
+        ]
 
-            result = get_gitlogs(repo_path, encoding="shift_jis")
+        result = get_all_file_gitlogs(tmp_path)
+
+        assert result == {
+            Path("a.py"): [
+                "def456,Jane Smith,2023-01-02 11:00:00 +0000,Fix bug, again",
+                "abc123,John Doe,2023-01-01 10:00:00 +0000,Initial commit",
+            ],
+            Path("b.py"): [
+                "def456,Jane Smith,2023-01-02 11:00:00 +0000,Fix bug, again",
+            ],
+        }
+        mock_check_git_repo.assert_called_once_with(tmp_path)
+        assert mock_run_command.call_args_list == [
+            call(_EXPECTED_GIT_REV_LIST_FIRST_PARENT_CMD, tmp_path, "utf-8"),
+            call(_EXPECTED_GIT_LOG_NAME_ONLY_CMD, tmp_path, "utf-8"),
+        ]
 
-            assert result == ["commit1"]
-            mock_run_command.assert_called_once_with(
-                "git log --pretty=format:'%h,%aN,%ad,%s' --date=iso",
-                repo_path,
-                "shift_jis",
-            )
+    def test_get_all_file_gitlogs_non_ascii_path_matches_ls_files(
+        self, tmp_path: Path
+    ) -> None:
+        """非ASCIIのパスがgit ls-files -zと同じキーで振り分けられることのテスト。"""
+        # Arrange: 非ASCIIのファイル名をコミットした実リポジトリを用意
+        git = ["git", "-c", "user.name=Tester", "-c", "user.email=tester@example.com"]
+        subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "日本.py").write_text("x = 1\n", encoding="utf-8")
+        subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "add"], cwd=tmp_path, check=True)
+
+        # Act
+        result = get_all_file_gitlogs(tmp_path)
+
+        # Assert
+        assert list_git_file_names(tmp_path) == ["src/日本.py"]
+        assert list(result) == [Path("src/日本.py")]
+        assert len(result[Path("src/日本.py")]) == 1
+
+    def test_get_all_file_gitlogs_matches_per_file_logs_on_merged_history(
+        self, tmp_path: Path
+    ) -> None:
+        """マージを含む履歴でも、結果のgitログがファイルごとのgit logと一致することのテスト。"""
+        # Arrange: a.pyの変更を捨てるマージ、b.pyの変更を取り込むマージ、
+        # c.pyとd.pyを両方の親と異なる内容にするマージを含む実リポジトリを用意
+        git = ["git", "-c", "user.name=Tester", "-c", "user.email=tester@example.com"]
+
+        def run(*args: str) -> None:
+            subprocess.run([*git, *args], cwd=tmp_path, check=True)
+
+        def commit(message: str, **files: str) -> None:
+            for name, content in files.items():
+                (tmp_path / f"{name}.py").write_text(content)
+            run("commit", "-q", "-a", "-m", message)
+
+        run("init", "-q", "-b", "main")
+        for name in ("a", "b", "c", "d"):
+            (tmp_path / f"{name}.py").write_text("1\n")
+        run("add", ".")
+        run("commit", "-q", "-m", "init")
+        run("checkout", "-q", "-b", "side1")
+        commit("side1", a="2\n")
+        run("checkout", "-q", "main")
+        run("merge", "-q", "-s", "ours", "side1", "-m", "merge side1")
+        run("checkout", "-q", "-b", "side2")
+        commit("side2", b="2\n")
+        run("checkout", "-q", "main")
+        commit("main c", c="2\n")
+        run("merge", "-q", "--no-ff", "side2", "-m", "merge side2")
+        run("checkout", "-q", "-b", "side3")
+        commit("side3", b="3\n")
+        run("checkout", "-q", "main")
+        commit("main d", d="2\n")
+        run("merge", "-q", "--no-commit", "side3")
+        commit("evil merge", c="3\n", d="3\n")
+
+        # Act
+        result = get_all_file_gitlogs(tmp_path)
+
+        # Assert: 側枝のコミットが変更したファイルは除外され、それ以外はファイルごとのgit logと一致する
+        assert sorted(result) == [Path("c.py"), Path("d.py")]
+        for filepath in (Path("c.py"), Path("d.py")):
+            assert result[filepath] == get_file_gitlogs(filepath, tmp_path)
+        assert len(result[Path("d.py")]) == 3
+        assert len(get_file_gitlogs(Path("a.py"), tmp_path)) == 1
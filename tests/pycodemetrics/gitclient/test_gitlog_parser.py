@@ -1,6 +1,8 @@
 import datetime as dt
 from pathlib import Path
 
+import pytest
+
 from pycodemetrics.gitclient.gitlog_parser import parse_gitlogs
 from pycodemetrics.gitclient.models import GitFileCommitLog
 
@@ -51,3 +53,46 @@ def test_parse_gitlogs():
 
     # Assert: 解析結果が期待される結果と一致することを確認
     assert actual_logs == expected_logs
+
+
+@pytest.mark.parametrize(
+    "raw, commit_hash, author, commit_date, message",
+    [
+        (
+            "abc123,John Doe,2023-10-01 12:00:00 +0000,Initial commit",
+            "abc123",
+            "John Doe",
+            dt.datetime(2023, 10, 1, 12, 0, 0, tzinfo=dt.timezone.utc),
+            "Initial commit",
+        ),
+        (
+            "def456,Jane Smith,2023-10-02 13:30:00 +0000,Added new feature",
+            "def456",
+            "Jane Smith",
+            dt.datetime(2023, 10, 2, 13, 30, 0, tzinfo=dt.timezone.utc),
+            "Added new feature",
+        ),
+        (
+            "789abc,山田 太郎,2023-10-03 09:00:00 +0900,Fix bug, again",
+            "789abc",
+            "山田 太郎",
+            dt.datetime(2023, 10, 3, 0, 0, 0, tzinfo=dt.timezone.utc),
+            "Fix bug, again",
+        ),
+    ],
+    ids=["initial_commit", "feature_commit", "comma_in_message_and_offset"],
+)
+def test_parse_gitlogs_line(raw, commit_hash, author, commit_date, message):
+    """parse_gitlogs関数がGitログの1行をフィールドごとに正しく解析することを確認する。"""
+    # Arrange
+    git_file_path = Path("path/to/file.py")
+
+    # Act
+    actual = parse_gitlogs(git_file_path, [raw])[0]
+
+    # Assert
+    assert actual.filepath == git_file_path
+    assert actual.commit_hash == commit_hash
+    assert actual.author == author
+    assert actual.commit_date == commit_date
+    assert actual.message == message
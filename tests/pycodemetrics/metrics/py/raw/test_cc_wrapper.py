@@ -1,6 +1,7 @@
 from pycodemetrics.metrics.py.raw.cc_wrapper import (
     FunctionCognitiveComplexity,
     get_function_cognitive_complexity,
+    get_total_cognitive_complexity,
 )
 
 
@@ -53,3 +54,51 @@ async def async_function():
     ]
     result = get_function_cognitive_complexity(code)
     assert result == expected
+
+
+def test_total_matches_sum_of_functions():
+    # Arrange
+    code = """
+class ExampleClass:
+    def method(self):
+        if True:
+            return 1
+        return 0
+
+async def async_function():
+    for _ in range(3):
+        if True:
+            pass
+"""
+
+    # Act
+    result = get_total_cognitive_complexity(code)
+
+    # Assert
+    expected = sum(c.complexity for c in get_function_cognitive_complexity(code))
+    assert result == expected
+
+
+def test_functions_nested_in_compound_statements():
+    # Arrange
+    code = """
+try:
+    def in_try():
+        pass
+except ImportError:
+    def in_except():
+        pass
+
+match value:
+    case 1:
+        def in_case():
+            pass
+
+callback = lambda: None
+"""
+
+    # Act
+    result = get_function_cognitive_complexity(code)
+
+    # Assert
+    assert [c.function_name for c in result] == ["in_try", "in_except", "in_case"]
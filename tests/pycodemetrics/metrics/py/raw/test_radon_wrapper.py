@@ -1,4 +1,5 @@
 from pycodemetrics.metrics.py.raw.radon_wrapper import (
+    get_block_complexity,
     get_complexity,
     get_maintainability_index,
 )
@@ -44,3 +45,21 @@ def complex_function():
     # Assert
     assert isinstance(result, int)
     assert result > 1  # Complex function should have a higher complexity
+
+
+def test_get_block_complexity_matches_total_complexity():
+    # Arrange
+    code = """
+def block_function(x):
+    if x:
+        return 1
+    return 0
+"""
+
+    # Act
+    total = get_complexity(code)
+    blocks = get_block_complexity(code)
+
+    # Assert
+    assert total == 2
+    assert [block.complexity for block in blocks] == [2]
@@ -18,17 +18,24 @@
     - フィルタリングとカテゴリ分類
 """
 
+import os
+import sys
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+
+import pytest
+from file_tree import write_files
 
 from pycodemetrics.metrics.coupling import (
     CouplingAnalyzer,
     CouplingMetrics,
     EnhancedImportAnalyzer,
     ModuleDependency,
+    ModuleImports,
     ProjectCouplingMetrics,
+    _is_project_module,
     analyze_project_coupling,
 )
 
@@ -128,6 +135,24 @@ class TestCouplingMetrics(unittest.TestCase):
         )
         self.assertEqual(useless.category, "useless")
 
+    def test_derived_values_follow_model_copy(self):
+        """model_copyで更新したフィールドが算出値とシリアライズ結果に反映されることのテスト。"""
+        original = CouplingMetrics(
+            module_path="test.py",
+            afferent_coupling=0,
+            efferent_coupling=2,
+            instability=1.0,
+        )
+        self.assertEqual(original.category, "useless")
+        self.assertAlmostEqual(original.distance_from_main_sequence, 0.0)
+
+        copied = original.model_copy(update={"instability": 0.1})
+
+        self.assertEqual(copied.category, "stable")
+        self.assertAlmostEqual(copied.distance_from_main_sequence, 0.9)
+        self.assertEqual(copied.model_dump()["category"], "stable")
+        self.assertAlmostEqual(copied.model_dump()["distance_from_main_sequence"], 0.9)
+
 
 class TestProjectCouplingMetrics(unittest.TestCase):
     """ProjectCouplingMetricsクラスのテスト。"""
@@ -211,118 +236,299 @@ class TestProjectCouplingMetrics(unittest.TestCase):
         self.assertIn("very_unstable.py", [m.module_path for m in unstable_modules])
 
 
-class TestEnhancedImportAnalyzer(unittest.TestCase):
-    """EnhancedImportAnalyzerクラスのテスト。"""
+# EnhancedImportAnalyzer・CouplingAnalyzerの純粋な計算のテストではファイルシステムを使わない
+_PROJECT_ROOT = Path("/tmp/test_project")
+_MODULE_PATH = _PROJECT_ROOT / "src" / "module.py"
+
 
-    def setUp(self):
-        """テスト用のセットアップ。"""
-        self.project_root = Path("/tmp/test_project")
-        self.module_path = Path("/tmp/test_project/src/module.py")
+@pytest.fixture(scope="module")
+def internal_package_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """内部パッケージ myproject を持つプロジェクト。読み取りのみのテストで共有する。"""
+    project_root = tmp_path_factory.mktemp("project")
+    (project_root / "myproject").mkdir()
+    (project_root / "myproject" / "__init__.py").touch()
+    return project_root
 
-    def test_analyze_simple_imports(self):
-        """シンプルなインポートの分析テスト。"""
-        code = """
+
+@pytest.fixture
+def analyzer() -> CouplingAnalyzer:
+    """ファイルシステムに依存しない計算用のCouplingAnalyzer。"""
+    return CouplingAnalyzer(Path("/project"))
+
+
+def test_analyze_simple_imports():
+    """シンプルなインポートの分析テスト。"""
+    code = """
 import os
 import sys
 from pathlib import Path
 from myproject.utils import helper
 """
 
-        analyzer = EnhancedImportAnalyzer(self.project_root, self.module_path)
-        tree = __import__("ast").parse(code)
-        analyzer.visit(tree)
+    analyzer = EnhancedImportAnalyzer(_PROJECT_ROOT, _MODULE_PATH)
+    tree = __import__("ast").parse(code)
+    analyzer.visit(tree)
 
-        dependency = analyzer.get_dependency_info(lines_of_code=4)
+    dependency = analyzer.get_dependency_info(lines_of_code=4)
 
-        self.assertIn("os", dependency.imported_modules)
-        self.assertIn("sys", dependency.imported_modules)
-        self.assertIn("pathlib", dependency.imported_modules)
-        self.assertIn("myproject.utils", dependency.imported_modules)
-        self.assertEqual(dependency.lines_of_code, 4)
+    assert "os" in dependency.imported_modules
+    assert "sys" in dependency.imported_modules
+    assert "pathlib" in dependency.imported_modules
+    assert "myproject.utils" in dependency.imported_modules
+    assert dependency.lines_of_code == 4
 
-    def test_categorize_imports(self):
-        """インポートの内部/外部分類テスト。"""
-        # モックファイルシステムを作成
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            module_path = project_root / "src" / "module.py"
 
-            # テスト用の内部モジュールを作成
-            internal_module_dir = project_root / "myproject"
-            internal_module_dir.mkdir()
-            (internal_module_dir / "__init__.py").touch()
-
-            code = """
+def test_categorize_imports(internal_package_root: Path):
+    """インポートの内部/外部分類テスト。"""
+    module_path = internal_package_root / "src" / "module.py"
+    code = """
 import os
 from myproject import utils
 from external_lib import something
 """
 
-            analyzer = EnhancedImportAnalyzer(project_root, module_path)
-            tree = __import__("ast").parse(code)
-            analyzer.visit(tree)
+    analyzer = EnhancedImportAnalyzer(internal_package_root, module_path)
+    tree = __import__("ast").parse(code)
+    analyzer.visit(tree)
+
+    dependency = analyzer.get_dependency_info()
+
+    # myprojectは内部モジュールとして検出されるべき
+    assert "myproject" in dependency.internal_imports
+    # osとexternal_libは外部として検出されるべき
+    assert "os" in dependency.external_imports
+    assert "external_lib" in dependency.external_imports
+
+
+def test_nested_imports_are_found_in_order():
+    """ネストしたブロック内のインポートも出現順に検出されることのテスト。"""
+    code = """
+import a
+def f():
+    import b
+    class C:
+        from c import x
+try:
+    import d
+except ImportError:
+    import e
+else:
+    import f
+finally:
+    import g
+if True:
+    with open("x"):
+        import h
+match 1:
+    case 1:
+        import i
+"""
+    analyzer = EnhancedImportAnalyzer(_PROJECT_ROOT, _MODULE_PATH)
+    analyzer.visit(__import__("ast").parse(code))
 
-            dependency = analyzer.get_dependency_info()
+    assert analyzer.imports == ["a", "b", "c", "c.x", "d", "e", "f", "g", "h", "i"]
 
-            # myprojectは内部モジュールとして検出されるべき
-            self.assertIn("myproject", dependency.internal_imports)
-            # osとexternal_libは外部として検出されるべき
-            self.assertIn("os", dependency.external_imports)
-            self.assertIn("external_lib", dependency.external_imports)
 
+def test_import_names_are_interned():
+    """抽出したモジュール名とキャッシュから復元したモジュール名がインターンされることのテスト。"""
+    analyzer = EnhancedImportAnalyzer(_PROJECT_ROOT, _MODULE_PATH)
+    analyzer.visit(__import__("ast").parse("from pkg.sub import name\n"))
+    restored = EnhancedImportAnalyzer.from_imports(
+        _PROJECT_ROOT,
+        _MODULE_PATH,
+        ModuleImports.model_validate_json(analyzer.get_imports().model_dump_json()),
+    )
 
-class TestCouplingAnalyzer(unittest.TestCase):
-    """CouplingAnalyzerクラスのテスト。"""
+    for names in (analyzer.imports, restored.imports, restored.categorized_names):
+        for name in names:
+            assert name is sys.intern(name)
 
-    def test_instability_calculation(self):
-        """不安定度計算のテスト。"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            analyzer = CouplingAnalyzer(project_root)
 
-            # Ca=3, Ce=2の場合、I = Ce/(Ca+Ce) = 2/5 = 0.4
-            instability = analyzer._calculate_instability(3, 2)
-            self.assertAlmostEqual(instability, 0.4)
+def test_project_module_check_is_cached(internal_package_root: Path):
+    """同じインポート名のファイルシステム確認がキャッシュされることのテスト。"""
+    _is_project_module.cache_clear()
+    code = "import os\nfrom myproject import utils\n"
 
-            # Ca=0, Ce=0の場合、I = 0
-            instability = analyzer._calculate_instability(0, 0)
-            self.assertAlmostEqual(instability, 0.0)
+    for name in ("a.py", "b.py"):
+        analyzer = EnhancedImportAnalyzer(
+            internal_package_root, internal_package_root / name
+        )
+        analyzer.visit(__import__("ast").parse(code))
+        dependency = analyzer.get_dependency_info()
+        assert "myproject" in dependency.internal_imports
+        assert "os" in dependency.external_imports
 
-    def test_normalize_module_path(self):
-        """モジュールパス正規化のテスト。"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            analyzer = CouplingAnalyzer(project_root)
+    assert _is_project_module.cache_info().hits > 0
 
-            # .pyサフィックスの除去
-            normalized = analyzer._normalize_module_path("src/module.py")
-            self.assertEqual(normalized, "src.module")
 
-            # __init__.pyの処理
-            normalized = analyzer._normalize_module_path("src/package/__init__.py")
-            self.assertEqual(normalized, "src.package")
+def test_instability_calculation(analyzer: CouplingAnalyzer):
+    """不安定度計算のテスト。"""
+    # Ca=3, Ce=2の場合、I = Ce/(Ca+Ce) = 2/5 = 0.4
+    assert analyzer._calculate_instability(3, 2) == pytest.approx(0.4)
 
-    def test_module_matching(self):
-        """モジュールマッチングのテスト。"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            analyzer = CouplingAnalyzer(project_root)
+    # Ca=0, Ce=0の場合、I = 0
+    assert analyzer._calculate_instability(0, 0) == pytest.approx(0.0)
 
-            # 完全一致
-            self.assertTrue(analyzer._is_module_match("mymodule", "mymodule"))
 
-            # パッケージマッチ
-            self.assertTrue(
-                analyzer._is_module_match("mypackage", "mypackage.submodule")
-            )
+def test_normalize_module_path(analyzer: CouplingAnalyzer):
+    """モジュールパス正規化のテスト。"""
+    # .pyサフィックスの除去
+    assert analyzer._normalize_module_path("src/module.py") == "src.module"
+
+    # __init__.pyの処理
+    assert analyzer._normalize_module_path("src/package/__init__.py") == "src.package"
+
+
+def test_module_matching(analyzer: CouplingAnalyzer):
+    """モジュールマッチングのテスト。"""
+    # 完全一致
+    assert analyzer._is_module_match("mymodule", "mymodule")
 
-            # サブモジュールマッチ
-            self.assertTrue(
-                analyzer._is_module_match("mypackage.submodule", "mypackage")
+    # パッケージマッチ
+    assert analyzer._is_module_match("mypackage", "mypackage.submodule")
+
+    # サブモジュールマッチ
+    assert analyzer._is_module_match("mypackage.submodule", "mypackage")
+
+    # 不一致
+    assert not analyzer._is_module_match("module1", "module2")
+
+
+def test_afferent_couplings_match_pairwise_module_matching(
+    analyzer: CouplingAnalyzer,
+):
+    """入力結合度の一括計算がモジュールの組ごとの判定と一致することのテスト。"""
+    imports = {
+        "pkg/__init__.py": ["pkg.core"],
+        "pkg/core.py": ["pkg"],
+        "pkg/sub/util.py": ["pkg.sub", "myproject.pkg.core"],
+        "app.py": ["pkg.sub.util.helper", "app"],
+        "other.py": ["unrelated", "pkg.core"],
+    }
+    for module_path, internal_imports in imports.items():
+        analyzer.dependencies[module_path] = ModuleDependency(
+            module_path=module_path,
+            imported_modules=internal_imports,
+            internal_imports=internal_imports,
+            external_imports=[],
+        )
+
+    result = dict(zip(analyzer.dependencies, analyzer._calculate_afferent_couplings()))
+
+    for target in imports:
+        target_normalized = analyzer._normalize_module_path(target)
+        expected = sum(
+            any(
+                analyzer._is_module_match(
+                    analyzer._normalize_module_path(imported), target_normalized
+                )
+                for imported in internal_imports
             )
+            for module_path, internal_imports in imports.items()
+            if module_path != target
+        )
+        assert result[target] == expected, target
+    assert result["pkg/core.py"] == 3
+    assert result["other.py"] == 0
 
-            # 不一致
-            self.assertFalse(analyzer._is_module_match("module1", "module2"))
+
+def test_find_python_files_excludes_substring_patterns(tmp_path: Path):
+    """除外パターンを部分文字列として含むファイルが除外されることのテスト。"""
+    write_files(
+        tmp_path, {"src/app.py": "", "src/__pycache__/app.py": "", "venv_x/lib.py": ""}
+    )
+    analyzer = CouplingAnalyzer(tmp_path)
+
+    found = analyzer._find_python_files(("__pycache__", "venv"))
+    found_all = analyzer._find_python_files(())
+
+    assert [p.relative_to(tmp_path).as_posix() for p in found] == ["src/app.py"]
+    assert len(found_all) == 3
+
+
+def test_find_python_files_skips_excluded_and_linked_directories(tmp_path: Path):
+    """除外ディレクトリを走査せず、ディレクトリへのリンクをたどらないことのテスト。"""
+    write_files(tmp_path, {"pkg/mod.py": "", "pkg/data.txt": "", "build/gen.py": ""})
+    (tmp_path / "pkg" / "dir.py").mkdir()
+    (tmp_path / "pkg" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    analyzer = CouplingAnalyzer(tmp_path)
+
+    with patch("pycodemetrics.metrics.coupling.os.scandir", wraps=os.scandir) as spy:
+        found = analyzer._find_python_files(("build",))
+
+    assert [p.relative_to(tmp_path).as_posix() for p in found] == ["pkg/mod.py"]
+    scanned = {Path(call.args[0]).name for call in spy.call_args_list}
+    assert "build" not in scanned
+
+
+def test_analyze_project_uses_dependency_cache(tmp_path: Path):
+    """依存関係キャッシュが未変更のファイルで使われることのテスト。"""
+    project_root = tmp_path / "project"
+    write_files(
+        project_root, {"module1.py": "import module2\n", "module2.py": "x = 1\n"}
+    )
+    cache_dir = tmp_path / "cache"
+
+    first = CouplingAnalyzer(project_root, cache_dir).analyze_project()
+    with patch("pycodemetrics.metrics.coupling.ast.parse") as mock_parse:
+        second = CouplingAnalyzer(project_root, cache_dir).analyze_project()
+
+    mock_parse.assert_not_called()
+    assert first == second
+    assert len(list((cache_dir / "imports").glob("*.json"))) == 2
+
+
+def test_parallel_analysis_matches_serial(tmp_path: Path):
+    """多数のファイルを並列に解析しても逐次と同じ結果になることのテスト。"""
+    write_files(
+        tmp_path,
+        {
+            f"module{i}.py": f"import os\nimport module{(i + 1) % 70}\n"
+            for i in range(70)
+        },
+    )
+
+    serial = CouplingAnalyzer(tmp_path, workers=1).analyze_project()
+    parallel = CouplingAnalyzer(tmp_path, workers=2).analyze_project()
+
+    assert serial.module_count == 70
+    assert parallel == serial
+
+
+@pytest.mark.parametrize(
+    "before, after",
+    [
+        ({}, {"pkg/__init__.py": ""}),
+        ({"pkg/__init__.py": ""}, {}),
+    ],
+    ids=["package_added", "package_removed"],
+)
+def test_dependency_cache_follows_project_changes(
+    tmp_path: Path, before: dict[str, str], after: dict[str, str]
+):
+    """キャッシュを使っても、パッケージの追加・削除後の構成で内部/外部が分類されることのテスト。"""
+    project_root = tmp_path / "project"
+    cache_dir = tmp_path / "cache"
+    write_files(project_root, {"module1.py": "import pkg\n", **before})
+
+    first = CouplingAnalyzer(project_root, cache_dir)
+    first.analyze_project()
+    for relative in before:
+        (project_root / relative).unlink()
+    write_files(project_root, after)
+    second = CouplingAnalyzer(project_root, cache_dir)
+    second.analyze_project()
+
+    uncached = CouplingAnalyzer(project_root)
+    uncached.analyze_project()
+
+    assert first.dependencies["module1.py"].internal_imports == (
+        ["pkg"] if before else []
+    )
+    assert second.dependencies["module1.py"].internal_imports == (
+        ["pkg"] if after else []
+    )
+    assert second.dependencies == uncached.dependencies
 
 
 class TestAnalyzeProjectCoupling(unittest.TestCase):
@@ -334,25 +540,23 @@ class TestAnalyzeProjectCoupling(unittest.TestCase):
             project_root = Path(temp_dir)
 
             # テスト用のPythonファイルを作成
-            module1 = project_root / "module1.py"
-            module1.write_text(
-                """
+            write_files(
+                project_root,
+                {
+                    "module1.py": """
 import os
 from module2 import helper
 
 def main():
     return helper()
-"""
-            )
-
-            module2 = project_root / "module2.py"
-            module2.write_text(
-                """
+""",
+                    "module2.py": """
 import sys
 
 def helper():
     return "hello"
-"""
+""",
+                },
             )
 
             # 分析実行
@@ -383,19 +587,23 @@ def helper():
             self.assertEqual(project_metrics.total_internal_dependencies, 0)
             self.assertEqual(project_metrics.average_instability, 0.0)
 
-    @patch("pycodemetrics.metrics.coupling.CouplingAnalyzer")
-    def test_analyze_project_coupling_with_exception(self, mock_analyzer_class):
+    def test_analyze_project_coupling_with_exception(self):
         """例外発生時の処理テスト。"""
-        # CouplingAnalyzerが例外を発生させるようにモック
-        mock_analyzer = Mock()
-        mock_analyzer.analyze_project.side_effect = Exception("Test exception")
-        mock_analyzer_class.return_value = mock_analyzer
+
+        # analyze_projectが例外を発生させるCouplingAnalyzerに差し替える
+        class _RaisingAnalyzer(CouplingAnalyzer):
+            def analyze_project(self, exclude_patterns=None):
+                raise Exception("Test exception")
 
         with tempfile.TemporaryDirectory() as temp_dir:
             project_root = Path(temp_dir)
 
+            with patch(
+                "pycodemetrics.metrics.coupling.CouplingAnalyzer", _RaisingAnalyzer
+            ):
+                project_metrics = analyze_project_coupling(project_root)
+
             # 例外が発生しても空のメトリクスが返されることを確認
-            project_metrics = analyze_project_coupling(project_root)
             self.assertEqual(project_metrics.module_count, 0)
             self.assertEqual(project_metrics.total_internal_dependencies, 0)
 
@@ -409,24 +617,22 @@ class TestComplexScenarios(unittest.TestCase):
             project_root = Path(temp_dir)
 
             # 循環依存を持つモジュールを作成
-            module_a = project_root / "module_a.py"
-            module_a.write_text(
-                """
+            write_files(
+                project_root,
+                {
+                    "module_a.py": """
 from module_b import func_b
 
 def func_a():
     return func_b()
-"""
-            )
-
-            module_b = project_root / "module_b.py"
-            module_b.write_text(
-                """
+""",
+                    "module_b.py": """
 from module_a import func_a
 
 def func_b():
     return "result"
-"""
+""",
+                },
             )
 
             # 分析実行
@@ -445,20 +651,16 @@ def func_b():
         with tempfile.TemporaryDirectory() as temp_dir:
             project_root = Path(temp_dir)
 
-            # パッケージ構造を作成
-            (project_root / "core").mkdir()
-            (project_root / "core" / "__init__.py").touch()
-            (project_root / "utils").mkdir()
-            (project_root / "utils" / "__init__.py").touch()
-
-            # コアモジュール（低結合）
-            core_engine = project_root / "core" / "engine.py"
-            core_engine.write_text("def process(): pass")
-
-            # ユーティリティモジュール（高結合）
-            utils_helper = project_root / "utils" / "helper.py"
-            utils_helper.write_text(
-                """
+            write_files(
+                project_root,
+                {
+                    # パッケージ構造
+                    "core/__init__.py": "",
+                    "utils/__init__.py": "",
+                    # コアモジュール（低結合）
+                    "core/engine.py": "def process(): pass",
+                    # ユーティリティモジュール（高結合）
+                    "utils/helper.py": """
 import os
 import sys
 from pathlib import Path
@@ -466,19 +668,16 @@ from core.engine import process
 
 def helper_func():
     return process()
-"""
-            )
-
-            # メインモジュール
-            main = project_root / "main.py"
-            main.write_text(
-                """
+""",
+                    # メインモジュール
+                    "main.py": """
 from core.engine import process
 from utils.helper import helper_func
 
 def main():
     return helper_func()
-"""
+""",
+                },
             )
 
             # 分析実行
@@ -17,28 +17,67 @@ def build_git_commit_log(commit_date: dt.datetime) -> GitFileCommitLog:
     )
 
 
-def test_calculate_hotspot():
+@pytest.mark.parametrize(
+    "commit_dates, base_datetime, expected_lifetime_days, expected_hotspot",
+    [
+        (
+            [
+                dt.datetime(2023, 1, 1),
+                dt.datetime(2023, 1, 2),
+                dt.datetime(2023, 1, 3),
+                dt.datetime(2023, 10, 4),
+            ],
+            dt.datetime(2023, 10, 5),
+            277,
+            0.4891906292081721,
+        ),
+        (
+            [dt.datetime(2023, 1, 1), dt.datetime(2023, 10, 4)],
+            dt.datetime(2023, 10, 4),
+            276,
+            0.5000060183694546,
+        ),
+        (
+            [dt.datetime(2023, 1, 1), dt.datetime(2023, 1, 2)],
+            dt.datetime(2024, 1, 1),
+            365,
+            1.2493705404317952e-05,
+        ),
+    ],
+    ids=["recent_change", "base_is_last_commit", "old_changes_only"],
+)
+def test_calculate_hotspot(
+    commit_dates, base_datetime, expected_lifetime_days, expected_hotspot
+):
     # Arrange
-    gitlogs = [
-        build_git_commit_log(commit_date=dt.datetime(2023, 1, 1)),
-        build_git_commit_log(commit_date=dt.datetime(2023, 1, 2)),
-        build_git_commit_log(commit_date=dt.datetime(2023, 1, 3)),
-        build_git_commit_log(commit_date=dt.datetime(2023, 10, 4)),
-    ]
+    gitlogs = [build_git_commit_log(commit_date=date) for date in commit_dates]
 
     # Act
-    result = calculate_hotspot(gitlogs, base_datetime=dt.datetime(2023, 10, 5))
+    result = calculate_hotspot(gitlogs, base_datetime=base_datetime)
 
     # Assert
-    expected_first_commit_datetime = dt.datetime(2023, 1, 1)
-    expected_last_commit_datetime = dt.datetime(2023, 10, 4)
-    expected_change_count = 4
-
-    assert result.first_commit_datetime == expected_first_commit_datetime
-    assert result.last_commit_datetime == expected_last_commit_datetime
-    assert result.change_count == expected_change_count
-    assert result.lifetime_days == 277
-    assert result.hotspot == 0.4891906292081721
+    assert result.first_commit_datetime == min(commit_dates)
+    assert result.last_commit_datetime == max(commit_dates)
+    assert result.change_count == len(commit_dates)
+    assert result.lifetime_days == expected_lifetime_days
+    assert result.hotspot == expected_hotspot
+
+
+@pytest.mark.parametrize(
+    "n", [10, 10_000, pytest.param(100_000, marks=pytest.mark.slow)]
+)
+def test_calculate_hotspot_scale(n):
+    # Arrange: 変更回数に対して線形の時間で計算できることを確認する
+    base = dt.datetime(2020, 1, 1)
+    gitlogs = [build_git_commit_log(base + dt.timedelta(days=i)) for i in range(n)]
+
+    # Act
+    result = calculate_hotspot(gitlogs, base_datetime=base + dt.timedelta(days=n))
+
+    # Assert
+    assert result.change_count == n
+    assert result.first_commit_datetime == base
+    assert result.last_commit_datetime == base + dt.timedelta(days=n - 1)
 
 
 def test_validate_first_commit_datetimeがlast_commit_datetimeよりも小さい():
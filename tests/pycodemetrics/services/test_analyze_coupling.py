@@ -8,9 +8,11 @@ import pytest
 
 from pycodemetrics.metrics.coupling import CouplingMetrics, ProjectCouplingMetrics
 from pycodemetrics.services.analyze_coupling import (
+    AnalysisSummary,
     CouplingAnalysisResult,
     CouplingAnalysisSettings,
     ModuleRecommendation,
+    _classify_modules,
     _create_empty_result,
     _generate_analysis_summary,
     _identify_problematic_modules,
@@ -42,7 +44,7 @@ class TestCouplingAnalysisSettings:
             coupling_threshold_high=10,
         )
 
-        assert settings.exclude_patterns == ["test"]
+        assert settings.exclude_patterns == ("test",)
         assert settings.instability_threshold_high == 0.9
         assert settings.coupling_threshold_high == 10
 
@@ -87,14 +89,14 @@ class TestCouplingAnalysisResult:
             problematic_modules=[],
             stable_modules=[],
             recommendations=[],
-            analysis_summary={},
+            analysis_summary=AnalysisSummary(),
         )
 
         assert result.project_metrics == project_metrics
         assert result.problematic_modules == []
         assert result.stable_modules == []
         assert result.recommendations == []
-        assert result.analysis_summary == {}
+        assert result.analysis_summary == AnalysisSummary()
 
 
 class TestAnalyzeProjectCouplingComprehensive:
@@ -129,16 +131,21 @@ class TestAnalyzeProjectCouplingComprehensive:
             assert len(result.stable_modules) == 0
             assert len(result.recommendations) == 0
 
-    @patch("pycodemetrics.services.analyze_coupling.analyze_project_coupling")
-    def test_analysis_with_exception(self, mock_analyze: MagicMock) -> None:
+    def test_analysis_with_exception(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """分析中に例外が発生した場合のテスト。"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
 
-            mock_analyze.side_effect = Exception("Analysis failed")
+        def raise_error(*args: object, **kwargs: object) -> ProjectCouplingMetrics:
+            raise Exception("Analysis failed")
+
+        monkeypatch.setattr(
+            "pycodemetrics.services.analyze_coupling.analyze_project_coupling",
+            raise_error,
+        )
 
-            with pytest.raises(RuntimeError, match="Coupling analysis failed"):
-                analyze_project_coupling_comprehensive(project_path)
+        with pytest.raises(RuntimeError, match="Coupling analysis failed"):
+            analyze_project_coupling_comprehensive(tmp_path)
 
 
 class TestCreateEmptyResult:
@@ -162,8 +169,8 @@ class TestCreateEmptyResult:
         assert result.problematic_modules == []
         assert result.stable_modules == []
         assert result.recommendations == []
-        assert result.analysis_summary["total_modules"] == 0
-        assert result.analysis_summary["overall_health"] == "unknown"
+        assert result.analysis_summary.total_modules == 0
+        assert result.analysis_summary.overall_health == "unknown"
 
 
 class TestIdentifyProblematicModules:
@@ -267,6 +274,118 @@ class TestIdentifyStableModules:
         assert stable[0].module_path == "stable.py"
 
 
+class TestIdentifyModulesVectorized:
+    """配列による一括判定のテストクラス。"""
+
+    def test_thresholds_at_boundaries(self) -> None:
+        """閾値の境界の前後で、一括判定が期待するモジュールを返すことのテスト。"""
+        # Arrange: 抽象度は不安定度と合わせて、距離の判定以外ではメインシーケンス上に置く
+        settings = CouplingAnalysisSettings()
+        cases = [
+            # (パス, 入力結合度, 出力結合度, 不安定度, 抽象度, 行数)
+            ("instability_at_high.py", 1, 1, 0.8, 0.2, 100),
+            ("instability_over_high.py", 1, 1, 0.81, 0.19, 100),
+            ("afferent_at_high.py", 5, 1, 0.5, 0.5, 100),
+            ("afferent_over_high.py", 6, 1, 0.5, 0.5, 100),
+            ("efferent_at_high.py", 1, 5, 0.5, 0.5, 100),
+            ("efferent_over_high.py", 1, 6, 0.5, 0.5, 100),
+            ("large_at_limit.py", 1, 4, 0.5, 0.5, 200),
+            ("large_loose.py", 1, 3, 0.5, 0.5, 201),
+            ("large_coupled.py", 1, 4, 0.5, 0.5, 201),
+            ("distance_at_limit.py", 1, 1, 0.0, 0.5, 100),
+            ("distance_over_limit.py", 1, 1, 0.0, 0.4, 100),
+            ("stable.py", 2, 3, 0.1, 0.9, 100),
+            ("stable_instability_at_low.py", 2, 3, 0.2, 0.8, 100),
+            ("stable_too_few_afferent.py", 1, 3, 0.1, 0.9, 100),
+            ("stable_too_many_efferent.py", 2, 4, 0.1, 0.9, 100),
+        ]
+        modules = [
+            CouplingMetrics(
+                module_path=path,
+                afferent_coupling=afferent,
+                efferent_coupling=efferent,
+                instability=instability,
+                abstractness=abstractness,
+                lines_of_code=lines,
+            )
+            for path, afferent, efferent, instability, abstractness, lines in cases
+        ]
+
+        # Act
+        problematic = _identify_problematic_modules(modules, settings)
+        stable = _identify_stable_modules(modules, settings)
+
+        # Assert
+        assert [m.module_path for m in problematic] == [
+            "instability_over_high.py",
+            "afferent_over_high.py",
+            "efferent_over_high.py",
+            "large_coupled.py",
+            "distance_over_limit.py",
+        ]
+        assert [m.module_path for m in stable] == ["stable.py"]
+
+    def test_empty_modules(self) -> None:
+        """モジュールがない場合に空のリストを返すことのテスト。"""
+        settings = CouplingAnalysisSettings()
+
+        assert _identify_problematic_modules([], settings) == []
+        assert _identify_stable_modules([], settings) == []
+
+
+class TestClassifyModules:
+    """_classify_modules関数のテストクラス。"""
+
+    def test_classify_modules(self) -> None:
+        """1回の走査で問題のあるモジュール・安定したモジュール・推奨アクションに分類されることのテスト。"""
+        settings = CouplingAnalysisSettings()
+        modules = [
+            CouplingMetrics(
+                module_path="stable.py",
+                afferent_coupling=3,
+                efferent_coupling=2,
+                instability=0.1,
+                lines_of_code=100,
+            ),
+            CouplingMetrics(
+                module_path="unstable.py",
+                afferent_coupling=1,
+                efferent_coupling=8,
+                instability=0.89,
+                lines_of_code=100,
+            ),
+            CouplingMetrics(
+                module_path="large.py",
+                afferent_coupling=2,
+                efferent_coupling=4,
+                instability=0.67,
+                lines_of_code=250,
+            ),
+            CouplingMetrics(
+                module_path="distant.py",
+                afferent_coupling=5,
+                efferent_coupling=0,
+                instability=0.0,
+                lines_of_code=100,
+            ),
+        ]
+
+        problematic, stable, recommendations = _classify_modules(modules, settings)
+
+        # 抽象度が0のため、stable.pyとdistant.pyはメインシーケンスから離れている
+        assert [m.module_path for m in problematic] == [
+            "stable.py",
+            "unstable.py",
+            "large.py",
+            "distant.py",
+        ]
+        assert [m.module_path for m in stable] == ["stable.py", "distant.py"]
+        assert [(r.module_path, r.priority, r.category) for r in recommendations] == [
+            ("unstable.py", "high", "coupling"),
+            ("large.py", "medium", "size"),
+        ]
+
+
 class TestGenerateAnalysisSummary:
     """_generate_analysis_summary関数のテストクラス。"""
 
@@ -292,11 +411,11 @@ class TestGenerateAnalysisSummary:
 
         summary = _generate_analysis_summary(project_metrics, [], [])
 
-        assert summary["total_modules"] == 1
-        assert summary["problematic_modules"] == 0
-        assert summary["stable_modules"] == 0
-        assert summary["overall_health"] == "excellent"
-        assert summary["category_distribution"]["stable"] == 1
+        assert summary.total_modules == 1
+        assert summary.problematic_modules == 0
+        assert summary.stable_modules == 0
+        assert summary.overall_health == "excellent"
+        assert summary.category_distribution["stable"] == 1
 
     def test_generate_analysis_summary_poor_health(self) -> None:
         """深刻な健全性のサマリー生成テスト。"""
@@ -320,10 +439,10 @@ class TestGenerateAnalysisSummary:
 
         summary = _generate_analysis_summary(project_metrics, [problematic_module], [])
 
-        assert summary["total_modules"] == 1
-        assert summary["problematic_modules"] == 1
-        assert summary["problematic_ratio"] == 1.0
-        assert summary["overall_health"] == "poor"
+        assert summary.total_modules == 1
+        assert summary.problematic_modules == 1
+        assert summary.problematic_ratio == 1.0
+        assert summary.overall_health == "poor"
 
 
 class TestGetCouplingInsights:
@@ -346,11 +465,11 @@ class TestGetCouplingInsights:
             problematic_modules=[],
             stable_modules=[],
             recommendations=[],
-            analysis_summary={
-                "overall_health": "excellent",
-                "problematic_ratio": 0.0,
-                "stable_ratio": 0.4,
-            },
+            analysis_summary=AnalysisSummary(
+                overall_health="excellent",
+                problematic_ratio=0.0,
+                stable_ratio=0.4,
+            ),
         )
 
         insights = get_coupling_insights(analysis_result)
@@ -383,11 +502,11 @@ class TestGetCouplingInsights:
             problematic_modules=[],
             stable_modules=[],
             recommendations=[high_priority_recommendation],
-            analysis_summary={
-                "overall_health": "poor",
-                "problematic_ratio": 0.3,
-                "stable_ratio": 0.1,
-            },
+            analysis_summary=AnalysisSummary(
+                overall_health="poor",
+                problematic_ratio=0.3,
+                stable_ratio=0.1,
+            ),
         )
 
         insights = get_coupling_insights(analysis_result)
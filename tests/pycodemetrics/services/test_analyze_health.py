@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from pycodemetrics.services.analyze_health import (
+    HealthAnalysisSettings,
+    _collect_python_metrics,
+)
+
+
+def test_collect_python_metrics_analyzes_all_files(tmp_path: Path):
+    # Arrange: 10ファイルを超えるPythonファイルと除外対象ディレクトリを用意
+    for i in range(12):
+        (tmp_path / f"module_{i}.py").write_text(f"def func_{i}():\n    return {i}\n")
+    venv_dir = tmp_path / ".venv"
+    venv_dir.mkdir()
+    (venv_dir / "excluded.py").write_text("x = 1\n")
+    (tmp_path / "broken.py").write_text("def broken(:\n")
+    settings = HealthAnalysisSettings(workers=1)
+
+    # Act
+    result = _collect_python_metrics(tmp_path, settings)
+
+    # Assert: 解析できない・除外対象のファイル以外はすべて解析される
+    assert sorted(metric.filepath.name for metric in result) == sorted(
+        f"module_{i}.py" for i in range(12)
+    )
+
+
+def test_collect_python_metrics_max_files(tmp_path: Path):
+    # Arrange
+    for i in range(5):
+        (tmp_path / f"module_{i}.py").write_text(f"def func_{i}():\n    return {i}\n")
+    settings = HealthAnalysisSettings(workers=1, max_files=3)
+
+    # Act
+    result = _collect_python_metrics(tmp_path, settings)
+
+    # Assert
+    assert len(result) == 3
@@ -3,48 +3,75 @@ from pathlib import Path
 import pytest
 
 from pycodemetrics.metrics.py.python_metrics import PythonCodeMetrics
+from pycodemetrics.services import analyze_python_metrics
 from pycodemetrics.services.analyze_python_metrics import (
     AnalyzePythonSettings,
     CodeType,
     PythonFileMetrics,
     _open,
     analyze_python_file,
+    expand_python_file_metrics,
+    iter_python_files,
+    python_code_digest,
 )
 from pycodemetrics.util.file_util import _is_match, get_code_type
 
+# テストで使うパス。Pathは不変のため全テストで共有する
+_EXAMPLE_PATH = Path("src/example.py")
+_TEST_PATH = Path("project/tests/test_example.py")
+_NON_TEST_PATH = Path("project/src/example.py")
+
+# compute_metricsのモックが返すメトリクス。不変のため全テストで共有する
+_CANNED_METRICS = PythonCodeMetrics(
+    lines_of_code=10,
+    logical_lines_of_code=10,
+    source_lines_of_code=10,
+    comments=10,
+    single_comments=10,
+    multi=10,
+    blank=10,
+    import_count=10,
+    cyclomatic_complexity=10,
+    maintainability_index=10.0,
+    cognitive_complexity=10,
+)
+
+# src/example.py を _CANNED_METRICS で解析した結果の to_flat() の期待値
+_EXPECTED_FLAT = {
+    "filepath": _EXAMPLE_PATH,
+    "code_type": CodeType.PRODUCT.value,
+    "group_name": "undefined",
+    "lines_of_code": 10,
+    "logical_lines_of_code": 10,
+    "source_lines_of_code": 10,
+    "comments": 10,
+    "single_comments": 10,
+    "multi": 10,
+    "blank": 10,
+    "import_count": 10,
+    "cyclomatic_complexity": 10,
+    "maintainability_index": 10.0,
+    "cognitive_complexity": 10,
+}
+
 
 @pytest.fixture
 def mock_open(mocker):
-    return mocker.patch(
-        "pycodemetrics.services.analyze_python_metrics._open",
-        return_value="def foo(): pass",
+    return mocker.patch.object(
+        analyze_python_metrics, "_open", return_value="def foo(): pass"
     )
 
 
 @pytest.fixture
 def mock_compute_metrics(mocker):
-    return_value = PythonCodeMetrics(
-        lines_of_code=10,
-        logical_lines_of_code=10,
-        source_lines_of_code=10,
-        comments=10,
-        single_comments=10,
-        multi=10,
-        blank=10,
-        import_count=10,
-        cyclomatic_complexity=10,
-        maintainability_index=10.0,
-        cognitive_complexity=10,
-    )
-    return mocker.patch(
-        "pycodemetrics.services.analyze_python_metrics.compute_metrics",
-        return_value=return_value,
+    return mocker.patch.object(
+        analyze_python_metrics, "compute_metrics", return_value=_CANNED_METRICS
     )
 
 
 def test_analyze_python_file(mock_open, mock_compute_metrics):
     # Arrange: テスト用のファイルパスを準備
-    filepath = Path("src/example.py")
+    filepath = _EXAMPLE_PATH
     settings = AnalyzePythonSettings(
         testcode_type_patterns=["*/tests/*.*", "*/tests/*/*.*", "tests/*.*"],
         user_groups=[],
@@ -69,8 +96,8 @@ def test_is_tests_file():
     ファイルパスがテストファイルパターンに一致するかどうかを確認する。
     """
     # Arrange: テスト用のファイルパスを準備
-    test_file_path = Path("project/tests/test_example.py")
-    non_test_file_path = Path("project/src/example.py")
+    test_file_path = _TEST_PATH
+    non_test_file_path = _NON_TEST_PATH
 
     # Act & Assert: _is_tests_file関数を実行し、結果を確認
     assert (
@@ -84,8 +111,8 @@ def test_is_tests_file():
 
 def test_get_code_type():
     # Arrange: テスト用のファイルパスを準備
-    test_file_path = Path("project/tests/test_example.py")
-    non_test_file_path = Path("project/src/example.py")
+    test_file_path = _TEST_PATH
+    non_test_file_path = _NON_TEST_PATH
 
     # Act & Assert: _is_tests_file関数を実行し、結果を確認
     assert (
@@ -104,7 +131,7 @@ def test_to_flat(mock_open, mock_compute_metrics):
     ファイルパスを入力として、正しいdictオブジェクトを返すことを確認する。
     """
     # Arrange: テスト用のファイルパスを準備
-    filepath = Path("src/example.py")
+    filepath = _EXAMPLE_PATH
     settings = AnalyzePythonSettings(
         testcode_type_patterns=["*/tests/*.*", "*/tests/*/*.*", "tests/*.*"],
         user_groups=[],
@@ -114,25 +141,89 @@ def test_to_flat(mock_open, mock_compute_metrics):
     result = analyze_python_file(filepath, settings).to_flat()
 
     # Assert: 期待されるPythonFileMetricsオブジェクトと結果を比較
-    expected_metrics = {
-        "filepath": filepath,
-        "code_type": CodeType.PRODUCT.value,
-        "group_name": "undefined",
-        "lines_of_code": 10,
-        "logical_lines_of_code": 10,
-        "source_lines_of_code": 10,
-        "comments": 10,
-        "single_comments": 10,
-        "multi": 10,
-        "blank": 10,
-        "import_count": 10,
-        "cyclomatic_complexity": 10,
-        "maintainability_index": 10.0,
-        "cognitive_complexity": 10,
-    }
-    assert result == expected_metrics
+    assert result == _EXPECTED_FLAT
 
 
 def test_open_存在しないパスを渡してFileNotFoundErrorが返ってくる():
     with pytest.raises(FileNotFoundError):
         _open(Path("__n/o/t_e/x/i/s/t_f/i/l/e_p/a/t/h__"))
+
+
+def test_iter_python_files_yields_paths_with_contents(tmp_path):
+    # Arrange
+    first = tmp_path / "first.py"
+    first.write_text("a = 1\n")
+    missing = tmp_path / "missing.py"
+
+    # Act
+    result = list(iter_python_files([missing, first], workers=2))
+
+    # Assert: 入力と同じ順序で、ファイルパスと内容の組が返る
+    assert result == [(missing, None), (first, "a = 1\n")]
+
+
+def test_iter_python_files_bounds_read_ahead(monkeypatch):
+    # Arrange: 読み込みを記録するだけの_open_or_noneに差し替える
+    filepaths = [Path(f"module{i}.py") for i in range(20)]
+    opened: list[Path] = []
+    monkeypatch.setattr(
+        analyze_python_metrics,
+        "_open_or_none",
+        lambda filepath: opened.append(filepath) or "",
+    )
+
+    # Act: 先頭の1件だけ取り出して打ち切る
+    files = iter_python_files(filepaths, workers=2, prefetch=3)
+    first = next(files)
+    files.close()
+
+    # Assert: 投入された読み込みは先読みの上限と補充の1件までに限られる
+    assert first == (filepaths[0], "")
+    assert len(opened) <= 4
+
+
+def test_analyze_python_file_uses_metrics_cache(tmp_path, mock_compute_metrics):
+    # Arrange: キャッシュディレクトリを指定した設定を用意
+    filepath = tmp_path / "cached.py"
+    filepath.write_text("def foo(): pass\n")
+    settings = AnalyzePythonSettings(cache_dir=tmp_path / "cache")
+
+    # Act: 変更のないファイルを2回解析し、その後ファイルを更新して再度解析
+    first = analyze_python_file(filepath, settings)
+    second = analyze_python_file(filepath, settings)
+    filepath.write_text("def foo():\n    return 1\n")
+    analyze_python_file(filepath, settings)
+
+    # Assert: 未変更のファイルではキャッシュが使われ、変更後は再計算される
+    assert first == second
+    assert mock_compute_metrics.call_count == 2
+
+
+def test_python_code_digest_and_expand(mock_compute_metrics):
+    # Arrange: 同一内容のファイルを含むファイルリストを用意
+    filepaths = [
+        Path("src/pkg/__init__.py"),
+        Path("src/main.py"),
+        Path("tests/__init__.py"),
+    ]
+    codes = ["", "print(1)\n", ""]
+    settings = AnalyzePythonSettings(testcode_type_patterns=["tests/*.*"])
+
+    # Act
+    digests = [python_code_digest(code) for code in codes]
+    representative = PythonFileMetrics(
+        filepath=filepaths[0],
+        code_type=CodeType.PRODUCT,
+        group_name="undefined",
+        metrics=mock_compute_metrics.return_value,
+    )
+    expanded = expand_python_file_metrics(representative, filepaths[2:], settings)
+
+    # Assert: 同一内容は同じダイジェストになり、複製先ごとにコードタイプが判定される
+    assert digests[0] == digests[2]
+    assert digests[0] != digests[1]
+    assert len(digests[0]) == 16
+    assert [(m.filepath, m.code_type) for m in expanded] == [
+        (Path("tests/__init__.py"), CodeType.TEST)
+    ]
+    assert expanded[0].metrics == representative.metrics
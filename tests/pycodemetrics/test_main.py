@@ -1,22 +1,28 @@
 """__main__.pyのテストモジュール。"""
 
-from unittest.mock import MagicMock, patch
+import runpy
+from unittest.mock import MagicMock
 
 import pytest
 
+import pycodemetrics.__main__ as main_module
 from pycodemetrics.__main__ import main
 
 
+@pytest.fixture
+def mock_cli(mocker) -> MagicMock:
+    """__main__が参照するCLIをモックに差し替える。"""
+    return mocker.patch.object(main_module, "cli")
+
+
 class TestMain:
     """__main__.pyのテストクラス。"""
 
-    @patch("pycodemetrics.__main__.cli")
     def test_main_calls_cli(self, mock_cli: MagicMock) -> None:
         """main関数がCLIを呼び出すことをテスト。"""
         main()
         mock_cli.assert_called_once()
 
-    @patch("pycodemetrics.__main__.cli")
     def test_main_with_exception(self, mock_cli: MagicMock) -> None:
         """CLI実行時に例外が発生した場合のテスト。"""
         mock_cli.side_effect = Exception("Test exception")
@@ -26,12 +32,12 @@ class TestMain:
 
         mock_cli.assert_called_once()
 
-    def test_name_main_execution(self) -> None:
-        """__name__ == "__main__"の実行をテスト。"""
-        # __main__.pyの最後の部分をテスト
-        # この部分は実際のif __name__ == "__main__":の動作をテスト
-        with patch("pycodemetrics.__main__.main") as mock_main:
-            # __main__.pyのコードを実行する代わりに直接条件をテスト
-            if "__main__" == "__main__":
-                mock_main()
-            mock_main.assert_called_once()
+    def test_run_as_module_calls_cli(self, mocker) -> None:
+        """python -m pycodemetrics として実行した場合にCLIが呼び出されることをテスト。"""
+        # 実行し直した__main__はCLIを改めてインポートするため、インポート元を差し替える
+        cli_entry = mocker.patch("pycodemetrics.cli.cli.cli")
+
+        # run_moduleはインポート済みの__main__を再実行すると警告するため、ファイルを直接実行する
+        runpy.run_path(str(main_module.__file__), run_name="__main__")
+
+        cli_entry.assert_called_once()
@@ -1,46 +1,178 @@
+import fnmatch
+import glob
+import itertools
+import os
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
+from file_tree import write_files
 
+from pycodemetrics.config.config_manager import (
+    TESTCODE_PATTERN_DEFAULT,
+    UserGroupConfig,
+)
+from pycodemetrics.util import file_util
 from pycodemetrics.util.file_util import (
+    CodeType,
     _is_excluded,
+    _is_match,
+    _is_tests_file,
+    clear_caches,
+    get_code_type,
+    get_group_name,
     get_target_files_by_git_ls_files,
     get_target_files_by_path,
+    iter_target_files_by_path,
 )
 
 
-# Test for get_target_files_by_path using tmpdir
-def test_get_target_files_by_path_directory(tmpdir):
+def _assert_same_files(result: list[Path], expected: list[Path]) -> None:
+    """Assert that result holds the expected files in any order, without duplicates."""
+    assert len(result) == len(expected)
+    assert set(result) == set(expected)
+
+
+def _snapshot_tree(root: Path) -> frozenset[Path]:
+    """Return every path under root, to check that tests leave a shared tree as is."""
+    return frozenset(root.rglob("*"))
+
+
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory):
+    """
+    A directory tree shared by the read-only get_target_files_by_path tests.
+
+    Tests must not modify it; each one checks that with _assert_unchanged.
+    """
+    root = tmp_path_factory.mktemp("tree")
+    relative_paths = {
+        "venv_file": ".venv/lib/excluded.py",
+        "cache_file": "__pycache__/cached.py",
+        "src_main": "src/main.py",
+        "app": "app.py",
+        "sub_test1": "subdir/test1.py",
+        "sub_test2": "subdir/test2.py",
+        "sub_text": "subdir/test3.txt",
+    }
+    paths = write_files(root, relative_paths.values())
+    tree = SimpleNamespace(root=root, **dict(zip(relative_paths, paths)))
+    tree.snapshot = _snapshot_tree(root)
+    return tree
+
+
+def _assert_unchanged(tree) -> None:
+    assert _snapshot_tree(tree.root) == tree.snapshot
+
+
+@pytest.mark.io
+def test_get_target_files_by_path_directory(sample_tree):
     """
     get_target_files_by_path関数がディレクトリ内のPythonファイルのみを正しく返すことをテストします。
     """
+    # Act
+    result = get_target_files_by_path(sample_tree.root)
+
+    # Assert
+    # Like glob, hidden directories such as .venv are not walked, nor is __pycache__
+    expected_files = [
+        sample_tree.src_main,
+        sample_tree.app,
+        sample_tree.sub_test1,
+        sample_tree.sub_test2,
+    ]
+    _assert_same_files(result, expected_files)
+    _assert_unchanged(sample_tree)
+
+
+@pytest.mark.io
+def test_get_target_files_by_path_directory_same_as_glob(tmpdir, mocker):
+    """
+    get_target_files_by_path関数がglobと同じファイルを同じ順序で返し、
+    除外されたディレクトリの中は探索しないことをテストします。
+    """
+    # Arrange
+    tmpdir = Path(tmpdir)
+    write_files(
+        tmpdir,
+        [
+            "a.py",
+            "pkg/b.py",
+            "pkg/sub/c.py",
+            "pkg/.hidden/d.py",
+            ".e.py",
+            "build/f.py",
+            "docs/g.txt",
+        ],
+    )
+    expected = [
+        Path(p)
+        for p in glob.glob(
+            os.path.join(tmpdir.as_posix(), "**", "*.py"), recursive=True
+        )
+        if "build" not in Path(p).parts
+    ]
+    scandir = mocker.spy(os, "scandir")
+
+    # Act
+    result = get_target_files_by_path(tmpdir, ["build"])
+
+    # Assert
+    assert result == expected
+    assert all(Path(call.args[0]).name != "build" for call in scandir.call_args_list)
+
+
+@pytest.mark.io
+def test_get_target_files_by_path_skips_pycache(tmpdir, mocker):
+    """
+    get_target_files_by_path関数が__pycache__を探索せず、
+    buildやdistはパッケージ名にもなるため探索することをテストします。
+    """
     # Arrange
     tmpdir = Path(tmpdir)
-    subdir = tmpdir.joinpath("subdir")
-    subdir.mkdir()
-    subdir.joinpath("test1.py").touch()
-    subdir.joinpath("test2.py").touch()
-    subdir.joinpath("test3.txt").touch()
+    files = write_files(
+        tmpdir,
+        ["pkg/a.py", "build/b.py", "dist/c.py", "pkg/__pycache__/d.py"],
+    )
+    scandir = mocker.spy(os, "scandir")
 
     # Act
     result = get_target_files_by_path(tmpdir)
 
     # Assert
-    expected_files = [
-        subdir.joinpath("test1.py"),
-        subdir.joinpath("test2.py"),
-    ]
-    assert sorted(result) == sorted(expected_files)
+    _assert_same_files(result, files[:3])
+    assert all(
+        Path(call.args[0]).name != "__pycache__" for call in scandir.call_args_list
+    )
 
 
+@pytest.mark.io
+def test_get_target_files_by_path_stats_root_once(tmpdir, mocker):
+    """
+    get_target_files_by_path関数がルートのパスを一度だけstatし、
+    各ファイルはディレクトリエントリの情報で判定することをテストします。
+    """
+    # Arrange
+    tmpdir = Path(tmpdir)
+    write_files(tmpdir, [f"module{i}.py" for i in range(3)])
+    os_stat = mocker.spy(os, "stat")
+
+    # Act
+    result = get_target_files_by_path(tmpdir)
+
+    # Assert
+    assert len(result) == 3
+    assert os_stat.call_count == 1
+
+
+@pytest.mark.io
 def test_get_target_files_by_path_file(tmpdir):
     """
     get_target_files_by_path関数が単一のPythonファイルを正しく返すことをテストします。
     """
     # Arrange
     tmpdir = Path(tmpdir)
-    file = tmpdir.joinpath("test_file.py")
-    file.touch()
+    (file,) = write_files(tmpdir, ["test_file.py"])
 
     # Act
     result = get_target_files_by_path(file)
@@ -49,150 +181,220 @@ def test_get_target_files_by_path_file(tmpdir):
     assert result == [file]
 
 
+@pytest.mark.io
 def test_get_target_files_by_path_invalid(tmpdir):
     """
     get_target_files_by_path関数が存在しないパスを渡されたときにValueErrorを発生させることをテストします。
     """
     # Arrange
     tmpdir = Path(tmpdir)
-    invalid_path = tmpdir.joinpath("invalid_path")
+    invalid_path = tmpdir / "invalid_path"
+    expected_message = f"Invalid path: {invalid_path}"
 
     # Act & Assert
-    with pytest.raises(ValueError, match=f"Invalid path: {invalid_path.as_posix()}"):
+    with pytest.raises(ValueError) as exc_info:
         get_target_files_by_path(invalid_path)
+    assert str(exc_info.value) == expected_message
+
+
+@pytest.mark.io
+def test_get_target_files_by_path_follows_symlinks_once(tmpdir):
+    """
+    get_target_files_by_path関数がシンボリックリンクのループで止まらず、
+    同じディレクトリを二重に探索しないことをテストします。
+    """
+    # Arrange: pkg/loop -> pkg のループと、alias -> pkg の重複を用意
+    tmpdir = Path(tmpdir)
+    pkg = tmpdir / "pkg"
+    write_files(pkg, ["module.py"])
+    (pkg / "loop").symlink_to(pkg, target_is_directory=True)
+    (tmpdir / "alias").symlink_to(pkg, target_is_directory=True)
+
+    # Act
+    result = get_target_files_by_path(tmpdir)
+
+    # Assert
+    assert len(result) == 1
+    assert result[0].name == "module.py"
+
+
+@pytest.mark.io
+def test_iter_target_files_by_path_stops_early(tmpdir):
+    """
+    iter_target_files_by_path関数が途中で打ち切っても、
+    get_target_files_by_pathと同じ順序の先頭のファイルを返すことをテストします。
+    """
+    # Arrange
+    tmpdir = Path(tmpdir)
+    write_files(tmpdir, [f"pkg{i}/module.py" for i in range(5)])
+    expected = get_target_files_by_path(tmpdir)[:2]
+
+    # Act
+    result = list(itertools.islice(iter_target_files_by_path(tmpdir), 2))
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.io
+def test_iter_target_files_by_path_invalid(tmpdir):
+    """
+    iter_target_files_by_path関数が反復を始める前にValueErrorを発生させることをテストします。
+    """
+    # Arrange
+    invalid_path = Path(tmpdir) / "invalid_path"
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid path"):
+        iter_target_files_by_path(invalid_path)
 
 
 # Test for get_target_files_by_git_ls_files
-def test_get_target_files_by_git_ls_files(mocker):
+# Names returned by the mocked git ls-files, shared by the git ls-files tests
+_GIT_LS_SAMPLE = (
+    "file1.py",
+    "file2.txt",
+    "src/main.py",
+    ".venv/lib/module.py",
+    "__pycache__/cached.py",
+    "tests/test_main.py",
+)
+_GIT_LS_EXPECTED = tuple(Path(name) for name in _GIT_LS_SAMPLE if name.endswith(".py"))
+
+
+def test_get_target_files_by_git_ls_files(monkeypatch):
     """
     get_target_files_by_git_ls_files関数がGitリポジトリ内のPythonファイルのみを正しく返すことをテストします。
     """
     # Arrange
-    mocker.patch(
-        "pycodemetrics.util.file_util.list_git_files",
-        return_value=[
-            Path("file1.py"),
-            Path("file2.txt"),
-            Path("file3.py"),
-            Path("file4.py"),
-        ],
+    monkeypatch.setattr(
+        file_util, "list_git_file_names", lambda repo_path: list(_GIT_LS_SAMPLE)
     )
 
     # Act
     result = get_target_files_by_git_ls_files(Path("some/repo"))
 
     # Assert
-    assert result == [Path("file1.py"), Path("file3.py"), Path("file4.py")]
+    assert result == list(_GIT_LS_EXPECTED)
 
 
 class TestIsExcluded:
     """Test cases for _is_excluded function."""
 
-    def test_is_excluded_with_exact_match(self):
-        """Test _is_excluded with exact filename match."""
-        filepath = Path("/src/project/.venv/lib/python.py")
-        exclude_patterns = [".venv"]
-        assert _is_excluded(filepath, exclude_patterns) is True
-
-    def test_is_excluded_with_glob_pattern(self):
-        """Test _is_excluded with glob pattern matching."""
-        filepath = Path("/src/project/__pycache__/module.pyc")
-        exclude_patterns = ["__pycache__"]
-        assert _is_excluded(filepath, exclude_patterns) is True
-
-    def test_is_excluded_with_wildcard_pattern(self):
-        """Test _is_excluded with wildcard pattern."""
-        filepath = Path("/src/project/build/output.py")
-        exclude_patterns = ["build"]
-        assert _is_excluded(filepath, exclude_patterns) is True
-
-    def test_is_excluded_with_multiple_patterns(self):
-        """Test _is_excluded with multiple exclude patterns."""
-        filepath = Path("/src/project/node_modules/package.py")
-        exclude_patterns = [".venv", "node_modules", "__pycache__"]
-        assert _is_excluded(filepath, exclude_patterns) is True
-
-    def test_is_excluded_not_matched(self):
-        """Test _is_excluded returns False when no patterns match."""
-        filepath = Path("/src/project/main.py")
-        exclude_patterns = [".venv", "node_modules", "__pycache__"]
-        assert _is_excluded(filepath, exclude_patterns) is False
-
-    def test_is_excluded_empty_patterns(self):
-        """Test _is_excluded with empty exclude patterns."""
-        filepath = Path("/src/project/main.py")
-        exclude_patterns = []
-        assert _is_excluded(filepath, exclude_patterns) is False
-
-    def test_is_excluded_with_nested_path(self):
-        """Test _is_excluded with deeply nested paths."""
-        filepath = Path("/src/project/.venv/lib/python3.10/site-packages/module.py")
-        exclude_patterns = [".venv"]
-        assert _is_excluded(filepath, exclude_patterns) is True
-
-    def test_is_excluded_case_sensitive(self):
-        """Test _is_excluded is case sensitive."""
-        filepath = Path("/src/project/ENV/bin/python.py")
-        exclude_patterns = ["env"]  # lowercase
-        assert _is_excluded(filepath, exclude_patterns) is False
-
-        exclude_patterns = ["ENV"]  # uppercase
-        assert _is_excluded(filepath, exclude_patterns) is True
+    @pytest.mark.parametrize(
+        "filepath, exclude_patterns, expected",
+        [
+            pytest.param(
+                Path("/src/project/.venv/lib/python.py"),
+                [".venv"],
+                True,
+                id="exact_match",
+            ),
+            pytest.param(
+                Path("/src/project/__pycache__/module.pyc"),
+                ["__pycache__"],
+                True,
+                id="glob_pattern",
+            ),
+            pytest.param(
+                Path("/src/project/build/output.py"),
+                ["build"],
+                True,
+                id="wildcard_pattern",
+            ),
+            pytest.param(
+                Path("/src/project/node_modules/package.py"),
+                [".venv", "node_modules", "__pycache__"],
+                True,
+                id="multiple_patterns",
+            ),
+            pytest.param(
+                Path("/src/project/main.py"),
+                [".venv", "node_modules", "__pycache__"],
+                False,
+                id="not_matched",
+            ),
+            pytest.param(
+                Path("/src/project/main.py"),
+                [],
+                False,
+                id="empty_patterns",
+            ),
+            pytest.param(
+                Path("/src/project/.venv/lib/python3.10/site-packages/module.py"),
+                [".venv"],
+                True,
+                id="nested_path",
+            ),
+            pytest.param(
+                Path("/src/project/ENV/bin/python.py"),
+                ["env"],
+                False,
+                id="case_sensitive_lowercase",
+            ),
+            pytest.param(
+                Path("/src/project/ENV/bin/python.py"),
+                ["ENV"],
+                True,
+                id="case_sensitive_uppercase",
+            ),
+        ],
+    )
+    def test_is_excluded(self, filepath, exclude_patterns, expected):
+        """Test _is_excluded against exact, glob, nested and case-sensitive patterns."""
+        assert _is_excluded(filepath, exclude_patterns) is expected
 
 
 class TestGetTargetFilesWithExclusion:
     """Test cases for file targeting functions with exclusion patterns."""
 
-    def test_get_target_files_by_path_with_exclusion(self, tmpdir):
+    @pytest.mark.io
+    @pytest.mark.parametrize(
+        "exclude_patterns, expected_names",
+        [
+            (
+                [".venv", "__pycache__"],
+                ["src_main", "app", "sub_test1", "sub_test2"],
+            ),
+            (["src", "subdir"], ["app"]),
+            (["*.py"], []),
+        ],
+    )
+    def test_get_target_files_by_path_with_exclusion(
+        self, sample_tree, exclude_patterns, expected_names
+    ):
         """Test get_target_files_by_path with exclusion patterns."""
-        # Arrange
-        tmpdir = Path(tmpdir)
-
-        # Create directory structure
-        venv_dir = tmpdir / ".venv" / "lib"
-        venv_dir.mkdir(parents=True)
-        cache_dir = tmpdir / "__pycache__"
-        cache_dir.mkdir()
-        src_dir = tmpdir / "src"
-        src_dir.mkdir()
-
-        # Create files
-        (venv_dir / "excluded.py").touch()
-        (cache_dir / "cached.py").touch()
-        (src_dir / "main.py").touch()
-        (tmpdir / "app.py").touch()
-
         # Act
-        exclude_patterns = [".venv", "__pycache__"]
-        result = get_target_files_by_path(tmpdir, exclude_patterns)
+        result = get_target_files_by_path(sample_tree.root, exclude_patterns)
 
         # Assert
-        expected_files = [src_dir / "main.py", tmpdir / "app.py"]
-        assert sorted(result) == sorted(expected_files)
+        expected_files = [getattr(sample_tree, name) for name in expected_names]
+        _assert_same_files(result, expected_files)
+        _assert_unchanged(sample_tree)
 
-    def test_get_target_files_by_path_no_exclusion(self, tmpdir):
+    @pytest.mark.io
+    def test_get_target_files_by_path_no_exclusion(self, sample_tree):
         """Test get_target_files_by_path without exclusion patterns."""
-        # Arrange
-        tmpdir = Path(tmpdir)
-        subdir = tmpdir / "subdir"
-        subdir.mkdir()
-        (subdir / "test1.py").touch()
-        (subdir / "test2.py").touch()
-
         # Act
-        result = get_target_files_by_path(tmpdir, None)
+        result = get_target_files_by_path(sample_tree.root, None)
 
         # Assert
-        expected_files = [subdir / "test1.py", subdir / "test2.py"]
-        assert sorted(result) == sorted(expected_files)
-
+        # Hidden directories such as .venv and __pycache__ are not walked
+        expected_files = [
+            sample_tree.src_main,
+            sample_tree.app,
+            sample_tree.sub_test1,
+            sample_tree.sub_test2,
+        ]
+        _assert_same_files(result, expected_files)
+        _assert_unchanged(sample_tree)
+
+    @pytest.mark.io
     def test_get_target_files_by_path_exclude_single_file(self, tmpdir):
         """Test get_target_files_by_path excludes single file when matched."""
         # Arrange
         tmpdir = Path(tmpdir)
-        venv_file = tmpdir / ".venv" / "script.py"
-        venv_file.parent.mkdir()
-        venv_file.touch()
+        (venv_file,) = write_files(tmpdir, [".venv/script.py"])
 
         # Act
         exclude_patterns = [".venv"]
@@ -201,17 +403,11 @@ class TestGetTargetFilesWithExclusion:
         # Assert
         assert result == []
 
-    def test_get_target_files_by_git_ls_files_with_exclusion(self, mocker):
+    def test_get_target_files_by_git_ls_files_with_exclusion(self, monkeypatch):
         """Test get_target_files_by_git_ls_files with exclusion patterns."""
         # Arrange
-        mocker.patch(
-            "pycodemetrics.util.file_util.list_git_files",
-            return_value=[
-                Path("src/main.py"),
-                Path(".venv/lib/module.py"),
-                Path("__pycache__/cached.py"),
-                Path("tests/test_main.py"),
-            ],
+        monkeypatch.setattr(
+            file_util, "list_git_file_names", lambda repo_path: list(_GIT_LS_SAMPLE)
         )
 
         # Act
@@ -219,5 +415,194 @@ class TestGetTargetFilesWithExclusion:
         result = get_target_files_by_git_ls_files(Path("repo"), exclude_patterns)
 
         # Assert
-        expected_files = [Path("src/main.py"), Path("tests/test_main.py")]
-        assert sorted(result) == sorted(expected_files)
+        expected_files = [
+            Path("file1.py"),
+            Path("src/main.py"),
+            Path("tests/test_main.py"),
+        ]
+        assert result == expected_files
+
+
+@pytest.mark.parametrize(
+    "file_str",
+    [
+        "tests/test_a.py",
+        "tests/sub/test_b.py",
+        "src/tests/test_c.py",
+        "src/tests/sub/test_d.py",
+        "/abs/tests/test_e.py",
+        "tests/README",
+        "src/tests/Makefile",
+        "tests.py",
+        "src/mytests/test_f.py",
+        "src/tests_util/g.py",
+        "src/module/h.py",
+        "a.tests/tests/i",
+    ],
+)
+def test_is_tests_file_equivalent_to_default_patterns(file_str):
+    # Arrange
+    expected = any(
+        fnmatch.fnmatch(file_str, pattern) for pattern in TESTCODE_PATTERN_DEFAULT
+    )
+
+    # Act
+    result = _is_tests_file(file_str)
+
+    # Assert
+    assert result is expected
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["src/*"],
+        ["*/tests/*.*", "*/tests/*/*.*", "tests/*.*"],
+        ["*/[ab]pi/*.py", "docs/?.py"],
+        ["*.py|*.txt"],
+        [f"*/module{i}/*.py" for i in range(50)] + ["*api*", "docs/*"],
+    ],
+)
+@pytest.mark.parametrize(
+    "file_str",
+    ["src/app.py", "src/api/v1.py", "lib/bpi/x.py", "docs/a.py", "docs/ab.py", "a.txt"],
+)
+def test_is_match_equivalent_to_fnmatch(patterns, file_str):
+    # Arrange
+    expected = any(fnmatch.fnmatch(file_str, pattern) for pattern in patterns)
+
+    # Act
+    result = _is_match(Path(file_str), patterns)
+
+    # Assert
+    assert result is expected
+
+
+@pytest.mark.parametrize(
+    "exclude_patterns",
+    [
+        [".venv", "__pycache__"],
+        ["*/build/*", "docs"],
+        ["src/*.py"],
+        ["*test*.py", "[ab].py"],
+    ],
+)
+@pytest.mark.parametrize(
+    "file_str",
+    [
+        "src/app.py",
+        "src/.venv/x.py",
+        "out/build/y.py",
+        "docs/a.py",
+        "b.py",
+        "t_test.py",
+    ],
+)
+def test_is_excluded_equivalent_to_fnmatch(exclude_patterns, file_str):
+    # Arrange
+    expected = any(
+        fnmatch.fnmatch(file_str, pattern) or pattern in file_str.split("/")
+        for pattern in exclude_patterns
+    )
+
+    # Act
+    result = _is_excluded(Path(file_str), exclude_patterns)
+
+    # Assert
+    assert result is expected
+
+
+@pytest.mark.parametrize("exclude_patterns", [[".venv"], ["*.venv*"], ["src\\*"]])
+@pytest.mark.parametrize("file_str", ["src\\.venv\\x.py", "src\\app.py"])
+def test_is_excluded_with_backslash_path_same_as_str_fnmatch(
+    exclude_patterns, file_str
+):
+    # Arrange: 以前はstr(filepath)に対してもfnmatchを行っていた
+    filepath = Path(file_str)
+    expected = any(
+        fnmatch.fnmatch(filepath.as_posix(), pattern)
+        or fnmatch.fnmatch(str(filepath), pattern)
+        or pattern in filepath.as_posix().split("/")
+        for pattern in exclude_patterns
+    )
+
+    # Act
+    result = _is_excluded(filepath, exclude_patterns)
+
+    # Assert
+    assert result is expected
+
+
+@pytest.mark.parametrize(
+    "file_str",
+    ["src/app.py", "src/api/v1.py", "lib/bpi/x.py", "docs/a.py", "tests/b.py"],
+)
+def test_get_group_name_matches_first_group_in_order(file_str):
+    # Arrange
+    user_groups = [
+        UserGroupConfig(name="empty", patterns=[]),
+        UserGroupConfig(name="api", patterns=["*/[ab]pi/*.py"]),
+        UserGroupConfig(name="src", patterns=["src/*", "lib/*"]),
+        UserGroupConfig(name="docs", patterns=["docs/?.py"]),
+    ]
+    expected = next(
+        (
+            group.name
+            for group in user_groups
+            if any(fnmatch.fnmatch(file_str, pattern) for pattern in group.patterns)
+        ),
+        "undefined",
+    )
+
+    # Act
+    result = get_group_name(Path(file_str), user_groups)
+
+    # Assert
+    assert result == expected
+
+
+def test_get_group_name_follows_reassigned_patterns():
+    # Arrange
+    group = UserGroupConfig(name="api", patterns=["api/*"])
+    before = get_group_name(Path("lib/a.py"), [group])
+
+    # Act
+    group.patterns = ["lib/*"]
+    result = get_group_name(Path("lib/a.py"), [group])
+
+    # Assert
+    assert before == "undefined"
+    assert result == "api"
+
+
+def test_get_code_type_compiles_custom_patterns_once():
+    # Arrange
+    clear_caches()
+    patterns = ["spec/*"]
+
+    # Act
+    first = get_code_type(Path("spec/a.py"), patterns)
+    second = get_code_type(Path("spec/a.py"), patterns)
+    other = get_code_type(Path("src/a.py"), patterns)
+
+    # Assert: パターンはファイルごとではなく一度だけコンパイルされる
+    assert first == second == CodeType.TEST
+    assert other == CodeType.PRODUCT
+    assert file_util._compile_patterns.cache_info().misses == 1
+
+
+def test_get_code_type_batch_with_default_patterns():
+    # Arrange
+    cases = [
+        ("src/main.py", CodeType.PRODUCT),
+        ("tests/test_main.py", CodeType.TEST),
+        ("src/tests/test_util.py", CodeType.TEST),
+        ("src/tests/sub/test_deep.py", CodeType.TEST),
+        ("src/mytests/helper.py", CodeType.PRODUCT),
+    ]
+
+    # Act
+    result = [get_code_type(Path(path), TESTCODE_PATTERN_DEFAULT) for path, _ in cases]
+
+    # Assert
+    assert result == [expected for _, expected in cases]
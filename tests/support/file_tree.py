@@ -0,0 +1,42 @@
+"""Helpers shared by the tests that build small directory trees on disk."""
+
+import os
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+
+def _touch_fast(path: Path) -> None:
+    """Create an empty file with one open and close, skipping the utime of Path.touch."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o600)
+    os.close(fd)
+
+
+def write_files(root: Path, files: Mapping[str, str] | Iterable[str]) -> list[Path]:
+    """
+    Create files under root, making each parent directory only once.
+
+    Args:
+        root (Path): The directory to create the files in.
+        files (Mapping[str, str] | Iterable[str]): Relative paths mapped to their
+            contents, or just relative paths to create empty files.
+
+    Returns:
+        list[Path]: The created files, in the order they were given.
+
+    Raises:
+        ValueError: If a path is absolute.
+    """
+    contents = files if isinstance(files, Mapping) else dict.fromkeys(files, "")
+    for relative in contents:
+        if Path(relative).is_absolute():
+            raise ValueError(f"Expected a path relative to {root}: {relative}")
+
+    paths = [root / relative for relative in contents]
+    for parent in dict.fromkeys(path.parent for path in paths):
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, content in zip(paths, contents.values()):
+        if content:
+            path.write_text(content)
+        else:
+            _touch_fast(path)
+    return paths